@@ -0,0 +1,210 @@
+"""
+LDCT Denoising - Result Cache Module
+Aynı DICOM kesiti için inference sonuçlarını saklayan içerik adresli önbellek.
+
+Anahtar, kesitin ham piksel verisinin (ve rescale/boyut bilgisinin) hash'i ile
+model ağırlık dosyasının parmak izinden oluşur; dosya adı veya konumu önemli
+değildir. İki katman vardır: son kullanılan kayıtlar bellekte, tümü diskte
+(.npz) tutulur. Disk katmanı boyut sınırını aşınca en eski erişilen kayıtlar
+silinir (LRU). Ağırlık dosyası değişince eski kayıtlar otomatik temizlenir.
+"""
+
+import hashlib
+import os
+import threading
+from collections import OrderedDict
+
+import numpy as np
+
+try:
+    import pydicom
+except ImportError:
+    pydicom = None
+
+
+# Önbellek sabitleri
+DEFAULT_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "ldct_denoising")
+DEFAULT_MAX_DISK_MB = 512
+DEFAULT_MEMORY_ITEMS = 32
+FINGERPRINT_FILE = "weights.fingerprint"
+ENTRY_EXT = ".npz"
+HASH_CHUNK = 1 << 20
+
+
+def weights_fingerprint(weights_path: str) -> str:
+    """Ağırlık dosyasının içeriğinden SHA-256 parmak izi üretir"""
+    digest = hashlib.sha256()
+    with open(weights_path, 'rb') as f:
+        for chunk in iter(lambda: f.read(HASH_CHUNK), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def pixel_key(file_path: str) -> str:
+    """
+    DICOM kesitinin piksel içeriğine göre anahtar üretir.
+
+    Piksel verisi çözülmeden ham bayt olarak hash'lenir; HU dönüşümünü
+    etkileyen rescale katsayıları ve boyutlar da anahtara dahildir.
+    """
+    if pydicom is None:
+        raise ImportError("pydicom kütüphanesi yüklü değil. 'pip install pydicom' komutunu çalıştırın.")
+
+    ds = pydicom.dcmread(file_path)
+    digest = hashlib.sha256()
+    header = (ds.get('Rows'), ds.get('Columns'), ds.get('BitsAllocated'),
+              ds.get('PixelRepresentation'), ds.get('RescaleSlope', 1),
+              ds.get('RescaleIntercept', 0), str(ds.file_meta.get('TransferSyntaxUID', '')))
+    digest.update(repr(header).encode())
+    digest.update(ds.PixelData)
+    return digest.hexdigest()
+
+
+class ResultCache:
+    """
+    Kesit başına (low dose görüntü, denoise edilmiş görüntü) çiftlerini saklar.
+
+    Birden çok thread'den güvenle kullanılabilir.
+    """
+
+    def __init__(self, weights_path: str, cache_dir: str = DEFAULT_CACHE_DIR,
+                 max_disk_mb: float = DEFAULT_MAX_DISK_MB,
+                 memory_items: int = DEFAULT_MEMORY_ITEMS):
+        """
+        Args:
+            weights_path: Sonuçları üreten model ağırlık dosyası
+            cache_dir: Disk katmanının klasörü
+            max_disk_mb: Disk katmanının boyut sınırı (MB)
+            memory_items: Bellekte tutulan kayıt sayısı
+        """
+        self.cache_dir = cache_dir
+        self.max_disk_bytes = int(max_disk_mb * 1024 * 1024)
+        self.memory_items = memory_items
+        self.fingerprint = weights_fingerprint(weights_path)
+        self.hits = 0
+        self.misses = 0
+        self._memory = OrderedDict()
+        self._lock = threading.Lock()
+
+        os.makedirs(cache_dir, exist_ok=True)
+        self._check_fingerprint()
+
+    def _check_fingerprint(self):
+        """Ağırlıklar değiştiyse disk katmanını temizler"""
+        fingerprint_path = os.path.join(self.cache_dir, FINGERPRINT_FILE)
+        stored = None
+        if os.path.exists(fingerprint_path):
+            with open(fingerprint_path) as f:
+                stored = f.read().strip()
+        if stored != self.fingerprint:
+            self.clear()
+            with open(fingerprint_path, 'w') as f:
+                f.write(self.fingerprint)
+
+    def _entry_path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, key + ENTRY_EXT)
+
+    def _entries(self) -> list:
+        """Disk kayıtlarını (erişim zamanı, boyut, yol) olarak döndürür"""
+        entries = []
+        for name in os.listdir(self.cache_dir):
+            if not name.endswith(ENTRY_EXT):
+                continue
+            path = os.path.join(self.cache_dir, name)
+            try:
+                stat = os.stat(path)
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+        return entries
+
+    def _remember(self, key: str, value: tuple):
+        """Kaydı bellek katmanına ekler (kilit altında çağrılır)"""
+        self._memory[key] = value
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.memory_items:
+            self._memory.popitem(last=False)
+
+    def get(self, key: str):
+        """
+        Kaydı döndürür.
+
+        Returns:
+            tuple: (low_dose, enhanced) veya bulunamazsa None
+        """
+        with self._lock:
+            if key in self._memory:
+                self._memory.move_to_end(key)
+                self.hits += 1
+                return self._memory[key]
+
+        path = self._entry_path(key)
+        try:
+            with np.load(path) as data:
+                value = (data['low_dose'], data['enhanced'])
+            os.utime(path)  # LRU sırası için erişim zamanı
+        except (FileNotFoundError, OSError, KeyError, ValueError):
+            with self._lock:
+                self.misses += 1
+            return None
+
+        with self._lock:
+            self._remember(key, value)
+            self.hits += 1
+        return value
+
+    def put(self, key: str, low_dose: np.ndarray, enhanced: np.ndarray) -> bool:
+        """
+        Kaydı her iki katmana yazar ve gerekirse disk katmanını budar.
+
+        Disk hataları (dolu disk, izin) yutulur: kayıt bellek katmanında
+        kalır, yarım yazılmış geçici dosya silinir.
+
+        Returns:
+            bool: Kayıt diske yazıldı mı
+        """
+        value = (np.asarray(low_dose), np.asarray(enhanced))
+        with self._lock:
+            self._remember(key, value)
+
+        path = self._entry_path(key)
+        tmp_path = f"{path}.{threading.get_ident()}.tmp"
+        try:
+            with open(tmp_path, 'wb') as f:
+                np.savez(f, low_dose=value[0], enhanced=value[1])
+            os.replace(tmp_path, path)
+        except OSError as e:
+            print(f"Önbellek diske yazılamadı: {e}")
+            return False
+        finally:
+            try:
+                os.remove(tmp_path)
+            except FileNotFoundError:
+                pass
+        self._evict()
+        return True
+
+    def _evict(self):
+        """Disk katmanı sınırı aşıldıysa en eski erişilen kayıtları siler"""
+        entries = sorted(self._entries())
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in entries:
+            if total <= self.max_disk_bytes:
+                break
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+            except OSError:
+                continue  # Silinemeyen kayıt yer kaplamaya devam eder
+            total -= size
+
+    def clear(self):
+        """Tüm kayıtları siler"""
+        with self._lock:
+            self._memory.clear()
+        for _, _, path in self._entries():
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
@@ -0,0 +1,246 @@
+"""
+LDCT Denoising - DICOM Catalog Module
+DICOM header'larından kalıcı bir SQLite indeksi oluşturur.
+
+Katalog yalnızca header'lar okunarak (stop_before_pixels) doldurulur ve her
+dosya için hasta, seri, doz seviyesi, z konumu ve rescale katsayılarını saklar.
+Sonraki taramalarda yalnızca mtime/boyutu değişen dosyalar yeniden okunur.
+Low/full dose kesitleri liste sırasına göre değil z konumuna göre eşleştirilir;
+bir hasta ve doz için birden fazla seri varsa eşleştirilecek seriler
+SeriesInstanceUID ile seçilir.
+"""
+
+import os
+import sqlite3
+
+import numpy as np
+
+from preprocessing import slice_position, load_dicom_volume
+
+try:
+    import pydicom
+except ImportError:
+    pydicom = None
+
+
+# Doz klasörü anahtar kelimeleri (notebook'lardaki find_dose_folders ile aynı)
+LOW_DOSE_KEYS = ("low dose",)
+FULL_DOSE_KEYS = ("full dose", "high dose")
+SKIP_KEYS = ("proj", "sino")  # Projeksiyon/sinogram klasörleri atlanır
+
+# İşlem başına yazılan kayıt sayısı
+COMMIT_EVERY = 500
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS files (
+    path TEXT PRIMARY KEY,
+    mtime REAL NOT NULL,
+    size INTEGER NOT NULL,
+    patient TEXT,
+    series_uid TEXT,
+    dose TEXT,
+    z REAL,
+    slope REAL,
+    intercept REAL
+);
+CREATE INDEX IF NOT EXISTS idx_files_series ON files (patient, dose, z);
+"""
+
+
+def dose_level(path: str, header=None) -> str:
+    """
+    Dosyanın doz seviyesini klasör adlarından (yoksa SeriesDescription'dan) bulur.
+
+    Returns:
+        str: 'low', 'full' veya None
+    """
+    # En yakın klasörden köke doğru, en son SeriesDescription
+    candidates = [part.lower() for part in reversed(os.path.dirname(path).split(os.sep))]
+    if header is not None and 'SeriesDescription' in header:
+        candidates.append(str(header.SeriesDescription).lower())
+
+    for name in candidates:
+        if any(key in name for key in LOW_DOSE_KEYS):
+            return 'low'
+        if any(key in name for key in FULL_DOSE_KEYS):
+            return 'full'
+    return None
+
+
+class DicomCatalog:
+    """DICOM dosyalarının header bilgilerini tutan kalıcı SQLite katalog"""
+
+    def __init__(self, db_path: str):
+        self.db_path = db_path
+        self.conn = sqlite3.connect(db_path)
+        self.conn.executescript(_SCHEMA)
+
+    def close(self):
+        self.conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def scan(self, root: str) -> dict:
+        """
+        Klasör ağacını tarar ve katalogu günceller.
+
+        Yalnızca yeni veya mtime/boyutu değişmiş dosyaların header'ları okunur;
+        artık bulunmayan dosyalar katalogdan silinir.
+
+        Args:
+            root: Hasta klasörlerini içeren kök klasör
+
+        Returns:
+            dict: {'seen', 'updated', 'removed', 'failed'} sayaçları
+        """
+        if pydicom is None:
+            raise ImportError("pydicom kütüphanesi yüklü değil. 'pip install pydicom' komutunu çalıştırın.")
+
+        root = os.path.abspath(root)
+        # LIKE kullanılmaz: kökteki '_' ve '%' joker karakter olarak eşleşirdi
+        prefix = root + os.sep
+        known = {path: (mtime, size) for path, mtime, size in self.conn.execute(
+            "SELECT path, mtime, size FROM files WHERE substr(path, 1, ?) = ?",
+            (len(prefix), prefix))}
+
+        seen = set()
+        updated = failed = 0
+        for dirpath, dirs, files in os.walk(root):
+            dirs[:] = sorted(d for d in dirs if not any(k in d.lower() for k in SKIP_KEYS))
+            for name in files:
+                if not name.lower().endswith('.dcm'):
+                    continue
+                path = os.path.join(dirpath, name)
+                try:
+                    stat = os.stat(path)
+                except OSError:
+                    # os.walk'tan sonra silinmiş veya erişilemeyen dosya
+                    failed += 1
+                    continue
+                seen.add(path)
+                if known.get(path) == (stat.st_mtime, stat.st_size):
+                    continue
+
+                try:
+                    header = pydicom.dcmread(path, stop_before_pixels=True)
+                except Exception:
+                    failed += 1
+                    continue
+                self.conn.execute(
+                    "INSERT OR REPLACE INTO files VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                    (path, stat.st_mtime, stat.st_size,
+                     str(header.get('PatientID', '')) or os.path.relpath(path, root).split(os.sep)[0],
+                     str(header.get('SeriesInstanceUID', '')) or None,
+                     dose_level(path, header),
+                     slice_position(header),
+                     float(header.get('RescaleSlope', 1)),
+                     float(header.get('RescaleIntercept', 0))))
+                updated += 1
+                if updated % COMMIT_EVERY == 0:
+                    self.conn.commit()
+
+        removed = [(path,) for path in known if path not in seen]
+        self.conn.executemany("DELETE FROM files WHERE path = ?", removed)
+        self.conn.commit()
+        return {'seen': len(seen), 'updated': updated, 'removed': len(removed), 'failed': failed}
+
+    def patients(self) -> list:
+        """Hem low hem full dose kesiti olan hastaları döndürür"""
+        rows = self.conn.execute(
+            "SELECT patient FROM files WHERE dose IS NOT NULL GROUP BY patient "
+            "HAVING COUNT(DISTINCT dose) = 2 ORDER BY patient")
+        return [row[0] for row in rows]
+
+    def series_uids(self, patient: str, dose: str) -> list:
+        """Bir hastanın verilen doz seviyesindeki SeriesInstanceUID'leri (yoksa None)"""
+        rows = self.conn.execute(
+            "SELECT DISTINCT series_uid FROM files WHERE patient = ? AND dose = ? "
+            "AND z IS NOT NULL ORDER BY series_uid", (patient, dose))
+        return [row[0] for row in rows]
+
+    def series(self, patient: str, dose: str, series_uid: str = None) -> list:
+        """
+        Bir hastanın verilen doz seviyesindeki tek bir serinin kesitlerini z
+        sırasıyla döndürür.
+
+        Aynı hasta ve doz için birden fazla seri (ör. farklı kernel veya kesit
+        kalınlığı) olabilir; farklı serilerin kesitleri karıştırılmaz.
+
+        Args:
+            patient: Hasta kimliği
+            dose: 'low' veya 'full'
+            series_uid: Seçilecek SeriesInstanceUID; None ise hasta ve doz için
+                        tek bir seri olmalıdır
+
+        Returns:
+            list: (z, dosya_yolu) listesi
+
+        Raises:
+            ValueError: series_uid verilmemişken birden fazla seri varsa
+        """
+        if series_uid is None:
+            uids = self.series_uids(patient, dose)
+            if len(uids) > 1:
+                raise ValueError(f"{patient} hastasının {dose} dose kesitleri {len(uids)} seriye "
+                                 f"ait; series_uid ile birini seçin: {uids}")
+            series_uid = uids[0] if uids else None
+        rows = self.conn.execute(
+            "SELECT z, path FROM files WHERE patient = ? AND dose = ? AND series_uid IS ? "
+            "AND z IS NOT NULL ORDER BY z", (patient, dose, series_uid))
+        return list(rows)
+
+    def pair_slices(self, patient: str, tolerance: float = None,
+                    low_series: str = None, full_series: str = None) -> list:
+        """
+        Low ve full dose kesitlerini z konumuna göre eşleştirir.
+
+        Her low dose kesiti en yakın z'deki full dose kesitiyle eşleşir;
+        aradaki fark toleransı aşarsa kesit atlanır.
+
+        Args:
+            patient: Hasta kimliği
+            tolerance: İzin verilen maksimum z farkı (mm); None ise full dose
+                       serisinin kesit aralığının yarısı
+            low_series: Low dose SeriesInstanceUID'i (doz başına tek seri varsa None)
+            full_series: Full dose SeriesInstanceUID'i (doz başına tek seri varsa None)
+
+        Returns:
+            list: (z, low_dose_yolu, full_dose_yolu) listesi
+        """
+        low = self.series(patient, 'low', low_series)
+        full = self.series(patient, 'full', full_series)
+        if not low or not full:
+            return []
+
+        full_z = np.array([z for z, _ in full])
+        if tolerance is None:
+            spacing = np.median(np.diff(full_z)) if len(full_z) > 1 else 0.0
+            tolerance = max(spacing / 2, 1e-3)
+
+        pairs = []
+        for z, low_path in low:
+            i = int(np.searchsorted(full_z, z))
+            nearest = min((j for j in (i - 1, i) if 0 <= j < len(full_z)),
+                          key=lambda j: abs(full_z[j] - z))
+            if abs(full_z[nearest] - z) <= tolerance:
+                pairs.append((z, low_path, full[nearest][1]))
+        return pairs
+
+    def load_pair_volumes(self, patient: str, tolerance: float = None,
+                          low_series: str = None, full_series: str = None) -> tuple:
+        """
+        Bir hastanın eşleştirilmiş low/full dose hacimlerini yükler.
+
+        Seri seçimi pair_slices ile aynıdır.
+
+        Returns:
+            tuple: ((Z, 256, 256) low dose, (Z, 256, 256) full dose, z konumları)
+        """
+        pairs = self.pair_slices(patient, tolerance, low_series, full_series)
+        low_volume, _ = load_dicom_volume([low for _, low, _ in pairs], presorted=True)
+        full_volume, _ = load_dicom_volume([full for _, _, full in pairs], presorted=True)
+        return low_volume, full_volume, [z for z, _, _ in pairs]
@@ -0,0 +1,314 @@
+"""
+LDCT Denoising - Checkpoint Module
+Eğitim checkpoint'lerini ve epoch önizlemelerini arka planda yazar.
+
+Eğitim thread'i yalnızca ağırlıkların bellekte kopyasını (snapshot) alır ve
+önizleme için generator çıktısını hesaplar; dosya yazma ve matplotlib çizimi
+tek bir arka plan thread'inde sırayla yapılır. Böylece epoch süresine disk
+(veya Drive) gecikmesi eklenmez. Her snapshot G, D ve optimizer durumlarının
+tam kopyası olduğundan yazılmayı bekleyen snapshot sayısı ayrıca sınırlıdır
+(DEFAULT_MAX_PENDING_SNAPSHOTS): yazıcı geride kalırsa eğitim thread'i yeni
+snapshot almadan önce bekler. Önizleme gibi küçük işler için kuyruk
+DEFAULT_QUEUE_SIZE ile sınırlıdır.
+
+Checkpoint klasörü:
+    G_epoch_{N}.weights.h5   Son keep_last generator ağırlığı (eskiler silinir)
+    G_best.weights.h5        En yüksek doğrulama PSNR'lı generator
+    training_state.npz       Devam etmek için son tam durum: G, D ve her iki
+                             optimizer'ın değişkenleri
+    checkpoints.json         Yukarıdakilerin epoch/PSNR listesi
+
+Tüm dosyalar önce geçici adla yazılıp os.replace ile yerine konur; yazma
+sırasında kesilen bir çalışma eski dosyayı bozmaz.
+"""
+
+import json
+import os
+import queue
+import threading
+import time
+
+import numpy as np
+
+try:
+    from tensorflow import keras
+except ImportError:
+    keras = None
+
+
+# Checkpoint sabitleri
+DEFAULT_KEEP_LAST = 3
+DEFAULT_QUEUE_SIZE = 8
+DEFAULT_MAX_PENDING_SNAPSHOTS = 1  # Yazılmayı bekleyen tam durum kopyası sayısı
+WEIGHTS_PATTERN = "G_epoch_{epoch}.weights.h5"
+BEST_WEIGHTS_NAME = "G_best.weights.h5"
+STATE_NAME = "training_state.npz"
+MANIFEST_NAME = "checkpoints.json"
+# Durum dosyasındaki değişken grupları (WGAN_GP_Pix2Pix öznitelikleri)
+STATE_GROUPS = ('generator', 'discriminator', 'd_optimizer', 'g_optimizer')
+
+
+def _group_variables(gan, group: str) -> list:
+    owner = getattr(gan, group)
+    return list(owner.weights if group in ('generator', 'discriminator') else owner.variables)
+
+
+def snapshot_training_state(gan) -> dict:
+    """
+    G, D ve optimizer değişkenlerinin bellekte kopyasını alır.
+
+    Returns:
+        dict: '{grup}/{sıra}' -> np.ndarray
+    """
+    state = {}
+    for group in STATE_GROUPS:
+        for i, variable in enumerate(_group_variables(gan, group)):
+            state[f"{group}/{i}"] = np.array(variable.numpy(), copy=True)
+    return state
+
+
+def restore_training_state(gan, path: str) -> int:
+    """
+    save_training_state ile yazılmış durumu modele yükler.
+
+    Optimizer'lar önceden oluşturulmuş olmalıdır (WGAN_GP_Pix2Pix.compile).
+
+    Returns:
+        int: Durumun kaydedildiği (tamamlanmış) epoch sayısı
+    """
+    with np.load(path) as data:
+        for group in STATE_GROUPS:
+            variables = _group_variables(gan, group)
+            stored = sum(1 for key in data.files if key.startswith(group + "/"))
+            if stored != len(variables):
+                raise ValueError(f"{group}: {stored} değişken kayıtlı, modelde {len(variables)} var")
+            for i, variable in enumerate(variables):
+                variable.assign(data[f"{group}/{i}"])
+        return int(data['epoch'])
+
+
+def _atomic_path(path: str) -> str:
+    """Geçici dosya adı (Keras için '.weights.h5' uzantısı korunur)"""
+    head, tail = os.path.split(path)
+    return os.path.join(head, ".tmp-" + tail)
+
+
+def save_training_state(state: dict, epoch: int, path: str):
+    """Snapshot'ı sıkıştırmadan .npz olarak atomik yazar"""
+    tmp_path = _atomic_path(path)
+    with open(tmp_path, 'wb') as f:
+        np.savez(f, epoch=np.int64(epoch), **state)
+    os.replace(tmp_path, path)
+
+
+def latest_training_state(checkpoint_dir: str):
+    """
+    Klasördeki devam durumunu bulur.
+
+    Returns:
+        tuple | None: (dosya yolu, epoch) veya durum yoksa None
+    """
+    manifest = read_manifest(checkpoint_dir)
+    if manifest.get('state') is None:
+        return None
+    path = os.path.join(checkpoint_dir, manifest['state']['file'])
+    return (path, manifest['state']['epoch']) if os.path.exists(path) else None
+
+
+def read_manifest(checkpoint_dir: str) -> dict:
+    path = os.path.join(checkpoint_dir, MANIFEST_NAME)
+    if not os.path.exists(path):
+        return {'checkpoints': [], 'best': None, 'state': None}
+    with open(path, 'r') as f:
+        return json.load(f)
+
+
+def render_preview(path: str, images: list, titles: list):
+    """
+    Görüntüleri yan yana çizip PNG olarak kaydeder.
+
+    pyplot yerine doğrudan Figure/Agg kullanılır; pyplot'un global durumu
+    thread'ler arasında paylaşıldığı için arka plan thread'inde güvenli değildir.
+    """
+    try:
+        from matplotlib.backends.backend_agg import FigureCanvasAgg
+        from matplotlib.figure import Figure
+    except ImportError:
+        raise ImportError("matplotlib kütüphanesi yüklü değil. 'pip install matplotlib' komutunu çalıştırın.")
+
+    figure = Figure(figsize=(4 * len(images), 4))
+    FigureCanvasAgg(figure)
+    for j, (image, title) in enumerate(zip(images, titles)):
+        axis = figure.add_subplot(1, len(images), j + 1)
+        axis.set_title(title)
+
+        # Min-max ile 0-1 aralığına çekilir (veri bozuk olsa bile gri görünür)
+        img_data = np.asarray(image)[:, :, 0]
+        _min, _max = np.min(img_data), np.max(img_data)
+        show_img = (img_data - _min) / (_max - _min) if _max - _min > 0 else img_data
+
+        axis.imshow(show_img, cmap='gray')
+        axis.axis('off')
+
+    tmp_path = _atomic_path(path)
+    figure.savefig(tmp_path, format='png')
+    os.replace(tmp_path, path)
+
+
+class BackgroundWriter:
+    """
+    İşleri sırayla çalıştıran tek thread'li, sınırlı kuyruk.
+
+    submit() kuyruk doluysa bekler; hatalar thread'i durdurmaz, yazdırılır
+    ve errors listesinde tutulur.
+    """
+
+    def __init__(self, max_queued: int = DEFAULT_QUEUE_SIZE):
+        self.errors = []
+        self._queue = queue.Queue(maxsize=max_queued)
+        self._thread = threading.Thread(target=self._loop, name="checkpoint-writer", daemon=True)
+        self._thread.start()
+
+    def submit(self, fn, *args):
+        """fn(*args) çağrısını kuyruğa ekler; kuyrukta bekleme süresini (s) döndürür"""
+        start = time.perf_counter()
+        self._queue.put((fn, args))
+        return time.perf_counter() - start
+
+    def flush(self):
+        """Kuyruktaki tüm işler bitene kadar bekler"""
+        self._queue.join()
+
+    def close(self):
+        """Kalan işleri bitirip thread'i kapatır"""
+        self._queue.put(None)
+        self._thread.join()
+
+    def _loop(self):
+        while True:
+            job = self._queue.get()
+            try:
+                if job is None:
+                    return
+                fn, args = job
+                fn(*args)
+            except Exception as e:
+                self.errors.append(e)
+                print(f"Kayıt hatası: {e}")
+            finally:
+                self._queue.task_done()
+
+
+class CheckpointManager:
+    """
+    Generator checkpoint'lerini, en iyi PSNR modelini ve devam durumunu yönetir.
+
+    save() eğitim thread'inde yalnızca snapshot alır; yazma, eski dosyaların
+    silinmesi ve checkpoints.json güncellemesi BackgroundWriter'da sırayla
+    yapılır.
+    """
+
+    def __init__(self, gan, checkpoint_dir: str, keep_last: int = DEFAULT_KEEP_LAST,
+                 writer: BackgroundWriter = None,
+                 max_pending: int = DEFAULT_MAX_PENDING_SNAPSHOTS):
+        """
+        Args:
+            gan: WGAN_GP_Pix2Pix modeli
+            checkpoint_dir: Dosyaların yazılacağı klasör
+            keep_last: Saklanacak son generator checkpoint sayısı (en az 1)
+            writer: Paylaşılan arka plan yazıcısı (None ise yenisi oluşturulur)
+            max_pending: Bellekte yazılmayı bekleyebilecek en fazla snapshot sayısı
+        """
+        if keras is None:
+            raise ImportError("TensorFlow yüklü değil. 'pip install tensorflow' komutunu çalıştırın.")
+        if keep_last < 1:
+            raise ValueError(f"keep_last en az 1 olmalı: {keep_last}")
+        if max_pending < 1:
+            raise ValueError(f"max_pending en az 1 olmalı: {max_pending}")
+        self.gan = gan
+        self.checkpoint_dir = checkpoint_dir
+        self.keep_last = keep_last
+        self.writer = writer or BackgroundWriter()
+        self._pending = threading.BoundedSemaphore(max_pending)
+        os.makedirs(checkpoint_dir, exist_ok=True)
+
+        # Devam eden bir çalışmada önceki kayıtlar korunur
+        self.manifest = read_manifest(checkpoint_dir)
+        best = self.manifest.get('best')
+        self.best_psnr = best['val_psnr'] if best else -np.inf
+
+        # Ağırlıkların Keras biçiminde yazılması için eğitimden bağımsız kopya
+        self._shadow = keras.models.clone_model(gan.generator)
+
+    def save(self, epoch: int, val_psnr: float = None, checkpoint: bool = True) -> bool:
+        """
+        Epoch sonu kaydı: checkpoint=True ise generator ağırlıkları ve devam
+        durumu, val_psnr en iyiyse G_best yazılır.
+
+        Args:
+            epoch: Tamamlanan epoch sayısı (1'den başlar)
+            val_psnr: Doğrulama PSNR'ı (None ise en iyi model takip edilmez)
+            checkpoint: Periyodik checkpoint zamanı mı
+
+        Returns:
+            bool: Yeni en iyi model mi
+        """
+        is_best = val_psnr is not None and val_psnr > self.best_psnr
+        if not (checkpoint or is_best):
+            return False
+
+        # Önceki snapshot'lar yazılana kadar yenisi alınmaz; yer, bu kaydın
+        # işlerinden sonra sıraya giren release ile açılır
+        self._pending.acquire()
+        if checkpoint:
+            state = snapshot_training_state(self.gan)
+            g_weights = [state[f"generator/{i}"] for i in range(len(self.gan.generator.weights))]
+            self.writer.submit(self._write_checkpoint, epoch, val_psnr, g_weights, state)
+        else:
+            g_weights = [np.array(w, copy=True) for w in self.gan.generator.get_weights()]
+
+        if is_best:
+            self.best_psnr = val_psnr
+            self.writer.submit(self._write_best, epoch, val_psnr, g_weights)
+        self.writer.submit(self._pending.release)
+        return is_best
+
+    def _write_weights(self, weights: list, path: str):
+        self._shadow.set_weights(weights)
+        tmp_path = _atomic_path(path)
+        self._shadow.save_weights(tmp_path)
+        os.replace(tmp_path, path)
+
+    def _write_checkpoint(self, epoch: int, val_psnr, g_weights: list, state: dict):
+        name = WEIGHTS_PATTERN.format(epoch=epoch)
+        self._write_weights(g_weights, os.path.join(self.checkpoint_dir, name))
+        save_training_state(state, epoch, os.path.join(self.checkpoint_dir, STATE_NAME))
+
+        checkpoints = [c for c in self.manifest['checkpoints'] if c['epoch'] != epoch]
+        checkpoints.append({'epoch': epoch, 'file': name, 'val_psnr': val_psnr})
+        checkpoints.sort(key=lambda c: c['epoch'])
+        for old in checkpoints[:-self.keep_last]:
+            old_path = os.path.join(self.checkpoint_dir, old['file'])
+            if os.path.exists(old_path):
+                os.remove(old_path)
+        self.manifest['checkpoints'] = checkpoints[-self.keep_last:]
+        self.manifest['state'] = {'epoch': epoch, 'file': STATE_NAME}
+        self._write_manifest()
+        print(f"✅ Model Kaydedildi: {name}")
+
+    def _write_best(self, epoch: int, val_psnr: float, g_weights: list):
+        self._write_weights(g_weights, os.path.join(self.checkpoint_dir, BEST_WEIGHTS_NAME))
+        self.manifest['best'] = {'epoch': epoch, 'file': BEST_WEIGHTS_NAME, 'val_psnr': val_psnr}
+        self._write_manifest()
+        print(f"⭐ En iyi model (epoch {epoch}, PSNR {val_psnr:.2f} dB): {BEST_WEIGHTS_NAME}")
+
+    def _write_manifest(self):
+        path = os.path.join(self.checkpoint_dir, MANIFEST_NAME)
+        tmp_path = _atomic_path(path)
+        with open(tmp_path, 'w') as f:
+            json.dump(self.manifest, f, indent=2)
+        os.replace(tmp_path, path)
+
+    def close(self):
+        """Bekleyen yazmaları bitirir"""
+        self.writer.close()
@@ -0,0 +1,164 @@
+"""
+LDCT Denoising - Komut Satırı Arayüzü
+DICOM klasörlerini ekran olmadan (headless) toplu olarak işler.
+
+Kullanım:
+    python app/cli.py <girdi_klasörü> <çıktı_klasörü> [--weights G_epoch_50.h5]
+"""
+
+import argparse
+import os
+import sys
+
+# Uygulama dizinini path'e ekle
+app_dir = os.path.dirname(os.path.abspath(__file__))
+if app_dir not in sys.path:
+    sys.path.insert(0, app_dir)
+
+import numpy as np
+from PIL import Image
+
+from preprocessing import (find_dicom_files, preprocess_dicom, preprocess_dicom_native,
+                           postprocess_output, model_output_to_hu)
+from model import load_model, predict_batch, predict_tiled
+from pipeline import run_pipeline, DEFAULT_DECODERS
+from tiling import DEFAULT_OVERLAP
+from dicom_writer import DicomSeriesWriter
+
+
+# Proje kök dizini ve model yolu
+PROJECT_ROOT = os.path.dirname(app_dir)
+MODEL_PATH = os.path.join(PROJECT_ROOT, "G_epoch_50.h5")
+
+# Pipeline sabitleri
+DEFAULT_BATCH_SIZE = 8
+QUEUE_SIZE = 32
+OUTPUT_EXTS = {'png': ".png", 'dicom': ".dcm"}
+
+
+def output_path_for(file_path: str, input_dir: str, output_dir: str,
+                    output_format: str = 'png') -> str:
+    """Girdi ağacındaki dosyanın çıktı ağacındaki karşılığını döndürür"""
+    rel_path = os.path.relpath(file_path, input_dir)
+    return os.path.join(output_dir, os.path.splitext(rel_path)[0] + OUTPUT_EXTS[output_format])
+
+
+def write_output(image: np.ndarray, output_path: str):
+    """
+    Çıktıyı atomik olarak yazar.
+
+    Önce geçici dosyaya yazılıp sonra yeniden adlandırılır; yarıda kalan bir
+    çalıştırma eksik dosya bırakmaz ve devam ederken (resume) atlanmaz.
+    """
+    os.makedirs(os.path.dirname(output_path), exist_ok=True)
+    tmp_path = output_path + ".tmp"
+    Image.fromarray(image).save(tmp_path, format="PNG")
+    os.replace(tmp_path, output_path)
+
+
+def run_batch(input_dir: str, output_dir: str, batch_size: int = DEFAULT_BATCH_SIZE,
+              num_decoders: int = DEFAULT_DECODERS, resume: bool = True,
+              tiled: bool = False, overlap: int = DEFAULT_OVERLAP,
+              output_format: str = 'png') -> dict:
+    """
+    Girdi ağacındaki tüm DICOM dosyalarını işler ve çıktı ağacına yazar.
+
+    Decode, inference ve yazma aşamaları pipeline.run_pipeline ile üst üste
+    bindirilir.
+
+    Args:
+        input_dir: DICOM dosyalarını içeren kök klasör
+        output_dir: Aynı klasör yapısıyla çıktıların yazılacağı kök klasör
+        batch_size: Inference batch boyutu
+        num_decoders: Paralel DICOM decoder sayısı
+        resume: True ise çıktısı zaten olan dosyalar atlanır
+        tiled: True ise kesitler küçültülmeden, doğal çözünürlükte üst üste
+               binen 256x256 parçalarla işlenir (batch_size parça sayısıdır)
+        overlap: Tiled modda parçaların örtüşme genişliği
+        output_format: 'png' (8-bit görüntü) veya 'dicom' (kaynak header'lı,
+                       tam hassasiyetli HU serisi)
+
+    Returns:
+        dict: Aşama istatistikleri ve sayaçlar
+    """
+    files = find_dicom_files(input_dir)
+    jobs = [(f, output_path_for(f, input_dir, output_dir, output_format)) for f in files]
+    skipped = 0
+    if resume:
+        pending = [job for job in jobs if not os.path.exists(job[1])]
+        skipped = len(jobs) - len(pending)
+        jobs = pending
+
+    print(f"{len(files)} DICOM dosyası bulundu, {skipped} tanesi zaten işlenmiş, "
+          f"{len(jobs)} tanesi işlenecek.")
+
+    def decode(job):
+        if tiled:
+            image, _ = preprocess_dicom_native(job[0])
+            return image[np.newaxis, ..., np.newaxis]
+        model_input, _ = preprocess_dicom(job[0])
+        return model_input
+
+    def infer(batch):
+        if tiled:
+            return np.stack([predict_tiled(image, overlap=overlap, batch_size=batch_size)
+                             for image in batch])
+        return predict_batch(batch, batch_size=batch_size)
+
+    dicom_writer = DicomSeriesWriter() if output_format == 'dicom' else None
+
+    def write(job, model_output):
+        if dicom_writer is not None:
+            dicom_writer.write(job[0], model_output_to_hu(model_output), job[1])
+        else:
+            write_output(postprocess_output(model_output), job[1])
+
+    # Tiled modda kesit boyutları farklı olabileceğinden her kesit ayrı işlenir;
+    # batch'leme parça düzeyinde yapılır
+    report = run_pipeline(jobs, decode, infer, write, num_decoders=num_decoders,
+                          batch_size=1 if tiled else batch_size, queue_size=QUEUE_SIZE)
+    report.print_report()
+
+    if report.failures:
+        print(f"\n{len(report.failures)} dosya işlenemedi:")
+        for job, message in report.failures:
+            print(f"  {job[0]}: {message}")
+
+    result = report.as_dict()
+    result.update({'found': len(files), 'skipped': skipped})
+    return result
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="LDCT Denoising - toplu DICOM işleme")
+    parser.add_argument("input_dir", help="DICOM dosyalarını içeren klasör")
+    parser.add_argument("output_dir", help="Çıktıların yazılacağı klasör")
+    parser.add_argument("--weights", default=MODEL_PATH, help="Generator ağırlık dosyası")
+    parser.add_argument("--batch-size", type=int, default=DEFAULT_BATCH_SIZE,
+                        help="Inference batch boyutu")
+    parser.add_argument("--decoders", type=int, default=DEFAULT_DECODERS,
+                        help="Paralel DICOM decoder sayısı")
+    parser.add_argument("--tiled", action="store_true",
+                        help="Kesitleri doğal çözünürlükte, parçalar halinde işle")
+    parser.add_argument("--tile-overlap", type=int, default=DEFAULT_OVERLAP,
+                        help="Tiled modda parçaların örtüşme genişliği (piksel)")
+    parser.add_argument("--format", choices=sorted(OUTPUT_EXTS), default='png',
+                        help="Çıktı formatı: 8-bit PNG veya HU değerli DICOM serisi")
+    parser.add_argument("--no-resume", action="store_true",
+                        help="Mevcut çıktıların üzerine yazarak baştan işle")
+    args = parser.parse_args(argv)
+
+    if not os.path.isdir(args.input_dir):
+        parser.error(f"Girdi klasörü bulunamadı: {args.input_dir}")
+    if not load_model(args.weights):
+        return 1
+
+    result = run_batch(args.input_dir, args.output_dir, batch_size=args.batch_size,
+                       num_decoders=args.decoders, resume=not args.no_resume,
+                       tiled=args.tiled, overlap=args.tile_overlap,
+                       output_format=args.format)
+    return 1 if result['failed'] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -4,8 +4,8 @@ Yan yana ve slider karşılaştırma görünümleri.
 """
 
 from PyQt5.QtWidgets import (QWidget, QHBoxLayout, QVBoxLayout, QLabel, 
-                              QSlider, QStackedWidget, QFrame)
-from PyQt5.QtCore import Qt, QPoint
+                              QSlider, QStackedWidget, QFrame, QScrollArea)
+from PyQt5.QtCore import Qt, QPoint, pyqtSignal
 from PyQt5.QtGui import QPixmap, QImage, QPainter, QFont, QColor
 import numpy as np
 
@@ -292,3 +292,133 @@ class ComparisonContainer(QWidget):
         """Her iki görünüme de görüntüleri ayarla"""
         self.side_by_side.set_images(low_dose, enhanced)
         self.slider_view.set_images(low_dose, enhanced)
+
+
+class ThumbnailItem(QFrame):
+    """Şeritteki tek bir dosyanın küçük resmi ve durum yazısı"""
+    
+    clicked = pyqtSignal(int)
+    
+    def __init__(self, job_id: int, title: str, size: int, parent=None):
+        super().__init__(parent)
+        self.job_id = job_id
+        self.thumb_size = size
+        self.setCursor(Qt.PointingHandCursor)
+        self.setToolTip(title)
+        self.set_selected(False)
+        
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(4, 4, 4, 4)
+        layout.setSpacing(2)
+        
+        self.image = QLabel("⏳")
+        self.image.setAlignment(Qt.AlignCenter)
+        self.image.setFixedSize(size, size)
+        self.image.setStyleSheet("background: #1a1a2e; border: none; font-size: 20px;")
+        
+        self.caption = QLabel(title if len(title) <= 12 else title[:11] + "…")
+        self.caption.setAlignment(Qt.AlignCenter)
+        self.caption.setStyleSheet("color: #a0aec0; font-size: 10px; background: transparent; border: none;")
+        
+        layout.addWidget(self.image)
+        layout.addWidget(self.caption)
+    
+    def set_selected(self, selected: bool):
+        color = "#4ecdc4" if selected else "#4a5568"
+        self.setStyleSheet(f"""
+            ThumbnailItem {{
+                background: #16213e;
+                border: 2px solid {color};
+                border-radius: 8px;
+            }}
+        """)
+    
+    def set_image(self, image: np.ndarray, caption: str):
+        """Küçük resmi ve altındaki yazıyı (ör. işlem süresi) ayarla"""
+        image = np.ascontiguousarray(image)
+        h, w = image.shape[:2]
+        qimg = QImage(image.data, w, h, w, QImage.Format_Grayscale8)
+        pixmap = QPixmap.fromImage(qimg).scaled(self.thumb_size, self.thumb_size, Qt.KeepAspectRatio,
+                                                Qt.SmoothTransformation)
+        self.image.setPixmap(pixmap)
+        self.caption.setText(caption)
+    
+    def set_status(self, icon: str, caption: str, tooltip: str = None):
+        """Görüntüsüz durum (hata, iptal) göster"""
+        self.image.setText(icon)
+        self.caption.setText(caption)
+        if tooltip:
+            self.setToolTip(tooltip)
+    
+    def mousePressEvent(self, event):
+        self.clicked.emit(self.job_id)
+
+
+class ThumbnailStrip(QScrollArea):
+    """İşlenen dosyaların sonuçlarını bittikçe gösteren yatay şerit"""
+    
+    thumbnail_clicked = pyqtSignal(int)
+    
+    THUMB_SIZE = 72
+    MAX_ITEMS = 200  # Aşılırsa en eski küçük resimler kaldırılır
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.items = {}
+        self.selected = None
+        self.setWidgetResizable(True)
+        self.setFixedHeight(self.THUMB_SIZE + 48)
+        self.setHorizontalScrollBarPolicy(Qt.ScrollBarAsNeeded)
+        self.setVerticalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
+        self.setStyleSheet("QScrollArea { background: transparent; border: none; }")
+        
+        container = QWidget()
+        container.setStyleSheet("background: transparent;")
+        self.row = QHBoxLayout(container)
+        self.row.setContentsMargins(0, 0, 0, 0)
+        self.row.setSpacing(8)
+        self.row.addStretch()
+        self.setWidget(container)
+    
+    def add_item(self, job_id: int, title: str) -> list:
+        """
+        Bekleyen bir iş için yer tutucu ekle.
+        
+        Returns:
+            list: Kapasite aşıldığı için şeritten kaldırılan iş kimlikleri
+        """
+        item = ThumbnailItem(job_id, title, self.THUMB_SIZE)
+        item.clicked.connect(self.thumbnail_clicked)
+        self.row.insertWidget(self.row.count() - 1, item)
+        self.items[job_id] = item
+        
+        evicted = []
+        while len(self.items) > self.MAX_ITEMS:
+            old_id = next(iter(self.items))  # Eklenme sırasına göre en eski
+            old_item = self.items.pop(old_id)
+            self.row.removeWidget(old_item)
+            old_item.deleteLater()
+            if self.selected == old_id:
+                self.selected = None
+            evicted.append(old_id)
+        return evicted
+    
+    def __contains__(self, job_id: int) -> bool:
+        return job_id in self.items
+    
+    def set_result(self, job_id: int, image: np.ndarray, caption: str):
+        if job_id in self.items:
+            self.items[job_id].set_image(image, caption)
+            self.ensureWidgetVisible(self.items[job_id])
+    
+    def set_status(self, job_id: int, icon: str, caption: str, tooltip: str = None):
+        if job_id in self.items:
+            self.items[job_id].set_status(icon, caption, tooltip)
+    
+    def select(self, job_id: int):
+        """Seçili küçük resmi vurgula"""
+        if self.selected in self.items:
+            self.items[self.selected].set_selected(False)
+        self.selected = job_id
+        if job_id in self.items:
+            self.items[job_id].set_selected(True)
@@ -0,0 +1,152 @@
+"""
+LDCT Denoising - Dataset Module
+Eğitim/doğrulama verisi için yükleyiciler.
+
+İki format desteklenir:
+- Dosya başına bir kesit: trainA/*.npy (low dose) ve trainB/*.npy (full dose)
+  (02_data_preprocessing.ipynb çıktısı, tf_dataset.NPYDataset ile okunur)
+- Paketlenmiş format: split başına tek parça, memory-map edilebilir
+  {split}_A.npy / {split}_B.npy dizileri ve {split}_index.csv
+  (pack_dataset ile üretilir, tf_dataset.PackedDataset ile okunur)
+
+Bu modül TensorFlow'u içe aktarmaz; dosya listeleme, bölme ve paketleme
+TensorFlow kurulu olmadan (ve yükleme süresi ödenmeden) çalışır. Keras
+yükleyicileri ve tf.data pipeline'ı tf_dataset modülündedir.
+"""
+
+import csv
+import glob
+import os
+
+import numpy as np
+
+# Veri sabitleri (notebook'lardan alındı)
+IMG_WIDTH = 256
+IMG_HEIGHT = 256
+CHANNELS = 1
+VAL_SPLIT = 0.10
+SPLIT_SEED = 42
+
+
+def list_paired_files(dataset_path: str) -> tuple:
+    """
+    trainA/trainB klasörlerinde her ikisinde de bulunan dosyaları eşleştirir.
+
+    Args:
+        dataset_path: trainA ve trainB klasörlerini içeren klasör
+
+    Returns:
+        tuple: (low_dose_dosyaları, full_dose_dosyaları), isim sırasıyla
+    """
+    names_A = {os.path.basename(f) for f in glob.glob(os.path.join(dataset_path, 'trainA', '*.npy'))}
+    names_B = {os.path.basename(f) for f in glob.glob(os.path.join(dataset_path, 'trainB', '*.npy'))}
+
+    missing_in_A = names_B - names_A
+    missing_in_B = names_A - names_B
+    if missing_in_A:
+        print(f"HATA: trainA içinde karşılığı olmayan dosya(lar) (trainB'de var): {missing_in_A}")
+    if missing_in_B:
+        print(f"HATA: trainB içinde karşılığı olmayan dosya(lar) (trainA'da var): {missing_in_B}")
+
+    common = sorted(names_A & names_B)
+    files_A = [os.path.join(dataset_path, 'trainA', f) for f in common]
+    files_B = [os.path.join(dataset_path, 'trainB', f) for f in common]
+    return files_A, files_B
+
+
+def split_paired_files(files_A: list, files_B: list, test_size: float = VAL_SPLIT,
+                       random_state: int = SPLIT_SEED) -> tuple:
+    """
+    Eşleştirilmiş dosyaları notebook'lardaki ile aynı train/val bölmesine ayırır.
+
+    Returns:
+        tuple: (train_A, val_A, train_B, val_B)
+    """
+    from sklearn.model_selection import train_test_split
+    return train_test_split(files_A, files_B, test_size=test_size, random_state=random_state)
+
+
+def parse_slice_name(file_path: str) -> tuple:
+    """'L067_0012.npy' gibi bir dosya adından (hasta, kesit_no) çıkarır"""
+    stem = os.path.splitext(os.path.basename(file_path))[0]
+    patient, _, index = stem.rpartition('_')
+    if not patient or not index.isdigit():
+        return stem, -1
+    return patient, int(index)
+
+
+def load_slice(file_path: str) -> np.ndarray:
+    """Tek bir .npy kesitini (H, W, 1) olarak yükler"""
+    img = np.load(file_path)
+    if img.ndim == 2:
+        img = np.expand_dims(img, axis=-1)
+    return img
+
+
+def packed_paths(packed_dir: str, split: str) -> tuple:
+    """Paketlenmiş split'in (A dizisi, B dizisi, indeks) dosya yollarını döndürür"""
+    return (os.path.join(packed_dir, f"{split}_A.npy"),
+            os.path.join(packed_dir, f"{split}_B.npy"),
+            os.path.join(packed_dir, f"{split}_index.csv"))
+
+
+def _pack_split(files_A: list, files_B: list, packed_dir: str, split: str):
+    """Bir split'in kesitlerini tek parça memmap dizilerine yazar"""
+    path_A, path_B, index_path = packed_paths(packed_dir, split)
+    shape = (len(files_A), IMG_HEIGHT, IMG_WIDTH, CHANNELS)
+    array_A = np.lib.format.open_memmap(path_A, mode='w+', dtype=np.float32, shape=shape)
+    array_B = np.lib.format.open_memmap(path_B, mode='w+', dtype=np.float32, shape=shape)
+
+    with open(index_path, 'w', newline='') as f:
+        writer = csv.writer(f)
+        writer.writerow(['row', 'name', 'patient', 'slice'])
+        for row, (file_A, file_B) in enumerate(zip(files_A, files_B)):
+            array_A[row] = load_slice(file_A)
+            array_B[row] = load_slice(file_B)
+            patient, slice_no = parse_slice_name(file_A)
+            writer.writerow([row, os.path.basename(file_A), patient, slice_no])
+
+    array_A.flush()
+    array_B.flush()
+    del array_A, array_B
+
+
+def pack_dataset(dataset_path: str, packed_dir: str, test_size: float = VAL_SPLIT,
+                 random_state: int = SPLIT_SEED) -> dict:
+    """
+    Dosya başına bir kesit düzenini split başına tek parça diziye dönüştürür.
+
+    Train/val bölmesi notebook'lardaki ile aynıdır. Train kesitleri bir kez
+    rastgele sıralanarak yazılır; böylece PackedDataset ardışık (kopyasız)
+    batch dilimleri alsa bile batch'ler farklı hastalardan kesitler içerir.
+
+    Args:
+        dataset_path: trainA/trainB klasörlerini içeren klasör
+        packed_dir: Paketlenmiş dosyaların yazılacağı klasör
+        test_size: Doğrulama oranı
+        random_state: Bölme ve karıştırma tohumu
+
+    Returns:
+        dict: Split başına kesit sayıları
+    """
+    os.makedirs(packed_dir, exist_ok=True)
+    files_A, files_B = list_paired_files(dataset_path)
+    train_A, val_A, train_B, val_B = split_paired_files(files_A, files_B, test_size, random_state)
+
+    order = np.random.default_rng(random_state).permutation(len(train_A))
+    train_A = [train_A[i] for i in order]
+    train_B = [train_B[i] for i in order]
+
+    _pack_split(train_A, train_B, packed_dir, 'train')
+    _pack_split(val_A, val_B, packed_dir, 'val')
+
+    counts = {'train': len(train_A), 'val': len(val_A)}
+    print(f"Paketleme tamamlandı: {counts} -> {packed_dir}")
+    return counts
+
+
+def read_packed_index(packed_dir: str, split: str) -> list:
+    """Paketlenmiş split'in indeksini satır sırasıyla döndürür"""
+    with open(packed_paths(packed_dir, split)[2], newline='') as f:
+        return [{'row': int(r['row']), 'name': r['name'], 'patient': r['patient'],
+                 'slice': int(r['slice'])} for r in csv.DictReader(f)]
@@ -0,0 +1,206 @@
+"""
+LDCT Denoising - DICOM Writer Module
+Generator çıktısını tam hassasiyetli HU verisi olarak yeni bir DICOM serisine yazar.
+
+Her çıktı kesiti kaynak kesitin header'ını kopyalar; kaynak seriden
+deterministik türetilen bir SeriesInstanceUID ve yeni SOPInstanceUID atanır,
+piksel verisi RescaleSlope/RescaleIntercept ile 16-bit olarak saklanır.
+Yazma kesit kesit yapılır, seri bellekte tutulmaz.
+"""
+
+import os
+
+import numpy as np
+from PIL import Image
+
+from preprocessing import model_output_to_hu, preprocess_dicom
+
+try:
+    import pydicom
+    from pydicom.uid import ExplicitVRLittleEndian, generate_uid
+except ImportError:
+    pydicom = None
+
+
+# Çıktı piksel kodlaması: stored = (HU - intercept) / slope, uint16
+RESCALE_SLOPE = 1.0
+RESCALE_INTERCEPT = -1024.0
+SERIES_NUMBER_OFFSET = 1000
+SERIES_DESCRIPTION_SUFFIX = " [AI denoised]"
+DERIVATION_DESCRIPTION = "LDCT denoising (Pix2Pix + WGAN-GP generator)"
+
+# Piksel kodlaması değiştiği için kaynaktan kopyalanmayan elemanlar
+_DROPPED_KEYWORDS = (
+    'SmallestImagePixelValue', 'LargestImagePixelValue', 'PixelPaddingValue',
+    'PixelPaddingRangeLimit', 'RescaleType',
+)
+
+
+def resample_to_shape(image: np.ndarray, shape: tuple) -> np.ndarray:
+    """
+    Float görüntüyü verilen (satır, sütun) boyutuna LANCZOS ile yeniden örnekler.
+
+    Returns:
+        numpy array: float32 görüntü
+    """
+    if image.shape == tuple(shape):
+        return image.astype(np.float32)
+    pil_img = Image.fromarray(image.astype(np.float32))
+    pil_img = pil_img.resize((shape[1], shape[0]), Image.Resampling.LANCZOS)
+    return np.array(pil_img, dtype=np.float32)
+
+
+def encode_hu(hu_image: np.ndarray) -> np.ndarray:
+    """HU görüntüsünü RESCALE_SLOPE/RESCALE_INTERCEPT ile uint16 piksele çevirir"""
+    stored = np.round((hu_image - RESCALE_INTERCEPT) / RESCALE_SLOPE)
+    return np.clip(stored, 0, np.iinfo(np.uint16).max).astype('<u2')
+
+
+def _save_dataset(ds, output_path: str):
+    """Veri setini pydicom sürümüne uygun şekilde, atomik olarak kaydeder"""
+    os.makedirs(os.path.dirname(output_path) or '.', exist_ok=True)
+    tmp_path = output_path + ".tmp"
+    if int(pydicom.__version__.split('.')[0]) >= 3:
+        ds.save_as(tmp_path, enforce_file_format=True)
+    else:
+        ds.is_little_endian = True
+        ds.is_implicit_VR = False
+        ds.save_as(tmp_path, write_like_original=False)
+    os.replace(tmp_path, output_path)
+
+
+class DicomSeriesWriter:
+    """
+    Denoise edilmiş kesitleri kaynak serilerin türetilmiş kopyaları olarak yazar.
+
+    Her kaynak seri için bir kez yeni bir seri UID'si üretilir; böylece bir
+    klasör ağacındaki birden çok seri kesit kesit akıtılarak yazılabilir.
+    """
+
+    def __init__(self, resample: bool = True):
+        """
+        Args:
+            resample: True ise çıktı kaynak matris boyutuna (ör. 512x512)
+                      yeniden örneklenir; False ise model çözünürlüğünde
+                      yazılır ve PixelSpacing buna göre güncellenir
+        """
+        if pydicom is None:
+            raise ImportError("pydicom kütüphanesi yüklü değil. 'pip install pydicom' komutunu çalıştırın.")
+        self.resample = resample
+
+    @staticmethod
+    def source_series_key(ds, source_path: str) -> str:
+        """
+        Kaynak kesitin ait olduğu seriyi tanımlayan anahtar.
+
+        Normalde SeriesInstanceUID'dir. Bu alan boş veya eksikse farklı
+        serilerin aynı türetilmiş seriye yazılmaması için StudyInstanceUID,
+        kaynak klasör ve SeriesNumber birlikte kullanılır.
+        """
+        source_uid = str(ds.get('SeriesInstanceUID', '')).strip()
+        if source_uid:
+            return source_uid
+        return "|".join([str(ds.get('StudyInstanceUID', '')),
+                         os.path.dirname(os.path.abspath(source_path)),
+                         str(ds.get('SeriesNumber', ''))])
+
+    @staticmethod
+    def new_series_uid(source_key: str) -> str:
+        """
+        Kaynak seri için türetilmiş seri UID'sini döndürür.
+
+        UID kaynak seri anahtarından (source_series_key) deterministik olarak
+        üretilir; yarıda kesilip devam ettirilen bir çalışmada kalan kesitler de
+        aynı seriye yazılır.
+        """
+        return generate_uid(entropy_srcs=[source_key, DERIVATION_DESCRIPTION])
+
+    def write(self, source_path: str, hu_image: np.ndarray, output_path: str) -> str:
+        """
+        Tek bir denoise edilmiş kesiti yazar.
+
+        Args:
+            source_path: Kaynak DICOM dosyası (header buradan kopyalanır)
+            hu_image: Float HU görüntüsü (model_output_to_hu çıktısı)
+            output_path: Yazılacak .dcm dosyası
+
+        Returns:
+            str: Yazılan dosyanın yolu
+        """
+        ds = pydicom.dcmread(source_path, stop_before_pixels=True)
+        series_key = self.source_series_key(ds, source_path)
+        hu_image = np.asarray(hu_image, dtype=np.float32).squeeze()
+
+        source_shape = (int(ds.Rows), int(ds.Columns))
+        if self.resample:
+            hu_image = resample_to_shape(hu_image, source_shape)
+        elif hu_image.shape != source_shape and 'PixelSpacing' in ds:
+            # Aynı fiziksel alanı daha az pikselle kaplar
+            row_spacing, col_spacing = (float(v) for v in ds.PixelSpacing)
+            ds.PixelSpacing = [row_spacing * source_shape[0] / hu_image.shape[0],
+                               col_spacing * source_shape[1] / hu_image.shape[1]]
+
+        for keyword in _DROPPED_KEYWORDS:
+            if keyword in ds:
+                delattr(ds, keyword)
+
+        # Piksel verisi
+        ds.Rows, ds.Columns = hu_image.shape
+        ds.SamplesPerPixel = 1
+        ds.PhotometricInterpretation = 'MONOCHROME2'
+        ds.BitsAllocated = 16
+        ds.BitsStored = 16
+        ds.HighBit = 15
+        ds.PixelRepresentation = 0
+        ds.RescaleSlope = RESCALE_SLOPE
+        ds.RescaleIntercept = RESCALE_INTERCEPT
+        ds.PixelData = encode_hu(hu_image).tobytes()
+        ds['PixelData'].VR = 'OW'
+
+        # Yeni kimlikler ve türetilmiş görüntü bilgisi
+        sop_uid = generate_uid()
+        ds.SOPInstanceUID = sop_uid
+        ds.SeriesInstanceUID = self.new_series_uid(series_key)
+        if 'SeriesNumber' in ds and ds.SeriesNumber is not None:
+            ds.SeriesNumber = int(ds.SeriesNumber) + SERIES_NUMBER_OFFSET
+        ds.SeriesDescription = str(ds.get('SeriesDescription', '')) + SERIES_DESCRIPTION_SUFFIX
+        image_type = ds.get('ImageType', [])
+        image_type = [image_type] if isinstance(image_type, str) else list(image_type)
+        ds.ImageType = ['DERIVED', 'SECONDARY'] + image_type[2:]
+        ds.DerivationDescription = DERIVATION_DESCRIPTION
+
+        ds.file_meta.MediaStorageSOPInstanceUID = sop_uid
+        ds.file_meta.TransferSyntaxUID = ExplicitVRLittleEndian
+
+        _save_dataset(ds, output_path)
+        return output_path
+
+
+def write_denoised_series(source_paths: list, output_dir: str, predict_fn,
+                          batch_size: int = 8, resample: bool = True) -> list:
+    """
+    Bir seriyi küçük batch'ler halinde denoise eder ve yeni seri olarak yazar.
+
+    Aynı anda en fazla batch_size kesit bellekte tutulur; 600 kesitlik bir
+    seri bile bellekte iki kez bulunmaz.
+
+    Args:
+        source_paths: Kaynak DICOM dosyaları
+        output_dir: Çıktı klasörü (dosya adları korunur)
+        predict_fn: (N, 256, 256, 1) -> (N, 256, 256, 1) inference fonksiyonu
+        batch_size: Bir kerede işlenen kesit sayısı
+        resample: Çıktıyı kaynak matris boyutuna yeniden örnekle
+
+    Returns:
+        list: Yazılan dosyaların yolları
+    """
+    writer = DicomSeriesWriter(resample=resample)
+    written = []
+    for start in range(0, len(source_paths), batch_size):
+        chunk = source_paths[start:start + batch_size]
+        inputs = np.concatenate([preprocess_dicom(path)[0] for path in chunk])
+        outputs = predict_fn(inputs)
+        for path, output in zip(chunk, outputs):
+            output_path = os.path.join(output_dir, os.path.basename(path))
+            written.append(writer.write(path, model_output_to_hu(output), output_path))
+    return written
@@ -0,0 +1,199 @@
+"""
+LDCT Denoising - Evaluation Module
+Generator çıktısı için batch halinde PSNR/SSIM değerlendirmesi.
+
+Tahmin ve metrikler tek bir graph-mode adımda hesaplanır; görüntü başına
+Python döngüsü yoktur. Veri diskten batch batch okunur, doğrulama setinin
+tamamı RAM'e yüklenmez. Metrik tanımları 04_validation_internal.ipynb ile
+aynıdır ([-1, 1] aralığı, max_val=2.0).
+
+Sonuçlar raporlanan değerlerle (PSNR 37.75 dB, SSIM 0.891) karşılaştırılır;
+ortalamalar PSNR için ±0.05 dB, SSIM için ±0.002 içindeyse eşleşmiş sayılır.
+--strict ile eşleşmeyen sonuç sıfırdan farklı çıkış koduyla (1) biter.
+
+Kullanım:
+    python app/evaluation.py <processed_data_npy> --weights G_epoch_50.h5 --out metrics.csv --strict
+"""
+
+import argparse
+import csv
+import os
+import sys
+import time
+
+# Uygulama dizinini path'e ekle
+app_dir = os.path.dirname(os.path.abspath(__file__))
+if app_dir not in sys.path:
+    sys.path.insert(0, app_dir)
+
+import numpy as np
+
+try:
+    import tensorflow as tf
+except ImportError:
+    tf = None
+
+
+# Değerlendirme sabitleri
+MAX_VAL = 2.0  # [-1, 1] aralığı
+DEFAULT_BATCH_SIZE = 50
+
+# Raporlanan sonuçlar (04_validation_internal.ipynb) ve kabul toleransı
+REFERENCE_PSNR = 37.75
+REFERENCE_SSIM = 0.891
+PSNR_TOLERANCE = 0.05
+SSIM_TOLERANCE = 0.002
+
+
+def make_eval_step(generator, jit_compile: bool = False):
+    """
+    Tahmin + PSNR + SSIM hesaplayan birleşik adım fonksiyonunu oluşturur.
+
+    Args:
+        generator: Ağırlıkları yüklü generator
+        jit_compile: True ise adım XLA ile derlenir
+
+    Returns:
+        callable: (girdi, hedef) -> (psnr[B], ssim[B])
+    """
+    @tf.function(jit_compile=jit_compile)
+    def eval_step(inputs, targets):
+        predictions = generator(inputs, training=False)
+        psnr = tf.image.psnr(targets, predictions, max_val=MAX_VAL)
+        ssim = tf.image.ssim(targets, predictions, max_val=MAX_VAL)
+        return psnr, ssim
+
+    return eval_step
+
+
+def evaluate_batches(eval_step, batches, names=None) -> dict:
+    """
+    Batch akışı üzerinde metrikleri hesaplar.
+
+    Args:
+        eval_step: make_eval_step() çıktısı
+        batches: (girdi, hedef) batch'leri üreten iterable (ör. tf.data.Dataset)
+        names: Kesit adları (batch sırasıyla); None ise sıra numarası kullanılır
+
+    Returns:
+        dict: {'names', 'psnr', 'ssim', 'seconds'}
+    """
+    psnr_parts = []
+    ssim_parts = []
+    start = time.perf_counter()
+    for inputs, targets in batches:
+        psnr, ssim = eval_step(inputs, targets)
+        psnr_parts.append(psnr.numpy())
+        ssim_parts.append(ssim.numpy())
+    seconds = time.perf_counter() - start
+
+    psnr = np.concatenate(psnr_parts) if psnr_parts else np.empty(0, dtype=np.float32)
+    ssim = np.concatenate(ssim_parts) if ssim_parts else np.empty(0, dtype=np.float32)
+    if names is None:
+        names = [str(i) for i in range(len(psnr))]
+    return {'names': list(names)[:len(psnr)], 'psnr': psnr, 'ssim': ssim, 'seconds': seconds}
+
+
+def summarize(metrics: dict) -> dict:
+    """Ortalama ve standart sapmaları hesaplar (notebook'lardaki gibi np.std)"""
+    return {
+        'count': int(len(metrics['psnr'])),
+        'psnr_mean': float(np.mean(metrics['psnr'])),
+        'psnr_std': float(np.std(metrics['psnr'])),
+        'ssim_mean': float(np.mean(metrics['ssim'])),
+        'ssim_std': float(np.std(metrics['ssim'])),
+        'slices_per_second': len(metrics['psnr']) / metrics['seconds'] if metrics['seconds'] else 0.0,
+    }
+
+
+def check_reference(summary: dict, psnr_ref: float = REFERENCE_PSNR,
+                    ssim_ref: float = REFERENCE_SSIM) -> bool:
+    """
+    Sonuçların raporlanan PSNR/SSIM değerlerini tolerans içinde üretip üretmediği.
+
+    Ortalama PSNR referanstan en fazla PSNR_TOLERANCE (0.05 dB), ortalama SSIM
+    en fazla SSIM_TOLERANCE (0.002) sapabilir; her iki koşul da sağlanmalıdır.
+    """
+    return (abs(summary['psnr_mean'] - psnr_ref) <= PSNR_TOLERANCE
+            and abs(summary['ssim_mean'] - ssim_ref) <= SSIM_TOLERANCE)
+
+
+def write_metrics(metrics: dict, summary: dict, output_path: str):
+    """
+    Kesit başına metrikleri ve özeti yazar.
+
+    '.parquet' uzantısında pandas kullanılır, aksi halde CSV yazılır. Özet
+    '<isim>_summary.csv' dosyasına yazılır.
+    """
+    base, ext = os.path.splitext(output_path)
+    if ext == '.parquet':
+        import pandas as pd
+        pd.DataFrame({'name': metrics['names'], 'psnr': metrics['psnr'],
+                      'ssim': metrics['ssim']}).to_parquet(output_path, index=False)
+    else:
+        with open(output_path, 'w', newline='') as f:
+            writer = csv.writer(f)
+            writer.writerow(['name', 'psnr', 'ssim'])
+            for row in zip(metrics['names'], metrics['psnr'], metrics['ssim']):
+                writer.writerow([row[0], f"{row[1]:.6f}", f"{row[2]:.6f}"])
+
+    with open(base + '_summary.csv', 'w', newline='') as f:
+        writer = csv.writer(f)
+        writer.writerow(list(summary))
+        writer.writerow(list(summary.values()))
+
+
+def print_summary(summary: dict):
+    print("\n" + "=" * 40)
+    print("📊 FİNAL SONUÇLAR")
+    print("=" * 40)
+    print(f"Ortalama PSNR: {summary['psnr_mean']:.4f} dB (±{summary['psnr_std']:.4f})")
+    print(f"Ortalama SSIM: {summary['ssim_mean']:.4f} (±{summary['ssim_std']:.4f})")
+    print(f"Kesit sayısı: {summary['count']} ({summary['slices_per_second']:.1f} kesit/s)")
+    print("=" * 40)
+
+
+def main(argv=None):
+    from dataset import list_paired_files, split_paired_files
+    from tf_dataset import make_tf_dataset
+    from model import LDCTModel
+
+    parser = argparse.ArgumentParser(description="LDCT Denoising - PSNR/SSIM değerlendirmesi")
+    parser.add_argument("dataset_path", help="trainA/trainB klasörlerini içeren klasör")
+    parser.add_argument("--weights", required=True, help="Generator ağırlık dosyası")
+    parser.add_argument("--out", default="metrics.csv", help="Kesit başına metrik dosyası")
+    parser.add_argument("--batch-size", type=int, default=DEFAULT_BATCH_SIZE)
+    parser.add_argument("--jit", action="store_true", help="Adımı XLA ile derle")
+    parser.add_argument("--strict", action="store_true",
+                        help=f"Sonuç referansla (PSNR ±{PSNR_TOLERANCE} dB, SSIM ±{SSIM_TOLERANCE}) "
+                             f"eşleşmezse 1 ile çık")
+    args = parser.parse_args(argv)
+
+    model = LDCTModel()
+    if not model.load_weights(args.weights, warmup=False) or model.generator is None:
+        print("Değerlendirme için Keras ağırlıkları gerekli")
+        return 1
+
+    # 04_validation_internal.ipynb ile aynı doğrulama bölmesi
+    files_A, files_B = list_paired_files(args.dataset_path)
+    _, val_A, _, val_B = split_paired_files(files_A, files_B)
+    print(f"Validation görüntü sayısı: {len(val_A)}")
+
+    batches = make_tf_dataset(val_A, val_B, batch_size=args.batch_size, shuffle=False,
+                              drop_remainder=False)
+    metrics = evaluate_batches(make_eval_step(model.generator, jit_compile=args.jit), batches,
+                               names=[os.path.basename(f) for f in val_A])
+    summary = summarize(metrics)
+    write_metrics(metrics, summary, args.out)
+    print_summary(summary)
+
+    matches = check_reference(summary)
+    print(("✅" if matches else "⚠️") + f" Referans: PSNR {REFERENCE_PSNR} dB (±{PSNR_TOLERANCE}) / "
+          f"SSIM {REFERENCE_SSIM} (±{SSIM_TOLERANCE})")
+    if args.strict and not matches:
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -5,6 +5,12 @@ Modern PyQt5 masaüstü uygulaması.
 
 import sys
 import os
+import queue
+import threading
+import time
+
+# Başlangıç → ilk çizim süresi için referans an
+STARTUP_TIME = time.perf_counter()
 
 # Uygulama dizinini path'e ekle
 app_dir = os.path.dirname(os.path.abspath(__file__))
@@ -20,54 +26,194 @@ from PyQt5.QtGui import QFont, QDragEnterEvent, QDropEvent, QIcon, QPalette, QCo
 
 import numpy as np
 
-from preprocessing import preprocess_dicom, postprocess_output, model_input_to_display
-from model import load_model, predict, get_model
-from comparison_widget import ComparisonContainer
+from preprocessing import (find_dicom_files, preprocess_dicom, postprocess_output,
+                           model_input_to_display)
+from comparison_widget import ComparisonContainer, ThumbnailStrip
+from cache import ResultCache, pixel_key
 
 
 # Proje kök dizini ve model yolu
 PROJECT_ROOT = os.path.dirname(app_dir)
 MODEL_PATH = os.path.join(PROJECT_ROOT, "G_epoch_50.h5")
 
+# Kuyruktaki dosyalar modelden en fazla bu kadarlık batch'ler halinde geçer
+WORKER_BATCH_SIZE = 8
+
 
-class ProcessingThread(QThread):
-    """Arka planda işleme yapan thread"""
-    finished = pyqtSignal(np.ndarray, np.ndarray)  # low_dose, enhanced
-    error = pyqtSignal(str)
-    progress = pyqtSignal(int)
+class ModelLoaderThread(QThread):
+    """
+    Modeli arka planda yükleyen thread.
+    
+    TensorFlow importu, generator oluşturma ve ağırlık yükleme GUI thread'ini
+    bloklamaz; pencere hemen çizilir ve kullanılabilir.
+    """
+    progress = pyqtSignal(int, str)
+    finished = pyqtSignal(bool, str)  # başarılı mı, hata mesajı
     
-    def __init__(self, file_path: str):
+    def __init__(self, weights_path: str):
         super().__init__()
-        self.file_path = file_path
+        self.weights_path = weights_path
+        self.result_cache = None
     
     def run(self):
         try:
-            # 1. Preprocessing
-            self.progress.emit(30)
-            model_input, _ = preprocess_dicom(self.file_path)
-            
-            # 2. Display için low dose görüntü
-            low_dose_display = model_input_to_display(model_input)
+            if not os.path.exists(self.weights_path):
+                self.finished.emit(False, f"Model dosyası bulunamadı:\n{self.weights_path}")
+                return
             
-            # 3. Model inference
-            self.progress.emit(60)
-            model_output = predict(model_input)
+            # 1. TensorFlow ve model modülü (ilk import en uzun adım)
+            self.progress.emit(10, "TensorFlow yükleniyor")
+            from model import load_model
             
-            # 4. Post-processing
-            self.progress.emit(90)
-            enhanced_display = postprocess_output(model_output)
+            # 2. Generator + ağırlıklar + warmup
+            self.progress.emit(40, "Ağırlıklar yükleniyor")
+            if not load_model(self.weights_path):
+                self.finished.emit(False, "Model yüklenemedi")
+                return
             
-            self.progress.emit(100)
-            self.finished.emit(low_dose_display, enhanced_display)
+            # 3. Ağırlıklara bağlı sonuç önbelleği (parmak izi hesaplanır)
+            self.progress.emit(90, "Önbellek hazırlanıyor")
+            try:
+                self.result_cache = ResultCache(self.weights_path)
+            except OSError as e:
+                print(f"Önbellek açılamadı: {e}")
             
+            self.progress.emit(100, "Hazır")
+            self.finished.emit(True, "")
         except Exception as e:
-            self.error.emit(str(e))
+            self.finished.emit(False, str(e))
+
+
+class InferenceWorker(QThread):
+    """
+    Dosya kuyruğunu işleyen, uygulama boyunca yaşayan inference thread'i.
+    
+    Kuyrukta bekleyen dosyalar WORKER_BATCH_SIZE'a kadar birlikte modelden
+    geçirilir; her dosyanın sonucu hazır olur olmaz ayrı bir sinyalle
+    gönderilir. cancel() bekleyen işleri kuyruktan atar, işlenmekte olanların
+    sonucunu da yok sayar.
+    """
+    result_ready = pyqtSignal(int, np.ndarray, np.ndarray, float, bool)  # iş, low, enhanced, saniye, önbellekten mi
+    job_failed = pyqtSignal(int, str)
+    job_cancelled = pyqtSignal(int)
+    
+    def __init__(self, batch_size: int = WORKER_BATCH_SIZE):
+        super().__init__()
+        self.batch_size = batch_size
+        self.cache = None
+        self._jobs = queue.Queue()
+        self._generation = 0
+        self._lock = threading.Lock()
+    
+    def submit(self, job_id: int, file_path: str):
+        """Dosyayı kuyruğa ekle (model yüklenmeden önce de çağrılabilir)"""
+        with self._lock:
+            self._jobs.put((self._generation, job_id, file_path))
+    
+    def cancel(self):
+        """Bekleyen ve işlenmekte olan tüm işleri iptal et"""
+        with self._lock:
+            self._generation += 1
+            while True:
+                try:
+                    job = self._jobs.get_nowait()
+                except queue.Empty:
+                    break
+                if job is None:
+                    self._jobs.put(None)
+                    break
+                self.job_cancelled.emit(job[1])
+    
+    def stop(self):
+        """Kuyruğu kapat; thread elindeki batch'i bitirip çıkar"""
+        self.cancel()
+        self._jobs.put(None)
+    
+    def _is_cancelled(self, generation: int) -> bool:
+        return generation != self._generation
+    
+    def _next_batch(self) -> list:
+        """İlk işi bekle, ardından kuyrukta hazır olanlarla batch'i doldur"""
+        job = self._jobs.get()
+        if job is None:
+            return None
+        batch = [job]
+        while len(batch) < self.batch_size:
+            try:
+                job = self._jobs.get_nowait()
+            except queue.Empty:
+                break
+            if job is None:
+                self._jobs.put(None)
+                break
+            batch.append(job)
+        return batch
+    
+    def run(self):
+        from model import predict_batch
+        
+        while True:
+            batch = self._next_batch()
+            if batch is None:
+                return
+            self._process(batch, predict_batch)
+    
+    def _process(self, batch: list, predict_batch):
+        # 1. Önbellek kontrolü ve preprocessing (dosya başına)
+        pending = []
+        for generation, job_id, file_path in batch:
+            if self._is_cancelled(generation):
+                self.job_cancelled.emit(job_id)
+                continue
+            start = time.perf_counter()
+            try:
+                key = pixel_key(file_path) if self.cache is not None else None
+                cached = self.cache.get(key) if key is not None else None
+                if cached is not None:
+                    self.result_ready.emit(job_id, cached[0], cached[1],
+                                           time.perf_counter() - start, True)
+                    continue
+                model_input, _ = preprocess_dicom(file_path)
+            except Exception as e:
+                self.job_failed.emit(job_id, str(e))
+                continue
+            pending.append((generation, job_id, key, model_input, time.perf_counter() - start))
+        
+        if not pending:
+            return
+        
+        # 2. Tek seferde model inference
+        start = time.perf_counter()
+        try:
+            outputs = predict_batch(np.concatenate([job[3] for job in pending]))
+        except Exception as e:
+            for job in pending:
+                self.job_failed.emit(job[1], str(e))
+            return
+        inference_share = (time.perf_counter() - start) / len(pending)
+        
+        # 3. Post-processing ve dosya başına sonuç
+        for (generation, job_id, key, model_input, decode_seconds), output in zip(pending, outputs):
+            if self._is_cancelled(generation):
+                self.job_cancelled.emit(job_id)
+                continue
+            start = time.perf_counter()
+            low_dose_display = model_input_to_display(model_input)
+            enhanced_display = postprocess_output(output)
+            if key is not None:
+                # Önbelleğe yazılamaması sonucu engellemez
+                try:
+                    self.cache.put(key, low_dose_display, enhanced_display)
+                except Exception as e:
+                    print(f"Önbelleğe yazılamadı: {e}")
+            seconds = decode_seconds + inference_share + time.perf_counter() - start
+            self.result_ready.emit(job_id, low_dose_display, enhanced_display, seconds, False)
 
 
 class DropZone(QFrame):
     """Sürükle-bırak dosya yükleme alanı"""
     
-    file_dropped = pyqtSignal(str)
+    files_dropped = pyqtSignal(list)
     
     def __init__(self, parent=None):
         super().__init__(parent)
@@ -100,7 +246,7 @@ class DropZone(QFrame):
         icon_label.setAlignment(Qt.AlignCenter)
         
         # Ana metin
-        main_text = QLabel("DICOM Dosyasını Sürükleyip Bırakın")
+        main_text = QLabel("DICOM Dosyalarını veya Klasörünü Sürükleyip Bırakın")
         main_text.setStyleSheet("""
             QLabel {
                 color: #e2e8f0;
@@ -142,10 +288,21 @@ class DropZone(QFrame):
         layout.addWidget(sub_text)
         layout.addWidget(format_text)
     
+    @staticmethod
+    def collect_dicom_files(paths: list) -> list:
+        """Bırakılan dosya ve klasörlerden .dcm dosyalarını topla"""
+        files = []
+        for path in paths:
+            if os.path.isdir(path):
+                files.extend(find_dicom_files(path))
+            elif path.lower().endswith('.dcm'):
+                files.append(path)
+        return files
+    
     def dragEnterEvent(self, event: QDragEnterEvent):
         if event.mimeData().hasUrls():
-            url = event.mimeData().urls()[0]
-            if url.toLocalFile().lower().endswith('.dcm'):
+            paths = [url.toLocalFile() for url in event.mimeData().urls()]
+            if any(os.path.isdir(p) or p.lower().endswith('.dcm') for p in paths):
                 event.acceptProposedAction()
                 self.setStyleSheet("""
                     DropZone {
@@ -172,22 +329,22 @@ class DropZone(QFrame):
     def dropEvent(self, event: QDropEvent):
         self.dragLeaveEvent(None)
         
-        url = event.mimeData().urls()[0]
-        file_path = url.toLocalFile()
+        paths = [url.toLocalFile() for url in event.mimeData().urls()]
+        files = self.collect_dicom_files(paths)
         
-        if file_path.lower().endswith('.dcm'):
-            self.file_dropped.emit(file_path)
+        if files:
+            self.files_dropped.emit(files)
         else:
             QMessageBox.warning(self, "Hatalı Format", 
                 "Sadece DICOM (.dcm) dosyaları kabul edilir!")
     
     def mousePressEvent(self, event):
         """Tıklandığında dosya seçici aç"""
-        file_path, _ = QFileDialog.getOpenFileName(
-            self, "DICOM Dosyası Seç", "", "DICOM Files (*.dcm);;All Files (*)"
+        file_paths, _ = QFileDialog.getOpenFileNames(
+            self, "DICOM Dosyalarını Seç", "", "DICOM Files (*.dcm);;All Files (*)"
         )
-        if file_path:
-            self.file_dropped.emit(file_path)
+        if file_paths:
+            self.files_dropped.emit(file_paths)
 
 
 class MainWindow(QMainWindow):
@@ -197,8 +354,28 @@ class MainWindow(QMainWindow):
         super().__init__()
         self.setWindowTitle("LDCT Denoising - AI Görüntü İyileştirme")
         self.setMinimumSize(900, 700)
+        self.model_ready = False
+        self.model_loader = None
+        self.results = {}          # iş kimliği -> (low_dose, enhanced), yalnızca şeritteki işler
+        self.next_job_id = 0
+        self.jobs_total = 0
+        self.jobs_done = 0
+        self.follow_latest = True  # Kullanıcı küçük resim seçene kadar son sonucu göster
+        self.first_paint_ms = None
+        
+        self.worker = InferenceWorker()
+        self.worker.result_ready.connect(self.on_result_ready)
+        self.worker.job_failed.connect(self.on_job_failed)
+        self.worker.job_cancelled.connect(self.on_job_cancelled)
+        
         self.setup_ui()
         self.load_model_on_start()
+    
+    def paintEvent(self, event):
+        super().paintEvent(event)
+        if self.first_paint_ms is None:
+            self.first_paint_ms = (time.perf_counter() - STARTUP_TIME) * 1000
+            print(f"İlk çizim: {self.first_paint_ms:.0f} ms (başlangıçtan)")
         
     def setup_ui(self):
         # Ana widget
@@ -224,7 +401,7 @@ class MainWindow(QMainWindow):
         
         # Drop zone
         self.drop_zone = DropZone()
-        self.drop_zone.file_dropped.connect(self.process_file)
+        self.drop_zone.files_dropped.connect(self.process_files)
         layout.addWidget(self.drop_zone)
         
         # Progress bar
@@ -243,8 +420,35 @@ class MainWindow(QMainWindow):
                 border-radius: 7px;
             }
         """)
-        self.progress_bar.setVisible(False)
-        layout.addWidget(self.progress_bar)
+        
+        # İptal butonu
+        self.cancel_button = QPushButton("✖ İptal")
+        self.cancel_button.setStyleSheet("""
+            QPushButton {
+                background: rgba(255, 107, 107, 0.1);
+                color: #ff6b6b;
+                border: 1px solid #ff6b6b;
+                border-radius: 8px;
+                padding: 4px 12px;
+                font-size: 12px;
+            }
+            QPushButton:hover {
+                background: rgba(255, 107, 107, 0.25);
+            }
+        """)
+        self.cancel_button.clicked.connect(self.cancel_jobs)
+        
+        progress_row = QHBoxLayout()
+        progress_row.addWidget(self.progress_bar, 1)
+        progress_row.addWidget(self.cancel_button)
+        layout.addLayout(progress_row)
+        self.set_progress_visible(False)
+        
+        # İşlenen dosyaların küçük resimleri
+        self.thumbnails = ThumbnailStrip()
+        self.thumbnails.thumbnail_clicked.connect(self.on_thumbnail_clicked)
+        self.thumbnails.setVisible(False)
+        layout.addWidget(self.thumbnails)
         
         # Görünüm modu seçici
         mode_container = self.create_mode_selector()
@@ -374,28 +578,41 @@ class MainWindow(QMainWindow):
         return footer
     
     def load_model_on_start(self):
-        """Başlangıçta modeli yükle"""
-        try:
-            if os.path.exists(MODEL_PATH):
-                success = load_model(MODEL_PATH)
-                if success:
-                    self.model_status.setText("✅ Model Hazır")
-                    self.model_status.setStyleSheet("""
-                        QLabel {
-                            color: #4ecdc4;
-                            font-size: 12px;
-                            background: rgba(78, 205, 196, 0.1);
-                            padding: 6px 12px;
-                            border-radius: 12px;
-                            border: 1px solid #4ecdc4;
-                        }
-                    """)
-                else:
-                    self.show_model_error("Model yüklenemedi")
-            else:
-                self.show_model_error(f"Model dosyası bulunamadı:\n{MODEL_PATH}")
-        except Exception as e:
-            self.show_model_error(str(e))
+        """Modeli arka planda yüklemeye başla (pencere beklemeden açılır)"""
+        self.model_loader = ModelLoaderThread(MODEL_PATH)
+        self.model_loader.progress.connect(self.on_model_progress)
+        self.model_loader.finished.connect(self.on_model_loaded)
+        self.model_loader.start()
+    
+    def on_model_progress(self, value: int, message: str):
+        """Model yükleme ilerlemesini durum etiketinde göster"""
+        self.model_status.setText(f"⏳ {message}... %{value}")
+    
+    def on_model_loaded(self, success: bool, message: str):
+        """Model yüklendiğinde veya yükleme başarısız olduğunda"""
+        ready_ms = (time.perf_counter() - STARTUP_TIME) * 1000
+        if not success:
+            self.worker.cancel()
+            self.show_model_error(message)
+            return
+        
+        print(f"Model hazır: {ready_ms:.0f} ms (başlangıçtan)")
+        self.model_ready = True
+        self.worker.cache = self.model_loader.result_cache
+        self.model_status.setText("✅ Model Hazır")
+        self.model_status.setStyleSheet("""
+            QLabel {
+                color: #4ecdc4;
+                font-size: 12px;
+                background: rgba(78, 205, 196, 0.1);
+                padding: 6px 12px;
+                border-radius: 12px;
+                border: 1px solid #4ecdc4;
+            }
+        """)
+        # Yükleme sırasında bırakılan dosyalar zaten kuyrukta
+        self.worker.start()
+        self.update_progress()
     
     def show_model_error(self, message: str):
         """Model hata durumu göster"""
@@ -418,38 +635,95 @@ class MainWindow(QMainWindow):
         self.btn_slider.setChecked(mode == "slider")
         self.comparison.set_mode(mode)
     
-    def process_file(self, file_path: str):
-        """DICOM dosyasını işle"""
-        # Model kontrolü
-        model = get_model()
-        if not model.is_loaded:
+    def process_files(self, file_paths: list):
+        """DICOM dosyalarını kuyruğa ekle (model yüklenirken de kabul edilir)"""
+        if not self.model_ready and not self.model_loader.isRunning():
             QMessageBox.warning(self, "Uyarı", "Model henüz yüklenmedi!")
             return
         
-        # Progress bar göster
-        self.progress_bar.setVisible(True)
-        self.progress_bar.setValue(0)
-        
-        # Drop zone'u gizle
+        # Drop zone'u küçült
         self.drop_zone.setMinimumHeight(80)
+        self.thumbnails.setVisible(True)
+        self.follow_latest = True
+        
+        for file_path in file_paths:
+            job_id = self.next_job_id
+            self.next_job_id += 1
+            # Şeritten düşen eski işlerin görüntüleri bellekten atılır
+            for evicted_id in self.thumbnails.add_item(job_id, os.path.basename(file_path)):
+                self.results.pop(evicted_id, None)
+            self.worker.submit(job_id, file_path)
+        self.jobs_total += len(file_paths)
+        self.update_progress()
+    
+    def set_progress_visible(self, visible: bool):
+        self.progress_bar.setVisible(visible)
+        self.cancel_button.setVisible(visible)
+    
+    def update_progress(self):
+        """Kuyruk ilerlemesini göster; tüm işler bitince sayaçları sıfırla"""
+        if self.jobs_done >= self.jobs_total:
+            self.jobs_total = self.jobs_done = 0
+            self.set_progress_visible(False)
+            return
         
-        # Thread başlat
-        self.processing_thread = ProcessingThread(file_path)
-        self.processing_thread.progress.connect(self.progress_bar.setValue)
-        self.processing_thread.finished.connect(self.on_processing_finished)
-        self.processing_thread.error.connect(self.on_processing_error)
-        self.processing_thread.start()
+        self.set_progress_visible(True)
+        self.progress_bar.setMaximum(self.jobs_total)
+        self.progress_bar.setValue(self.jobs_done)
+        if self.model_ready:
+            self.progress_bar.setFormat(f"{self.jobs_done} / {self.jobs_total} dosya")
+        else:
+            self.progress_bar.setFormat(f"Model bekleniyor ({self.jobs_total} dosya sırada)")
     
-    def on_processing_finished(self, low_dose: np.ndarray, enhanced: np.ndarray):
-        """İşleme tamamlandığında"""
-        self.progress_bar.setVisible(False)
+    def show_result(self, job_id: int):
+        low_dose, enhanced = self.results[job_id]
         self.comparison.setVisible(True)
         self.comparison.set_images(low_dose, enhanced)
+        self.thumbnails.select(job_id)
+    
+    def on_result_ready(self, job_id: int, low_dose: np.ndarray, enhanced: np.ndarray,
+                        seconds: float, cached: bool):
+        """Bir dosyanın sonucu hazır olduğunda"""
+        # Küçük resmi şeritten kaldırılmış işin sonucu saklanmaz
+        if job_id in self.thumbnails:
+            self.results[job_id] = (low_dose, enhanced)
+            caption = "önbellek" if cached else f"{seconds * 1000:.0f} ms"
+            self.thumbnails.set_result(job_id, enhanced, caption)
+            if self.follow_latest:
+                self.show_result(job_id)
+        self.jobs_done += 1
+        self.update_progress()
+    
+    def on_job_failed(self, job_id: int, error_message: str):
+        """Bir dosya işlenemediğinde (kuyruk devam eder)"""
+        self.thumbnails.set_status(job_id, "⚠️", "hata", error_message)
+        print(f"İşleme hatası: {error_message}")
+        self.jobs_done += 1
+        self.update_progress()
+    
+    def on_job_cancelled(self, job_id: int):
+        self.thumbnails.set_status(job_id, "✖", "iptal")
+        self.jobs_done += 1
+        self.update_progress()
+    
+    def on_thumbnail_clicked(self, job_id: int):
+        if job_id in self.results:
+            self.follow_latest = False
+            self.show_result(job_id)
+    
+    def cancel_jobs(self):
+        """Kuyruktaki tüm işleri iptal et"""
+        self.worker.cancel()
     
-    def on_processing_error(self, error_message: str):
-        """Hata durumunda"""
-        self.progress_bar.setVisible(False)
-        QMessageBox.critical(self, "İşleme Hatası", error_message)
+    def closeEvent(self, event):
+        """Pencere kapanırken worker'ı durdur ve model yüklemesinin bitmesini bekle"""
+        self.worker.stop()
+        if self.worker.isRunning():
+            self.worker.wait()
+        # Çalışan bir QThread yok edilirse Qt süreci sonlandırır
+        if self.model_loader is not None and self.model_loader.isRunning():
+            self.model_loader.wait()
+        super().closeEvent(event)
 
 
 def main():
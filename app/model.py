@@ -1,78 +1,145 @@
 """
 LDCT Denoising - Model Module
 Generator model yükleme ve inference.
+
+TensorFlow modül importunda değil, bir model ilk kez oluşturulduğunda veya
+yüklendiğinde içe aktarılır; böylece bu modülü import eden GUI ve CLI
+araçları TensorFlow'un import maliyetini yalnızca gerçekten gerektiğinde öder.
 """
 
 import os
+import time
 import numpy as np
 
-try:
-    os.environ['TF_CPP_MIN_LOG_LEVEL'] = '2'  # TensorFlow loglarını azalt
-    import tensorflow as tf
-    from tensorflow import keras
-    from tensorflow.keras import layers
-except ImportError:
-    tf = None
-    keras = None
-    layers = None
+from tiling import denoise_tiled, DEFAULT_OVERLAP, DEFAULT_TILE_BATCH
+
+# _import_tensorflow() ilk çağrıldığında doldurulur
+tf = None
+keras = None
+layers = None
 
 
 # Model sabitleri
 IMG_WIDTH = 256
 IMG_HEIGHT = 256
 CHANNELS = 1
+# 8 stride-2 encoder katmanının skip bağlantılarıyla hizalanması için girdi
+# boyutu bu değerin katı olmalı (256 -> 1x1 darboğaz)
+GENERATOR_STRIDE = 256
+
+# BatchNorm katlama sabitleri
+FOLDED_SUFFIX = '_folded.weights.h5'
+FOLD_TOLERANCE = 1e-3  # tanh çıktısında izin verilen maksimum mutlak fark
+
+# Quantization sabitleri
+QUANTIZATION_SUFFIXES = {
+    'float16': '_fp16.tflite',
+    'int8': '_int8.tflite',  # Dynamic-range int8 (ağırlıklar int8, aktivasyonlar float)
+}
+QUANT_MIN_PSNR = 40.0  # float32 çıktıya göre kabul edilen minimum PSNR (dB)
+QUANT_MIN_SSIM = 0.98  # float32 çıktıya göre kabul edilen minimum SSIM
 
+# Gecikme ölçümünde kullanılan tekrar sayısı
+LATENCY_RUNS = 3
 
-def downsample(filters, size, apply_batchnorm=True):
-    """Encoder katmanı"""
+# Batch inference sabitleri
+DEFAULT_MEMORY_BUDGET_MB = 1024  # Micro-batch başına ayrılan yaklaşık bellek
+MAX_BATCH_SIZE = 64
+
+
+def _import_tensorflow():
+    """TensorFlow'u ilk kullanımda içe aktarır ve modül genelindeki adlara bağlar"""
+    global tf, keras, layers
+    if tf is None:
+        os.environ['TF_CPP_MIN_LOG_LEVEL'] = '2'  # TensorFlow loglarını azalt
+        try:
+            import tensorflow
+        except ImportError:
+            raise ImportError("TensorFlow yüklü değil. 'pip install tensorflow' komutunu çalıştırın.")
+        tf = tensorflow
+        keras = tensorflow.keras
+        layers = tensorflow.keras.layers
+    return tf
+
+
+def downsample(filters, size, apply_batchnorm=True, inference=False):
+    """
+    Encoder katmanı
+    
+    inference=True ise BatchNorm katmanı eklenmez; conv bias'ı katlanmış
+    BatchNorm parametrelerini taşır.
+    """
+    _import_tensorflow()
     initializer = tf.random_normal_initializer(0., 0.02)
     result = keras.Sequential()
     result.add(layers.Conv2D(filters, size, strides=2, padding='same',
-                             kernel_initializer=initializer, use_bias=False))
-    if apply_batchnorm:
+                             kernel_initializer=initializer, use_bias=inference))
+    if apply_batchnorm and not inference:
         result.add(layers.BatchNormalization())
     result.add(layers.LeakyReLU())
     return result
 
 
-def upsample(filters, size, apply_dropout=False):
-    """Decoder katmanı"""
+def upsample(filters, size, apply_dropout=False, inference=False):
+    """
+    Decoder katmanı
+    
+    inference=True ise BatchNorm ve Dropout katmanları eklenmez.
+    """
+    _import_tensorflow()
     initializer = tf.random_normal_initializer(0., 0.02)
     result = keras.Sequential()
     result.add(layers.Conv2DTranspose(filters, size, strides=2, padding='same',
-                                      kernel_initializer=initializer, use_bias=False))
-    result.add(layers.BatchNormalization())
-    if apply_dropout:
-        result.add(layers.Dropout(0.5))
+                                      kernel_initializer=initializer, use_bias=inference))
+    if not inference:
+        result.add(layers.BatchNormalization())
+        if apply_dropout:
+            result.add(layers.Dropout(0.5))
     result.add(layers.ReLU())
     return result
 
 
-def build_generator():
-    """U-Net Generator mimarisini oluşturur"""
-    inputs = layers.Input(shape=[IMG_WIDTH, IMG_HEIGHT, CHANNELS])
+def build_generator(inference=False, height=IMG_HEIGHT, width=IMG_WIDTH):
+    """
+    U-Net Generator mimarisini oluşturur
+    
+    Ağ tamamen konvolüsyoneldir; ağırlıklar girdi boyutundan bağımsız olduğu
+    için 256x256 ile eğitilmiş ağırlıklar (G_epoch_50.h5) 512x512 gibi daha
+    büyük girdiler için kurulan modele de yüklenebilir.
+    
+    Args:
+        inference: True ise BatchNorm/Dropout içermeyen, katlanmış ağırlıklar
+                   için optimize edilmiş inference mimarisi oluşturulur
+        height: Girdi yüksekliği (GENERATOR_STRIDE'ın katı olmalı)
+        width: Girdi genişliği (GENERATOR_STRIDE'ın katı olmalı)
+    """
+    if height % GENERATOR_STRIDE or width % GENERATOR_STRIDE or height <= 0 or width <= 0:
+        raise ValueError(f"Girdi boyutu {GENERATOR_STRIDE}'nın katı olmalı: {height}x{width}")
+    
+    _import_tensorflow()
+    inputs = layers.Input(shape=[height, width, CHANNELS])
     
     # Encoder
     down_stack = [
-        downsample(64, 4, apply_batchnorm=False),  # (bs, 128, 128, 64)
-        downsample(128, 4),  # (bs, 64, 64, 128)
-        downsample(256, 4),  # (bs, 32, 32, 256)
-        downsample(512, 4),  # (bs, 16, 16, 512)
-        downsample(512, 4),  # (bs, 8, 8, 512)
-        downsample(512, 4),  # (bs, 4, 4, 512)
-        downsample(512, 4),  # (bs, 2, 2, 512)
-        downsample(512, 4),  # (bs, 1, 1, 512)
+        downsample(64, 4, apply_batchnorm=False, inference=inference),  # (bs, 128, 128, 64)
+        downsample(128, 4, inference=inference),  # (bs, 64, 64, 128)
+        downsample(256, 4, inference=inference),  # (bs, 32, 32, 256)
+        downsample(512, 4, inference=inference),  # (bs, 16, 16, 512)
+        downsample(512, 4, inference=inference),  # (bs, 8, 8, 512)
+        downsample(512, 4, inference=inference),  # (bs, 4, 4, 512)
+        downsample(512, 4, inference=inference),  # (bs, 2, 2, 512)
+        downsample(512, 4, inference=inference),  # (bs, 1, 1, 512)
     ]
     
     # Decoder
     up_stack = [
-        upsample(512, 4, apply_dropout=True),
-        upsample(512, 4, apply_dropout=True),
-        upsample(512, 4, apply_dropout=True),
-        upsample(512, 4),
-        upsample(256, 4),
-        upsample(128, 4),
-        upsample(64, 4),
+        upsample(512, 4, apply_dropout=True, inference=inference),
+        upsample(512, 4, apply_dropout=True, inference=inference),
+        upsample(512, 4, apply_dropout=True, inference=inference),
+        upsample(512, 4, inference=inference),
+        upsample(256, 4, inference=inference),
+        upsample(128, 4, inference=inference),
+        upsample(64, 4, inference=inference),
     ]
     
     initializer = tf.random_normal_initializer(0., 0.02)
@@ -95,32 +162,348 @@ def build_generator():
     return keras.Model(inputs=inputs, outputs=x)
 
 
+def fold_batchnorm(generator):
+    """
+    Eğitilmiş generator'daki BatchNorm katmanlarını önceki conv kernel'ine katlar.
+    
+    Inference'ta BatchNorm sabit bir afin dönüşümdür:
+        y = gamma * (conv(x) - mean) / sqrt(var + eps) + beta
+    Bu dönüşüm conv kernel'inin çıkış kanallarına ölçek, bias'ına da kaydırma
+    olarak gömülür. Dropout inference'ta zaten etkisiz olduğu için atılır.
+    
+    Args:
+        generator: build_generator() ile oluşturulmuş, ağırlıkları yüklü model
+        
+    Returns:
+        keras.Model: build_generator(inference=True) mimarisinde katlanmış model
+    """
+    height, width = generator.input_shape[1:3]
+    folded = build_generator(inference=True, height=height, width=width)
+    
+    src_blocks = [l for l in generator.layers if isinstance(l, keras.Sequential)]
+    dst_blocks = [l for l in folded.layers if isinstance(l, keras.Sequential)]
+    
+    for src, dst in zip(src_blocks, dst_blocks):
+        conv = src.layers[0]
+        kernel = conv.get_weights()[0]
+        # Conv2D kernel: (kh, kw, in, out) / Conv2DTranspose kernel: (kh, kw, out, in)
+        out_axis = 2 if isinstance(conv, layers.Conv2DTranspose) else 3
+        
+        bn = next((l for l in src.layers if isinstance(l, layers.BatchNormalization)), None)
+        if bn is None:
+            bias = np.zeros(kernel.shape[out_axis], dtype=np.float32)
+        else:
+            gamma, beta, mean, var = bn.get_weights()
+            scale = gamma / np.sqrt(var + bn.epsilon)
+            shape = [1, 1, 1, 1]
+            shape[out_axis] = -1
+            kernel = kernel * scale.reshape(shape)
+            bias = beta - mean * scale
+        
+        dst.layers[0].set_weights([kernel.astype(np.float32), bias.astype(np.float32)])
+    
+    # Son Conv2DTranspose (tanh) katmanında BatchNorm yok, aynen kopyalanır
+    folded.layers[-1].set_weights(generator.layers[-1].get_weights())
+    return folded
+
+
+def check_folded_equivalence(generator, folded, samples: np.ndarray = None,
+                             atol: float = FOLD_TOLERANCE) -> tuple:
+    """
+    Katlanmış modelin orijinal generator ile sayısal eşdeğerliğini kontrol eder.
+    
+    Args:
+        generator: Orijinal generator
+        folded: fold_batchnorm() çıktısı
+        samples: (N, 256, 256, 1) normalized kesitler; None ise rastgele girdi
+        atol: İzin verilen maksimum mutlak fark
+        
+    Returns:
+        tuple: (eşdeğer_mi, maksimum_mutlak_fark)
+    """
+    if samples is None:
+        rng = np.random.default_rng(0)
+        samples = rng.uniform(-1, 1, (2,) + tuple(generator.input_shape[1:]))
+    samples = _as_model_batch(samples)
+    
+    expected = generator(samples, training=False).numpy()
+    actual = folded(samples, training=False).numpy()
+    max_diff = float(np.max(np.abs(expected - actual)))
+    return max_diff <= atol, max_diff
+
+
+def folded_weights_path(weights_path: str) -> str:
+    """Orijinal ağırlık dosyası için katlanmış ağırlık dosyasının yolunu döndürür"""
+    base = weights_path
+    for ext in ('.weights.h5', '.h5'):
+        if base.endswith(ext):
+            base = base[:-len(ext)]
+            break
+    return base + FOLDED_SUFFIX
+
+
+def export_inference_generator(weights_path: str, output_path: str = None,
+                               samples: np.ndarray = None) -> str:
+    """
+    Optimize edilmiş (BatchNorm katlanmış, Dropout'suz) inference modelini kaydeder.
+    
+    Args:
+        weights_path: Orijinal generator .h5 dosyası
+        output_path: Kayıt yolu; None ise '<isim>_folded.weights.h5'
+        samples: Eşdeğerlik kontrolünde kullanılacak normalized kesitler
+        
+    Returns:
+        str: Kaydedilen dosyanın yolu
+    """
+    _import_tensorflow()
+    
+    generator = build_generator()
+    generator.load_weights(weights_path)
+    folded = fold_batchnorm(generator)
+    
+    ok, max_diff = check_folded_equivalence(generator, folded, samples)
+    if not ok:
+        raise RuntimeError(f"Katlanmış model orijinalden sapıyor (max fark: {max_diff:.2e})")
+    
+    if output_path is None:
+        output_path = folded_weights_path(weights_path)
+    folded.save_weights(output_path)
+    print(f"Optimize inference modeli kaydedildi: {output_path} (max fark: {max_diff:.2e})")
+    return output_path
+
+
+def _tflite_interpreter(model_path: str):
+    """TFLite interpreter'ı oluşturur (varsa LiteRT, yoksa tf.lite)"""
+    try:
+        from ai_edge_litert.interpreter import Interpreter
+    except ImportError:
+        Interpreter = _import_tensorflow().lite.Interpreter
+    return Interpreter(model_path=model_path, num_threads=os.cpu_count())
+
+
+class TFLiteGenerator:
+    """Quantize edilmiş generator'ı generator ile aynı arayüzle çalıştırır"""
+    
+    def __init__(self, model_path: str):
+        self.model_path = model_path
+        self.interpreter = _tflite_interpreter(model_path)
+        self._input = self.interpreter.get_input_details()[0]['index']
+        self._output = self.interpreter.get_output_details()[0]['index']
+        self._batch_size = None
+    
+    def __call__(self, batch: np.ndarray) -> np.ndarray:
+        batch = np.ascontiguousarray(batch, dtype=np.float32)
+        # Batch boyutu değiştiğinde tensörler yeniden ayrılır
+        if batch.shape[0] != self._batch_size:
+            self.interpreter.resize_tensor_input(self._input, list(batch.shape))
+            self.interpreter.allocate_tensors()
+            self._batch_size = batch.shape[0]
+        self.interpreter.set_tensor(self._input, batch)
+        self.interpreter.invoke()
+        return self.interpreter.get_tensor(self._output).copy()
+
+
+def convert_to_tflite(generator, mode: str) -> bytes:
+    """
+    Generator'ı post-training quantization ile TFLite modeline çevirir.
+    
+    Args:
+        generator: Ağırlıkları yüklü generator (tercihen fold_batchnorm() çıktısı)
+        mode: 'float16' veya 'int8' (dynamic-range)
+        
+    Returns:
+        bytes: Serileştirilmiş TFLite modeli
+    """
+    if mode not in QUANTIZATION_SUFFIXES:
+        raise ValueError(f"Bilinmeyen quantization modu: {mode}")
+    
+    _import_tensorflow()
+    converter = tf.lite.TFLiteConverter.from_keras_model(generator)
+    converter.optimizations = [tf.lite.Optimize.DEFAULT]
+    if mode == 'float16':
+        converter.target_spec.supported_types = [tf.float16]
+    return converter.convert()
+
+
+def quantized_weights_path(weights_path: str, mode: str, output_dir: str = None) -> str:
+    """Orijinal ağırlık dosyası için quantize model dosyasının yolunu döndürür"""
+    base = folded_weights_path(weights_path)[:-len(FOLDED_SUFFIX)]
+    if output_dir is not None:
+        base = os.path.join(output_dir, os.path.basename(base))
+    return base + QUANTIZATION_SUFFIXES[mode]
+
+
+def quantize_generator(weights_path: str, calibration_slices: np.ndarray,
+                       output_dir: str = None, modes=tuple(QUANTIZATION_SUFFIXES)) -> dict:
+    """
+    float16 ve int8 quantize generator varyantlarını üretir ve doğrular.
+    
+    Her varyant kalibrasyon kesitleri üzerinde çalıştırılır ve çıktıları
+    float32 modelin çıktısıyla PSNR/SSIM üzerinden karşılaştırılır
+    (notebook'lardaki gibi [-1, 1] aralığı, max_val=2.0).
+    
+    Args:
+        weights_path: LDCTModel.load_weights'in kullandığı .h5 dosyası
+        calibration_slices: preprocess_dicom ile hazırlanmış (N, 256, 256, 1) kesitler
+        output_dir: Kayıt klasörü; None ise ağırlık dosyasının yanına yazılır
+        modes: Üretilecek varyantlar
+        
+    Returns:
+        dict: Her mod için {'path', 'size_mb', 'psnr', 'ssim', 'latency_ms', 'passed'}
+    """
+    _import_tensorflow()
+    
+    calibration_slices = _as_model_batch(calibration_slices)
+    
+    generator = build_generator()
+    generator.load_weights(weights_path)
+    folded = fold_batchnorm(generator)
+    reference = generator(calibration_slices, training=False).numpy()
+    
+    report = {}
+    for mode in modes:
+        output_path = quantized_weights_path(weights_path, mode, output_dir)
+        with open(output_path, 'wb') as f:
+            f.write(convert_to_tflite(folded, mode))
+        
+        runner = TFLiteGenerator(output_path)
+        outputs = np.concatenate([runner(calibration_slices[i:i + 1])
+                                  for i in range(len(calibration_slices))])
+        latency_ms = _median_latency_ms(runner, calibration_slices[:1])
+        
+        psnr = float(np.mean(tf.image.psnr(reference, outputs, max_val=2.0).numpy()))
+        ssim = float(np.mean(tf.image.ssim(reference, outputs, max_val=2.0).numpy()))
+        report[mode] = {
+            'path': output_path,
+            'size_mb': os.path.getsize(output_path) / (1024 * 1024),
+            'psnr': psnr,
+            'ssim': ssim,
+            'latency_ms': latency_ms,
+            'passed': psnr >= QUANT_MIN_PSNR and ssim >= QUANT_MIN_SSIM,
+        }
+    
+    print(f"Quantization raporu (float32 referans, {len(calibration_slices)} kesit):")
+    for mode, r in report.items():
+        status = "✅" if r['passed'] else "❌"
+        print(f"  {status} {mode:8s} {r['size_mb']:7.1f} MB  PSNR {r['psnr']:.2f} dB  "
+              f"SSIM {r['ssim']:.4f}  {r['latency_ms']:.1f} ms/kesit")
+    return report
+
+
+def estimate_slice_memory(height: int = IMG_HEIGHT, width: int = IMG_WIDTH) -> int:
+    """
+    Tek bir kesitin generator'dan geçerken kullandığı yaklaşık belleği hesaplar.
+    
+    Encoder aktivasyonları, aynı boyuttaki decoder aktivasyonları ve skip
+    concatenation kopyaları toplanır; BatchNorm/aktivasyon ara tensörleri için
+    3 katı alınır.
+    
+    Returns:
+        int: Byte cinsinden tahmini bellek
+    """
+    filters = [64, 128, 256, 512, 512, 512, 512, 512]
+    encoder_floats = 0
+    h, w = height, width
+    for f in filters:
+        h, w = max(h // 2, 1), max(w // 2, 1)
+        encoder_floats += h * w * f
+    
+    # Decoder + concat kopyaları encoder'ın yaklaşık iki katı
+    total_floats = encoder_floats * 3 + height * width * CHANNELS
+    return total_floats * 4 * 3
+
+
+def batch_size_for_budget(memory_budget_mb: float = DEFAULT_MEMORY_BUDGET_MB,
+                          height: int = IMG_HEIGHT, width: int = IMG_WIDTH) -> int:
+    """Bellek bütçesine sığan micro-batch boyutunu döndürür"""
+    per_slice = estimate_slice_memory(height, width)
+    batch_size = int(memory_budget_mb * 1024 * 1024 // per_slice)
+    return max(1, min(batch_size, MAX_BATCH_SIZE))
+
+
+def _as_model_batch(images: np.ndarray) -> np.ndarray:
+    """(H, W), (N, H, W) veya (N, H, W, 1) girdiyi (N, H, W, 1) float32'ye çevirir"""
+    images = np.asarray(images, dtype=np.float32)
+    if images.ndim == 2:
+        images = images[np.newaxis, ..., np.newaxis]
+    elif images.ndim == 3:
+        images = images[..., np.newaxis]
+    if images.ndim != 4 or images.shape[-1] != CHANNELS:
+        raise ValueError(f"Beklenmeyen girdi boyutu: {images.shape}")
+    return images
+
+
+def _median_latency_ms(fn, sample, runs: int = LATENCY_RUNS) -> float:
+    """Bir inference fonksiyonunun çağrı başına medyan gecikmesini ölçer"""
+    timings = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        np.asarray(fn(sample))
+        timings.append((time.perf_counter() - start) * 1000)
+    return float(np.median(timings))
+
+
 class LDCTModel:
     """LDCT Denoising Generator Model"""
     
-    def __init__(self):
+    def __init__(self, input_size: tuple = (IMG_HEIGHT, IMG_WIDTH)):
+        """
+        Args:
+            input_size: (yükseklik, genişlik); 256'nın katı olan herhangi bir
+                        boyut (ör. doğal çözünürlük için (512, 512))
+        """
+        self.input_size = tuple(input_size)
         self.generator = None
         self.is_loaded = False
+        self.variant = None
+        self._infer_fn = None
+        self.latency_report = {}
         
-    def load_weights(self, weights_path: str) -> bool:
+    def load_weights(self, weights_path: str, warmup: bool = True,
+                     optimize: bool = False) -> bool:
         """
         Model ağırlıklarını yükler.
         
         Args:
-            weights_path: .h5 dosya yolu
+            weights_path: .h5 dosya yolu ('_folded.weights.h5' ile bitiyorsa
+                          optimize inference modeli, '.tflite' ise
+                          quantize_generator() ile üretilmiş varyant yüklenir)
+            warmup: True ise graph-mode fonksiyon izlenir (trace) ve
+                    eager/derlenmiş gecikmeler ölçülür
+            optimize: True ise yüklenen generator'ın BatchNorm katmanları
+                      conv'lara katlanır
             
         Returns:
             bool: Başarılı ise True
         """
-        if tf is None:
-            raise ImportError("TensorFlow yüklü değil. 'pip install tensorflow' komutunu çalıştırın.")
+        _import_tensorflow()
         
         try:
+            if weights_path.endswith('.tflite'):
+                self._load_tflite(weights_path, warmup=warmup)
+                self.is_loaded = True
+                print(f"Model başarıyla yüklendi: {weights_path}")
+                return True
+            
             # Generator oluştur
-            self.generator = build_generator()
+            is_folded = weights_path.endswith(FOLDED_SUFFIX)
+            self.variant = 'folded' if is_folded else 'float32'
+            self.generator = build_generator(inference=is_folded, height=self.input_size[0],
+                                             width=self.input_size[1])
             
             # Ağırlıkları yükle
             self.generator.load_weights(weights_path)
+            
+            if optimize and not is_folded:
+                folded = fold_batchnorm(self.generator)
+                ok, max_diff = check_folded_equivalence(self.generator, folded)
+                if ok:
+                    self.generator = folded
+                    self.variant = 'folded'
+                else:
+                    print(f"BatchNorm katlama atlandı (max fark: {max_diff:.2e})")
+            
+            self._build_inference_fn(warmup=warmup)
             self.is_loaded = True
             print(f"Model başarıyla yüklendi: {weights_path}")
             return True
@@ -140,12 +523,137 @@ class LDCTModel:
         Returns:
             numpy array: (1, 256, 256, 1) shape'inde model çıktısı
         """
+        return self.predict_batch(input_image)
+    
+    def predict_batch(self, images, memory_budget_mb: float = DEFAULT_MEMORY_BUDGET_MB,
+                      batch_size: int = None) -> np.ndarray:
+        """
+        Çok kesitli bir yığın üzerinde micro-batch'ler halinde inference yapar.
+        
+        Args:
+            images: (N, H, W[, 1]) shape'inde normalized yığın veya
+                    (H, W[, 1]) kesitler üreten bir iterator; (H, W) model
+                    girdi boyutudur (varsayılan 256x256)
+            memory_budget_mb: Micro-batch boyutunu belirleyen bellek bütçesi
+            batch_size: Verilirse bellek bütçesi yerine bu boyut kullanılır
+            
+        Returns:
+            numpy array: (N, H, W, 1) shape'inde, girdi sırasıyla model çıktısı
+        """
         if not self.is_loaded:
             raise RuntimeError("Model henüz yüklenmedi!")
         
-        # Inference
-        output = self.generator(input_image, training=False)
+        if batch_size is None:
+            batch_size = batch_size_for_budget(memory_budget_mb, *self.input_size)
+        
+        if isinstance(images, np.ndarray):
+            images = _as_model_batch(images)
+            outputs = np.empty_like(images)
+            for start in range(0, len(images), batch_size):
+                batch = images[start:start + batch_size]
+                outputs[start:start + len(batch)] = self._run(batch)
+            return outputs
         
+        # Iterator: kesitleri batch boyutuna kadar biriktir
+        outputs = []
+        pending = []
+        for image in images:
+            pending.append(_as_model_batch(image)[0])
+            if len(pending) == batch_size:
+                outputs.append(self._run(np.stack(pending)))
+                pending = []
+        if pending:
+            outputs.append(self._run(np.stack(pending)))
+        
+        if not outputs:
+            return np.empty((0,) + self.input_size + (CHANNELS,), dtype=np.float32)
+        return np.concatenate(outputs, axis=0)
+    
+    def predict_tiled(self, image: np.ndarray, overlap: int = DEFAULT_OVERLAP,
+                      batch_size: int = DEFAULT_TILE_BATCH) -> np.ndarray:
+        """
+        Doğal çözünürlüklü (ör. 512x512) kesit üzerinde tiled inference yapar.
+        
+        Args:
+            image: (H, W) normalized kesit (preprocess_dicom_native çıktısı)
+            overlap: Komşu parçaların örtüşme genişliği (parça boyutu model
+                     girdi boyutudur)
+            batch_size: Generator'a bir kerede verilen parça sayısı
+            
+        Returns:
+            numpy array: (H, W) [-1, 1] aralığında model çıktısı
+        """
+        return denoise_tiled(image, lambda tiles: self.predict_batch(tiles, batch_size=batch_size),
+                             tile_size=self.input_size, overlap=overlap,
+                             batch_size=batch_size)
+    
+    def _build_inference_fn(self, warmup: bool = True):
+        """
+        Sabit input signature'lı graph-mode inference fonksiyonunu oluşturur.
+        
+        Batch boyutu serbest bırakılır, böylece her micro-batch boyutu için
+        yeniden trace yapılmaz. Warm-up çağrısı tracing maliyetini yükleme
+        sırasında öder; ilk gerçek kesit yavaş kalmaz.
+        """
+        _import_tensorflow()
+        generator = self.generator
+        
+        @tf.function(input_signature=[
+            tf.TensorSpec(shape=[None, *self.input_size, CHANNELS], dtype=tf.float32)
+        ])
+        def infer(batch):
+            return generator(batch, training=False)
+        
+        self._infer_fn = infer
+        self.latency_report = {}
+        if not warmup:
+            return
+        
+        sample = np.zeros((1,) + self.input_size + (CHANNELS,), dtype=np.float32)
+        
+        # Eager gecikme (ilk çağrının kurulum maliyeti hariç)
+        generator(sample, training=False)
+        eager_ms = _median_latency_ms(lambda x: generator(x, training=False), sample)
+        
+        # Tracing + ilk derlenmiş çağrı
+        start = time.perf_counter()
+        np.asarray(infer(sample))
+        trace_ms = (time.perf_counter() - start) * 1000
+        
+        compiled_ms = _median_latency_ms(infer, sample)
+        
+        self.latency_report = {
+            'eager_ms': eager_ms,
+            'trace_ms': trace_ms,
+            'compiled_ms': compiled_ms,
+        }
+        print(f"Inference gecikmesi: eager {eager_ms:.1f} ms -> "
+              f"derlenmiş {compiled_ms:.1f} ms (trace {trace_ms:.1f} ms)")
+    
+    def _load_tflite(self, model_path: str, warmup: bool = True):
+        """quantize_generator() ile üretilmiş float16/int8 varyantını yükler"""
+        self.generator = None
+        self.variant = next((mode for mode, suffix in QUANTIZATION_SUFFIXES.items()
+                             if model_path.endswith(suffix)), 'tflite')
+        self._infer_fn = TFLiteGenerator(model_path)
+        self.latency_report = {}
+        if not warmup:
+            return
+        
+        sample = np.zeros((1,) + self.input_size + (CHANNELS,), dtype=np.float32)
+        self._infer_fn(sample)
+        self.latency_report = {'compiled_ms': _median_latency_ms(self._infer_fn, sample)}
+        print(f"Inference gecikmesi ({self.variant}): "
+              f"{self.latency_report['compiled_ms']:.1f} ms")
+    
+    def _run(self, batch: np.ndarray) -> np.ndarray:
+        """Tek bir micro-batch'i generator'dan geçirir"""
+        if isinstance(self._infer_fn, TFLiteGenerator):
+            return self._infer_fn(batch)
+        if self._infer_fn is None:
+            output = self.generator(batch, training=False)
+        else:
+            output = self._infer_fn(tf.convert_to_tensor(batch))
         return output.numpy()
 
 
@@ -171,3 +679,18 @@ def predict(input_image: np.ndarray) -> np.ndarray:
     """Inference yapar"""
     model = get_model()
     return model.predict(input_image)
+
+
+def predict_tiled(image: np.ndarray, overlap: int = DEFAULT_OVERLAP,
+                  batch_size: int = DEFAULT_TILE_BATCH) -> np.ndarray:
+    """Doğal çözünürlüklü kesit üzerinde tiled inference yapar"""
+    model = get_model()
+    return model.predict_tiled(image, overlap=overlap, batch_size=batch_size)
+
+
+def predict_batch(images, memory_budget_mb: float = DEFAULT_MEMORY_BUDGET_MB,
+                  batch_size: int = None) -> np.ndarray:
+    """Çok kesitli yığın üzerinde batch inference yapar"""
+    model = get_model()
+    return model.predict_batch(images, memory_budget_mb=memory_budget_mb,
+                               batch_size=batch_size)
@@ -0,0 +1,119 @@
+"""
+LDCT Denoising - Parallel Preprocessing Module
+DICOM ön işlemeyi process havuzuyla tüm çekirdeklere dağıtır.
+
+Worker'lar sonuçları pickle ile geri göndermez; her kesit doğrudan paylaşımlı
+bellekteki (shared memory) ortak çıktı dizisine yazılır. Ana process'e yalnızca
+hata bilgisi döner.
+"""
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory, util
+
+import numpy as np
+
+from preprocessing import hu_to_model_space, read_hu, IMG_SIZE
+
+try:
+    import pydicom
+except ImportError:
+    pydicom = None
+
+
+# Worker başına bir kerede gönderilen dosya sayısı
+DEFAULT_CHUNK_SIZE = 16
+
+# Worker process'te paylaşımlı belleğe bağlanan çıktı dizisi
+_worker_shm = None
+_worker_out = None
+
+
+def _init_worker(shm_name: str, shape: tuple):
+    """
+    Worker başlarken paylaşımlı bellek bloğuna bağlanır.
+
+    Worker kapanırken bağlantı kapatılır (close); bloğu yalnızca ana process
+    siler (unlink). Worker'lar os._exit ile çıktığından atexit çalışmaz,
+    multiprocessing'in çıkış finalizer'ı kullanılır.
+    """
+    global _worker_shm, _worker_out
+    _worker_shm = shared_memory.SharedMemory(name=shm_name)
+    _worker_out = np.ndarray(shape, dtype=np.float32, buffer=_worker_shm.buf)
+    util.Finalize(None, _close_worker, exitpriority=10)
+
+
+def _close_worker():
+    """Worker'ın paylaşımlı bellek bağlantısını kapatır"""
+    global _worker_shm, _worker_out
+    _worker_out = None  # Tampona bakan dizi kalırsa close() BufferError verir
+    if _worker_shm is not None:
+        _worker_shm.close()
+        _worker_shm = None
+
+
+def _process_chunk(chunk: list) -> list:
+    """
+    Bir grup dosyayı işler ve sonuçları paylaşımlı diziye yazar.
+
+    Args:
+        chunk: (indeks, dosya_yolu) listesi
+
+    Returns:
+        list: İşlenemeyen dosyalar için (indeks, hata_mesajı) listesi
+    """
+    failures = []
+    for index, file_path in chunk:
+        try:
+            dcm = pydicom.dcmread(file_path)
+            _worker_out[index] = hu_to_model_space(read_hu(dcm))
+        except Exception as e:
+            failures.append((index, str(e)))
+    return failures
+
+
+def preprocess_parallel(file_paths: list, num_workers: int = None,
+                        chunk_size: int = DEFAULT_CHUNK_SIZE) -> tuple:
+    """
+    DICOM dosyalarını process havuzunda paralel olarak model girdisine çevirir.
+
+    Args:
+        file_paths: DICOM dosya yolları
+        num_workers: Worker process sayısı; None ise çekirdek sayısı
+        chunk_size: Worker'a bir kerede gönderilen dosya sayısı
+
+    Returns:
+        tuple: ((N, 256, 256, 1) float32 model girdisi,
+                işlenemeyen dosyalar için (dosya_yolu, hata_mesajı) listesi)
+    """
+    if pydicom is None:
+        raise ImportError("pydicom kütüphanesi yüklü değil. 'pip install pydicom' komutunu çalıştırın.")
+
+    num_workers = num_workers or os.cpu_count()
+    shape = (len(file_paths), IMG_SIZE[1], IMG_SIZE[0])
+    if not file_paths:
+        return np.empty(shape + (1,), dtype=np.float32), []
+
+    nbytes = int(np.prod(shape)) * np.dtype(np.float32).itemsize
+    shm = shared_memory.SharedMemory(create=True, size=nbytes)
+    try:
+        shared = np.ndarray(shape, dtype=np.float32, buffer=shm.buf)
+        # Okunamayan kesitler hava (HU_MIN -> -1) olarak kalır
+        shared.fill(-1.0)
+
+        indexed = list(enumerate(file_paths))
+        chunks = [indexed[i:i + chunk_size] for i in range(0, len(indexed), chunk_size)]
+
+        failures = []
+        with ProcessPoolExecutor(max_workers=num_workers, initializer=_init_worker,
+                                 initargs=(shm.name, shape)) as executor:
+            for chunk_failures in executor.map(_process_chunk, chunks):
+                failures.extend((file_paths[i], message) for i, message in chunk_failures)
+
+        volume = shared[..., np.newaxis].copy()
+        del shared
+    finally:
+        shm.close()
+        shm.unlink()
+
+    return volume, failures
@@ -0,0 +1,213 @@
+"""
+LDCT Denoising - Pipeline Module
+DICOM decode, model inference ve yazma aşamalarını üst üste bindirir.
+
+Bir decoder havuzu sınırlı bir kuyruğu doldurur, tek bir inference tüketicisi
+kuyruktan batch'ler toplar ve bir yazıcı aşaması sonuçları boşaltır. Kuyruklar
+sınırlı olduğu için yavaş aşama hızlı olanı bekletir (back-pressure).
+"""
+
+import queue
+import threading
+import time
+
+import numpy as np
+
+
+# Pipeline sabitleri
+DEFAULT_DECODERS = 4
+DEFAULT_BATCH_SIZE = 8
+DEFAULT_QUEUE_SIZE = 32
+
+_END = object()  # Kuyruk sonu işareti
+
+
+class StageStats:
+    """Bir pipeline aşamasının işlediği kesit sayısı ve süre dağılımı"""
+
+    def __init__(self, name: str, workers: int = 1):
+        self.name = name
+        self.workers = workers
+        self.count = 0
+        self.busy = 0.0  # İş yaparken geçen süre
+        self.starved = 0.0  # Girdi beklerken geçen süre
+        self.blocked = 0.0  # Dolu çıkış kuyruğunda beklerken geçen süre
+        self._lock = threading.Lock()
+
+    def add(self, count: int = 0, busy: float = 0.0, starved: float = 0.0,
+            blocked: float = 0.0):
+        with self._lock:
+            self.count += count
+            self.busy += busy
+            self.starved += starved
+            self.blocked += blocked
+
+    def throughput(self) -> float:
+        """Meşgul süre başına kesit/s"""
+        return self.count / self.busy if self.busy > 0 else 0.0
+
+    def utilization(self, wall: float) -> float:
+        """Aşamanın toplam kapasitesinin ne kadarını iş yaparak geçirdiği"""
+        capacity = wall * self.workers
+        return self.busy / capacity if capacity > 0 else 0.0
+
+
+class PipelineReport:
+    """Pipeline çalıştırmasının aşama istatistikleri"""
+
+    def __init__(self, stages: list, wall: float, failures: list):
+        self.stages = stages
+        self.wall = wall
+        self.failures = failures
+
+    @property
+    def processed(self) -> int:
+        return self.stages[-1].count
+
+    def bottleneck(self) -> str:
+        """En yüksek kullanım oranına sahip aşamanın adı"""
+        return max(self.stages, key=lambda s: s.utilization(self.wall)).name
+
+    def as_dict(self) -> dict:
+        return {
+            'processed': self.processed,
+            'failed': len(self.failures),
+            'wall_seconds': self.wall,
+            'bottleneck': self.bottleneck(),
+            'stages': {s.name: {
+                'workers': s.workers,
+                'count': s.count,
+                'busy_seconds': s.busy,
+                'starved_seconds': s.starved,
+                'blocked_seconds': s.blocked,
+                'slices_per_second': s.throughput(),
+                'utilization': s.utilization(self.wall),
+            } for s in self.stages},
+        }
+
+    def print_report(self):
+        print("\n--- Aşama Verimi ---")
+        print(f"  {'aşama':10s} {'kesit':>6s} {'kesit/s':>8s} {'kullanım':>9s} "
+              f"{'girdi bekleme':>14s} {'çıkış bekleme':>14s}")
+        for s in self.stages:
+            print(f"  {s.name:10s} {s.count:6d} {s.throughput():8.1f} "
+                  f"{s.utilization(self.wall):8.0%} {s.starved:13.1f}s {s.blocked:13.1f}s")
+        rate = self.processed / self.wall if self.wall > 0 else 0.0
+        print(f"  {'toplam':10s} {self.processed:6d} {rate:8.1f}  ({self.wall:.1f} s)")
+        print(f"  Darboğaz: {self.bottleneck()}")
+
+
+def _timed_put(q: queue.Queue, item, stats: StageStats):
+    """Kuyruğa ekler; dolu kuyrukta bekleme süresini back-pressure olarak kaydeder"""
+    start = time.perf_counter()
+    q.put(item)
+    stats.add(blocked=time.perf_counter() - start)
+
+
+def _timed_get(q: queue.Queue, stats: StageStats):
+    """Kuyruktan alır; boş kuyrukta bekleme süresini açlık olarak kaydeder"""
+    start = time.perf_counter()
+    item = q.get()
+    stats.add(starved=time.perf_counter() - start)
+    return item
+
+
+def run_pipeline(jobs, decode_fn, infer_fn, write_fn,
+                 num_decoders: int = DEFAULT_DECODERS,
+                 batch_size: int = DEFAULT_BATCH_SIZE,
+                 queue_size: int = DEFAULT_QUEUE_SIZE) -> PipelineReport:
+    """
+    İşleri decode -> inference -> yazma aşamalarından geçirir.
+
+    Args:
+        jobs: İş listesi/iterator'ı (ör. dosya yolları)
+        decode_fn: job -> (1, 256, 256, 1) model girdisi; decoder thread'lerinde çalışır
+        infer_fn: (N, 256, 256, 1) batch -> (N, 256, 256, 1) çıktı; tek thread'de çalışır
+        write_fn: (job, (256, 256, 1) çıktı) -> None; yazıcı thread'inde çalışır
+        num_decoders: Decoder thread sayısı
+        batch_size: Inference batch boyutu
+        queue_size: Ara kuyrukların kapasitesi (back-pressure sınırı)
+
+    Returns:
+        PipelineReport: Aşama istatistikleri ve başarısız işler
+    """
+    decode_stats = StageStats("decode", workers=num_decoders)
+    infer_stats = StageStats("inference")
+    write_stats = StageStats("yazma")
+    failures = []
+
+    job_iter = iter(jobs)
+    job_lock = threading.Lock()
+    decoded = queue.Queue(maxsize=queue_size)
+    results = queue.Queue(maxsize=queue_size)
+
+    def next_job():
+        with job_lock:
+            return next(job_iter, _END)
+
+    def decoder():
+        while True:
+            job = next_job()
+            if job is _END:
+                break
+            start = time.perf_counter()
+            try:
+                model_input = decode_fn(job)
+            except Exception as e:
+                failures.append((job, str(e)))
+                continue
+            decode_stats.add(1, busy=time.perf_counter() - start)
+            _timed_put(decoded, (job, model_input), decode_stats)
+        decoded.put(_END)
+
+    def writer():
+        while True:
+            item = _timed_get(results, write_stats)
+            if item is _END:
+                break
+            job, output = item
+            start = time.perf_counter()
+            try:
+                write_fn(job, output)
+            except Exception as e:
+                failures.append((job, str(e)))
+                continue
+            write_stats.add(1, busy=time.perf_counter() - start)
+
+    threads = [threading.Thread(target=decoder, daemon=True) for _ in range(num_decoders)]
+    threads.append(threading.Thread(target=writer, daemon=True))
+
+    wall_start = time.perf_counter()
+    for t in threads:
+        t.start()
+
+    # Inference tüketicisi: tüm decoder'lar bitene kadar batch topla
+    active_decoders = num_decoders
+    while active_decoders > 0:
+        batch = []
+        while len(batch) < batch_size and active_decoders > 0:
+            item = _timed_get(decoded, infer_stats)
+            if item is _END:
+                active_decoders -= 1
+                continue
+            batch.append(item)
+        if not batch:
+            continue
+
+        start = time.perf_counter()
+        try:
+            outputs = infer_fn(np.concatenate([model_input for _, model_input in batch]))
+        except Exception as e:
+            failures.extend((job, str(e)) for job, _ in batch)
+            continue
+        infer_stats.add(len(batch), busy=time.perf_counter() - start)
+
+        for (job, _), output in zip(batch, outputs):
+            _timed_put(results, (job, output), infer_stats)
+
+    results.put(_END)
+    for t in threads:
+        t.join()
+    wall = time.perf_counter() - wall_start
+
+    return PipelineReport([decode_stats, infer_stats, write_stats], wall, failures)
@@ -3,6 +3,8 @@ LDCT Denoising - Preprocessing Module
 DICOM görüntülerini model için hazırlar.
 """
 
+import os
+
 import numpy as np
 from PIL import Image
 
@@ -19,6 +21,61 @@ HU_MAX = 1000
 IMG_SIZE = (256, 256)
 
 
+def find_dicom_files(input_dir: str) -> list:
+    """Klasör ağacındaki tüm .dcm dosyalarını sıralı olarak döndürür"""
+    found = []
+    for root, dirs, files in os.walk(input_dir):
+        dirs.sort()
+        for name in sorted(files):
+            if name.lower().endswith('.dcm'):
+                found.append(os.path.join(root, name))
+    return found
+
+
+def read_hu(dcm) -> np.ndarray:
+    """
+    DICOM veri setinden HU görüntüsünü çıkarır.
+    
+    Args:
+        dcm: pydicom Dataset
+        
+    Returns:
+        numpy array: float32 HU görüntüsü (orijinal çözünürlükte)
+    """
+    pixel_array = dcm.pixel_array.astype(np.float32)
+    
+    # HU Dönüşümü (Rescale Slope & Intercept)
+    intercept = dcm.RescaleIntercept if 'RescaleIntercept' in dcm else 0
+    slope = dcm.RescaleSlope if 'RescaleSlope' in dcm else 1
+    return pixel_array * slope + intercept
+
+
+def hu_to_model_space(hu_image: np.ndarray, resize: bool = True) -> np.ndarray:
+    """
+    HU görüntüsünü kırpar, 256x256'ya küçültür ve [-1, 1] aralığına normalize eder.
+    
+    Args:
+        hu_image: HU değerlerini içeren 2D görüntü
+        resize: False ise doğal çözünürlük korunur (tiled inference için)
+        
+    Returns:
+        numpy array: (256, 256) veya (H, W) float32 normalized görüntü
+    """
+    # Clipping [-1000, 1000]
+    hu_image = np.clip(hu_image, HU_MIN, HU_MAX).astype(np.float32)
+    
+    # Resize to 256x256 using PIL
+    if resize:
+        pil_img = Image.fromarray(hu_image)
+        pil_img = pil_img.resize(IMG_SIZE, Image.Resampling.LANCZOS)
+        hu_image = np.array(pil_img, dtype=np.float32)
+    
+    # Normalizasyon [-1, 1]
+    normalized = (hu_image - HU_MIN) / (HU_MAX - HU_MIN)  # [0, 1]
+    normalized = (normalized * 2) - 1  # [-1, 1]
+    return normalized.astype(np.float32)
+
+
 def preprocess_dicom(file_path: str) -> tuple:
     """
     DICOM dosyasını okur ve model için hazırlar.
@@ -32,37 +89,141 @@ def preprocess_dicom(file_path: str) -> tuple:
     if pydicom is None:
         raise ImportError("pydicom kütüphanesi yüklü değil. 'pip install pydicom' komutunu çalıştırın.")
     
-    # 1. DICOM Okuma
+    # 1. DICOM Okuma ve HU Dönüşümü
     dcm = pydicom.dcmread(file_path)
-    pixel_array = dcm.pixel_array.astype(np.float32)
-    
-    # 2. HU Dönüşümü (Rescale Slope & Intercept)
-    intercept = dcm.RescaleIntercept if 'RescaleIntercept' in dcm else 0
-    slope = dcm.RescaleSlope if 'RescaleSlope' in dcm else 1
-    hu_image = pixel_array * slope + intercept
+    hu_image = read_hu(dcm)
     
     # Orijinal görüntüyü sakla (display için)
     original_hu = hu_image.copy()
     
-    # 3. Clipping [-1000, 1000]
-    hu_image = np.clip(hu_image, HU_MIN, HU_MAX)
-    
-    # 4. Resize to 256x256 using PIL
-    pil_img = Image.fromarray(hu_image)
-    pil_img = pil_img.resize(IMG_SIZE, Image.Resampling.LANCZOS)
-    hu_image = np.array(pil_img, dtype=np.float32)
-    
-    # 5. Normalizasyon [-1, 1]
-    normalized = (hu_image - HU_MIN) / (HU_MAX - HU_MIN)  # [0, 1]
-    normalized = (normalized * 2) - 1  # [-1, 1]
+    # 2. Clipping, resize ve normalizasyon
+    normalized = hu_to_model_space(hu_image)
     
     # Model input shape: (1, 256, 256, 1)
-    model_input = normalized.astype(np.float32)
-    model_input = np.expand_dims(model_input, axis=(0, -1))
+    model_input = np.expand_dims(normalized, axis=(0, -1))
     
     return model_input, original_hu
 
 
+def preprocess_dicom_native(file_path: str) -> tuple:
+    """
+    DICOM dosyasını küçültmeden, doğal çözünürlükte model için hazırlar.
+    
+    Args:
+        file_path: DICOM dosya yolu
+        
+    Returns:
+        tuple: ((H, W) normalized görüntü, orijinal HU görüntüsü)
+    """
+    if pydicom is None:
+        raise ImportError("pydicom kütüphanesi yüklü değil. 'pip install pydicom' komutunu çalıştırın.")
+    
+    dcm = pydicom.dcmread(file_path)
+    hu_image = read_hu(dcm)
+    return hu_to_model_space(hu_image, resize=False), hu_image
+
+
+def slice_position(dcm) -> float:
+    """
+    Kesitin seri içindeki konumunu döndürür.
+    
+    Öncelik sırası: ImagePositionPatient (z), SliceLocation, InstanceNumber.
+    
+    Returns:
+        float: Konum; hiçbiri yoksa None
+    """
+    if 'ImagePositionPatient' in dcm:
+        return float(dcm.ImagePositionPatient[2])
+    if 'SliceLocation' in dcm:
+        return float(dcm.SliceLocation)
+    if 'InstanceNumber' in dcm:
+        return float(dcm.InstanceNumber)
+    return None
+
+
+def sort_series(file_paths: list) -> list:
+    """
+    Kesitleri yalnızca DICOM header'larını okuyarak konuma göre sıralar.
+    
+    Piksel verisi okunmaz (stop_before_pixels); konumu olmayan kesitler
+    dosya adı sırasıyla sona eklenir. Header'ı okunamayan kesit varsa hata
+    verilir; atlanması hacimde eksik kesit ve kaymış z indeksleri demektir.
+    
+    Args:
+        file_paths: Aynı seriye ait DICOM dosya yolları
+        
+    Returns:
+        list: Sıralanmış dosya yolları
+        
+    Raises:
+        ValueError: Bir veya daha fazla kesitin header'ı okunamadıysa
+    """
+    if pydicom is None:
+        raise ImportError("pydicom kütüphanesi yüklü değil. 'pip install pydicom' komutunu çalıştırın.")
+    
+    positioned = []
+    unpositioned = []
+    failed = []
+    for file_path in sorted(file_paths):
+        try:
+            header = pydicom.dcmread(file_path, stop_before_pixels=True)
+        except Exception as e:
+            failed.append(f"{file_path} ({e})")
+            continue
+        z = slice_position(header)
+        if z is None:
+            unpositioned.append(file_path)
+        else:
+            positioned.append((z, file_path))
+    
+    if failed:
+        raise ValueError(f"{len(failed)} kesitin header'ı okunamadı:\n" + "\n".join(failed))
+    
+    positioned.sort(key=lambda item: item[0])
+    return [file_path for _, file_path in positioned] + unpositioned
+
+
+def load_dicom_volume(series, out: np.ndarray = None, presorted: bool = False) -> tuple:
+    """
+    Bir DICOM serisini sıralı ve tek parça bir model girdisi hacmi olarak yükler.
+    
+    Önce header'lar okunarak kesit sırası belirlenir, ardından (Z, 256, 256)
+    float32 tampon bir kez ayrılır ve her kesit doğrudan kendi satırına
+    decode edilir. Kesitler ayrıca bir listede tutulmadığı için hacim bellekte
+    iki kez bulunmaz.
+    
+    Args:
+        series: Seri klasörü veya DICOM dosya yolları listesi
+        out: Verilirse (Z, 256, 256) float32 hedef tampon
+        presorted: True ise dosya listesi zaten sıralı kabul edilir
+                   (ör. catalog.DicomCatalog'dan gelen liste)
+        
+    Returns:
+        tuple: ((Z, 256, 256) normalized hacim, sıralı dosya yolları)
+    """
+    if pydicom is None:
+        raise ImportError("pydicom kütüphanesi yüklü değil. 'pip install pydicom' komutunu çalıştırın.")
+    
+    if isinstance(series, str):
+        file_paths = [os.path.join(series, f) for f in os.listdir(series)
+                      if f.lower().endswith('.dcm')]
+    else:
+        file_paths = list(series)
+    
+    ordered = file_paths if presorted else sort_series(file_paths)
+    shape = (len(ordered), IMG_SIZE[1], IMG_SIZE[0])
+    if out is None:
+        out = np.empty(shape, dtype=np.float32)
+    elif out.shape != shape or out.dtype != np.float32:
+        raise ValueError(f"Hedef tampon {shape} float32 olmalı, {out.shape} {out.dtype} verildi")
+    
+    for i, file_path in enumerate(ordered):
+        dcm = pydicom.dcmread(file_path)
+        out[i] = hu_to_model_space(read_hu(dcm))
+    
+    return out, ordered
+
+
 def postprocess_output(model_output: np.ndarray) -> np.ndarray:
     """
     Model çıktısını görüntülenebilir formata dönüştürür.
@@ -85,6 +246,20 @@ def postprocess_output(model_output: np.ndarray) -> np.ndarray:
     return img
 
 
+def model_output_to_hu(model_output: np.ndarray) -> np.ndarray:
+    """
+    Model çıktısını [-1, 1] aralığından HU değerlerine geri dönüştürür.
+    
+    Args:
+        model_output: Model'den gelen [-1, 1] aralığındaki çıktı
+        
+    Returns:
+        numpy array: [HU_MIN, HU_MAX] aralığında float32 HU görüntüsü
+    """
+    img = np.clip(np.asarray(model_output, dtype=np.float32).squeeze(), -1, 1)
+    return ((img + 1) / 2.0) * (HU_MAX - HU_MIN) + HU_MIN
+
+
 def normalize_for_display(image: np.ndarray) -> np.ndarray:
     """
     HU görüntüsünü display için normalize eder.
@@ -0,0 +1,233 @@
+"""
+LDCT Denoising - Profiling Module
+Eğitim adımlarının aşama sürelerini ölçer ve epoch sonunda özetler.
+
+Aşamalı eğitim adımı (training.PhasedTrainStep) her aşamayı ayrı çalıştırıp
+sonucunu bekler; TrainingProfiler bu aşamaların ve veri bekleme süresinin
+duvar saati sürelerini adım başına toplar. Veri bekleme ('data') iteratörün
+bir sonraki batch'i vermesi için geçen süredir; prefetch yeterliyse sıfıra
+yakındır, aksi halde girdi pipeline'ındaki tıkanmayı (stall) gösterir.
+
+Her epoch sonunda özet bir JSON satırı olarak {log_dir}/profile_summary.jsonl
+dosyasına eklenir. İsteğe bağlı olarak seçilen adım aralığı için TensorBoard
+profiler izi (trace) {log_dir} altına yazılır; aşamalar izde ayrı bloklar
+olarak görünür. Her şey CPU'da da çalışır.
+
+İzi görüntülemek için:
+    pip install tensorboard tensorboard-plugin-profile
+    tensorboard --logdir <log_dir>
+"""
+
+import json
+import os
+import time
+from contextlib import contextmanager
+
+import numpy as np
+
+try:
+    import tensorflow as tf
+except ImportError:
+    tf = None
+
+
+# Profiling sabitleri
+SUMMARY_NAME = "profile_summary.jsonl"
+DEFAULT_WARMUP_STEPS = 1  # İlk adım(lar) tf.function trace'i içerir, özete katılmaz
+DATA_PHASE = 'data'
+
+
+def parse_step_range(text: str) -> tuple:
+    """
+    'BAŞLANGIÇ:BİTİŞ' biçimindeki adım aralığını çözer (bitiş hariç).
+
+    Returns:
+        tuple: (başlangıç, bitiş)
+    """
+    try:
+        start, stop = (int(part) for part in text.split(":"))
+    except ValueError:
+        raise ValueError(f"Adım aralığı 'BAŞLANGIÇ:BİTİŞ' biçiminde olmalı: {text}")
+    if not 0 <= start < stop:
+        raise ValueError(f"Geçersiz adım aralığı: {text}")
+    return start, stop
+
+
+def _duration_stats(seconds: list) -> dict:
+    values = np.asarray(seconds, dtype=np.float64) * 1000
+    return {
+        'total_seconds': float(values.sum() / 1000),
+        'mean_ms': float(values.mean()),
+        'p50_ms': float(np.percentile(values, 50)),
+        'p95_ms': float(np.percentile(values, 95)),
+        'max_ms': float(values.max()),
+    }
+
+
+class TrainingProfiler:
+    """
+    Adım başına aşama sürelerini toplar, epoch özetini yazar ve isteğe bağlı
+    olarak bir adım aralığında TensorBoard izi alır.
+
+    Kullanım (training.fit_distributed içinde):
+        for batch in profiler.timed(dataset):     # 'data' aşaması + adım başlangıcı
+            with profiler.phase('d_update'):
+                ...
+            profiler.end_step()
+        summary = profiler.end_epoch(epoch)
+    """
+
+    def __init__(self, log_dir: str, trace_steps: tuple = None, batch_size: int = None,
+                 warmup_steps: int = DEFAULT_WARMUP_STEPS):
+        """
+        Args:
+            log_dir: Özet dosyasının ve TensorBoard izinin klasörü
+            trace_steps: (başlangıç, bitiş) izlenecek adım aralığı; adımlar bu
+                         çalışmada 0'dan sayılır, bitiş hariç (None: iz alınmaz)
+            batch_size: Global batch boyutu (görüntü/s hesabı için)
+            warmup_steps: Çalışmanın başında özete katılmayan adım sayısı
+        """
+        if tf is None:
+            raise ImportError("TensorFlow yüklü değil. 'pip install tensorflow' komutunu çalıştırın.")
+        self.log_dir = log_dir
+        self.trace_steps = trace_steps
+        self.batch_size = batch_size
+        self.warmup_steps = warmup_steps
+        self.summary_path = os.path.join(log_dir, SUMMARY_NAME)
+        os.makedirs(log_dir, exist_ok=True)
+
+        self.global_step = 0  # Bu çalışmada tamamlanan adım sayısı
+        self.tracing = False
+        self._steps = []  # Epoch içindeki adımlar: {'wall': s, 'phases': {aşama: s}}
+        self._warmup_seconds = 0.0
+        self._current = None
+        self._step_start = 0.0
+        self._step_trace = None
+
+    def begin_step(self):
+        """Yeni bir adımın zamanlamasını başlatır (gerekirse izi açar)"""
+        if self.trace_steps is not None and self.global_step == self.trace_steps[0]:
+            tf.profiler.experimental.start(self.log_dir)
+            self.tracing = True
+            print(f"Profiler izi başladı (adım {self.global_step})")
+        self._current = {}
+        self._step_trace = tf.profiler.experimental.Trace('train', step_num=self.global_step, _r=1)
+        self._step_trace.__enter__()
+        self._step_start = time.perf_counter()
+
+    @contextmanager
+    def phase(self, name: str):
+        """Bloğun süresini geçerli adımın 'name' aşamasına ekler"""
+        start = time.perf_counter()
+        try:
+            with tf.profiler.experimental.Trace(name):
+                yield
+        finally:
+            self._current[name] = self._current.get(name, 0.0) + time.perf_counter() - start
+
+    def end_step(self):
+        """Geçerli adımı kaydeder (izleme aralığının sonundaysa izi kapatır)"""
+        wall = time.perf_counter() - self._step_start
+        self._close_step_trace()
+        if self.global_step < self.warmup_steps:
+            self._warmup_seconds += wall
+        else:
+            self._steps.append({'wall': wall, 'phases': self._current})
+        self._current = None
+        self.global_step += 1
+
+        if self.tracing and self.global_step >= self.trace_steps[1]:
+            self.stop_trace()
+
+    def _close_step_trace(self):
+        if self._step_trace is not None:
+            self._step_trace.__exit__(None, None, None)
+            self._step_trace = None
+
+    def cancel_step(self):
+        """Başlatılıp tamamlanmayan adımı (ör. dataset bitti) kaydetmeden bırakır"""
+        self._close_step_trace()
+        self._current = None
+
+    def timed(self, iterable):
+        """
+        Öğeleri verirken her next() bekleyişini 'data' aşaması olarak ölçer.
+
+        Her öğe yeni bir adım başlatır; adım end_step() ile kapatılmalıdır.
+        """
+        iterator = iter(iterable)
+        while True:
+            self.begin_step()
+            try:
+                with self.phase(DATA_PHASE):
+                    item = next(iterator)
+            except StopIteration:
+                self.cancel_step()
+                return
+            yield item
+
+    def stop_trace(self):
+        if self.tracing:
+            tf.profiler.experimental.stop()
+            self.tracing = False
+            print(f"Profiler izi yazıldı: {self.log_dir}")
+
+    def end_epoch(self, epoch: int) -> dict:
+        """
+        Epoch'un adım istatistiklerini özetler, JSON satırı olarak ekler ve
+        kısa bir tablo yazdırır.
+
+        Args:
+            epoch: Tamamlanan epoch (1'den başlar)
+
+        Returns:
+            dict: Özet (adım yoksa yalnızca epoch ve ısınma bilgisi)
+        """
+        summary = {'epoch': epoch, 'steps': len(self._steps),
+                   'warmup_seconds': self._warmup_seconds}
+        if self._steps:
+            walls = [s['wall'] for s in self._steps]
+            names = []
+            for s in self._steps:
+                names += [name for name in s['phases'] if name not in names]
+            phases = {name: [s['phases'].get(name, 0.0) for s in self._steps] for name in names}
+            # Aşamalara girmeyen süre: callback'ler, Python döngüsü, senkronizasyon
+            phases['other'] = [s['wall'] - sum(s['phases'].values()) for s in self._steps]
+
+            total = sum(walls)
+            stall = sum(phases.get(DATA_PHASE, []))
+            summary.update({
+                'wall_seconds': total,
+                'step': _duration_stats(walls),
+                'phases': {name: dict(_duration_stats(values), fraction=sum(values) / total)
+                           for name, values in phases.items()},
+                'input_stall_seconds': stall,
+                'input_stall_fraction': stall / total,
+            })
+            if self.batch_size:
+                summary['images_per_second'] = len(walls) * self.batch_size / total
+
+        with open(self.summary_path, 'a') as f:
+            f.write(json.dumps(summary) + "\n")
+        self.print_summary(summary)
+
+        self._steps = []
+        self._warmup_seconds = 0.0
+        return summary
+
+    @staticmethod
+    def print_summary(summary: dict):
+        print(f"\n--- Adım Profili (epoch {summary['epoch']}, {summary['steps']} adım) ---")
+        if not summary['steps']:
+            print(f"  Yalnızca ısınma adımları ({summary['warmup_seconds']:.1f} s)")
+            return
+        print(f"  {'aşama':18s} {'ort. ms':>9s} {'p95 ms':>9s} {'pay':>6s}")
+        for name, stats in summary['phases'].items():
+            print(f"  {name:18s} {stats['mean_ms']:9.1f} {stats['p95_ms']:9.1f} {stats['fraction']:6.1%}")
+        print(f"  {'adım':18s} {summary['step']['mean_ms']:9.1f} {summary['step']['p95_ms']:9.1f}")
+        print(f"  Girdi bekleme: {summary['input_stall_seconds']:.2f} s "
+              f"({summary['input_stall_fraction']:.1%})")
+
+    def close(self):
+        """Açık kalan izi kapatır"""
+        self.stop_trace()
@@ -0,0 +1,293 @@
+"""
+LDCT Denoising - Local Inference Server
+Birden çok okuma istasyonunun tek bir ısınmış modeli paylaşması için yerel
+HTTP servisi.
+
+Eşzamanlı istekler bir kuyrukta toplanır ve dinamik batch'ler halinde
+işlenir: ilk istek geldikten sonra en fazla max_wait_ms beklenir veya batch
+max_batch_size'a ulaşınca generator tek seferde çalıştırılır. Yalnızca
+standart kütüphane (http.server) kullanılır; varsayılan olarak yalnızca
+127.0.0.1 dinlenir.
+
+Uç noktalar:
+    POST /denoise   Gövde: DICOM baytları (Content-Type: application/dicom)
+                    veya .npy dizisi (Content-Type: application/x-npy,
+                    (256, 256) [-1, 1] aralığında normalize edilmiş kesit)
+                    Yanıt: (256, 256) float32 .npy model çıktısı; süreler
+                    X-Queue-Ms, X-Batch-Size, X-Compute-Ms, X-Total-Ms
+                    başlıklarında
+    GET  /health    Model ve batcher durumu (JSON)
+
+Kullanım:
+    python app/server.py --weights G_epoch_50.h5 [--port 8765] [--max-batch 8] [--max-wait-ms 5]
+"""
+
+import argparse
+import io
+import json
+import os
+import queue
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+# Uygulama dizinini path'e ekle
+app_dir = os.path.dirname(os.path.abspath(__file__))
+if app_dir not in sys.path:
+    sys.path.insert(0, app_dir)
+
+import numpy as np
+
+from preprocessing import read_hu, hu_to_model_space
+from model import get_model, IMG_HEIGHT, IMG_WIDTH
+
+try:
+    import pydicom
+except ImportError:
+    pydicom = None
+
+
+# Servis sabitleri
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8765
+DEFAULT_MAX_BATCH = 8
+DEFAULT_MAX_WAIT_MS = 5.0
+MAX_BODY_BYTES = 64 * 1024 * 1024
+DICOM_CONTENT_TYPE = "application/dicom"
+NPY_CONTENT_TYPE = "application/x-npy"
+
+
+class _Request:
+    """Kuyruktaki tek bir inference isteği"""
+
+    __slots__ = ('image', 'enqueued', 'done', 'output', 'error', 'timings')
+
+    def __init__(self, image: np.ndarray):
+        self.image = image
+        self.enqueued = time.perf_counter()
+        self.done = threading.Event()
+        self.output = None
+        self.error = None
+        self.timings = {}
+
+
+class DynamicBatcher:
+    """
+    Eşzamanlı istekleri dinamik batch'lerde toplayan tek tüketicili kuyruk.
+
+    Generator yalnızca batcher thread'inden çağrılır; HTTP thread'leri
+    submit() ile istek bırakıp sonucu bekler.
+    """
+
+    def __init__(self, predict_fn, max_batch_size: int = DEFAULT_MAX_BATCH,
+                 max_wait_ms: float = DEFAULT_MAX_WAIT_MS):
+        """
+        Args:
+            predict_fn: (N, H, W, 1) -> (N, H, W, 1) batch inference fonksiyonu
+            max_batch_size: Bir batch'teki en fazla istek sayısı
+            max_wait_ms: İlk istekten sonra batch'i doldurmak için beklenecek süre
+        """
+        self.predict_fn = predict_fn
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait_ms / 1000.0
+        self.batches = 0
+        self.requests = 0
+        self._queue = queue.Queue()
+        self._thread = threading.Thread(target=self._loop, name="batcher", daemon=True)
+        self._thread.start()
+
+    def submit(self, image: np.ndarray) -> _Request:
+        """(H, W) kesiti kuyruğa ekler ve tamamlanmasını bekler"""
+        request = _Request(image)
+        self._queue.put(request)
+        request.done.wait()
+        if request.error is not None:
+            raise request.error
+        return request
+
+    def _collect(self) -> list:
+        """İlk isteği bekler, ardından süre/boyut sınırına kadar batch'i doldurur"""
+        batch = [self._queue.get()]
+        deadline = time.perf_counter() + self.max_wait
+        while len(batch) < self.max_batch_size:
+            remaining = deadline - time.perf_counter()
+            try:
+                batch.append(self._queue.get(timeout=remaining) if remaining > 0
+                             else self._queue.get_nowait())
+            except queue.Empty:
+                break
+        return batch
+
+    def _loop(self):
+        while True:
+            batch = self._collect()
+            started = time.perf_counter()
+            try:
+                outputs = self.predict_fn(np.stack([r.image for r in batch])[..., np.newaxis])
+            except Exception as e:
+                for request in batch:
+                    request.error = e
+                    request.done.set()
+                continue
+            finished = time.perf_counter()
+
+            self.batches += 1
+            self.requests += len(batch)
+            for request, output in zip(batch, outputs):
+                request.output = output[..., 0]
+                request.timings = {
+                    'queue_ms': (started - request.enqueued) * 1000,
+                    'batch_size': len(batch),
+                    'compute_ms': (finished - started) * 1000,
+                }
+                request.done.set()
+
+    def stats(self) -> dict:
+        return {
+            'batches': self.batches,
+            'requests': self.requests,
+            'mean_batch_size': self.requests / self.batches if self.batches else 0.0,
+            'queued': self._queue.qsize(),
+        }
+
+
+def decode_request(body: bytes, content_type: str) -> np.ndarray:
+    """
+    İstek gövdesini (256, 256) normalize edilmiş kesite çevirir.
+
+    Raises:
+        ValueError: Desteklenmeyen içerik türü veya hatalı boyut
+    """
+    if content_type == DICOM_CONTENT_TYPE:
+        if pydicom is None:
+            raise ImportError("pydicom kütüphanesi yüklü değil. 'pip install pydicom' komutunu çalıştırın.")
+        return hu_to_model_space(read_hu(pydicom.dcmread(io.BytesIO(body))))
+
+    if content_type == NPY_CONTENT_TYPE:
+        image = np.load(io.BytesIO(body), allow_pickle=False).astype(np.float32).squeeze()
+        if image.shape != (IMG_HEIGHT, IMG_WIDTH):
+            raise ValueError(f"Beklenen boyut ({IMG_HEIGHT}, {IMG_WIDTH}), gelen {image.shape}")
+        return image
+
+    raise ValueError(f"Desteklenmeyen içerik türü: {content_type}")
+
+
+def make_handler(batcher: DynamicBatcher):
+    """Batcher'a bağlı HTTP istek işleyici sınıfını oluşturur"""
+
+    class InferenceHandler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def log_message(self, format, *args):
+            pass  # İstek başına log yazılmaz
+
+        def _send(self, status: int, body: bytes, content_type: str, headers: dict = None):
+            self.send_response(status)
+            self.send_header("Content-Type", content_type)
+            self.send_header("Content-Length", str(len(body)))
+            for name, value in (headers or {}).items():
+                self.send_header(name, value)
+            self.end_headers()
+            self.wfile.write(body)
+
+        def _send_json(self, status: int, payload: dict):
+            self._send(status, json.dumps(payload).encode(), "application/json")
+
+        def do_GET(self):
+            if self.path != "/health":
+                self._send_json(404, {'error': 'bulunamadı'})
+                return
+            model = get_model()
+            self._send_json(200, {'loaded': model.is_loaded, 'variant': model.variant,
+                                  **batcher.stats()})
+
+        def do_POST(self):
+            if self.path != "/denoise":
+                self._send_json(404, {'error': 'bulunamadı'})
+                return
+
+            received = time.perf_counter()
+            length = int(self.headers.get("Content-Length", 0))
+            if not 0 < length <= MAX_BODY_BYTES:
+                self._send_json(413 if length else 400, {'error': 'geçersiz gövde boyutu'})
+                return
+            body = self.rfile.read(length)
+            content_type = self.headers.get("Content-Type", "").split(";")[0].strip()
+
+            try:
+                image = decode_request(body, content_type)
+            except Exception as e:
+                self._send_json(400, {'error': str(e)})
+                return
+
+            try:
+                request = batcher.submit(image)
+            except Exception as e:
+                self._send_json(500, {'error': str(e)})
+                return
+
+            buffer = io.BytesIO()
+            np.save(buffer, request.output.astype(np.float32))
+            timings = request.timings
+            self._send(200, buffer.getvalue(), NPY_CONTENT_TYPE, {
+                'X-Queue-Ms': f"{timings['queue_ms']:.3f}",
+                'X-Batch-Size': str(timings['batch_size']),
+                'X-Compute-Ms': f"{timings['compute_ms']:.3f}",
+                'X-Total-Ms': f"{(time.perf_counter() - received) * 1000:.3f}",
+            })
+
+    return InferenceHandler
+
+
+def create_server(host: str = DEFAULT_HOST, port: int = DEFAULT_PORT,
+                  max_batch_size: int = DEFAULT_MAX_BATCH,
+                  max_wait_ms: float = DEFAULT_MAX_WAIT_MS) -> ThreadingHTTPServer:
+    """
+    get_model() singleton'ını kullanan HTTP sunucusunu oluşturur.
+
+    Model önceden load_model() ile yüklenmiş olmalıdır.
+    """
+    model = get_model()
+    if not model.is_loaded:
+        raise RuntimeError("Model henüz yüklenmedi!")
+
+    batcher = DynamicBatcher(lambda batch: model.predict_batch(batch, batch_size=max_batch_size),
+                             max_batch_size=max_batch_size, max_wait_ms=max_wait_ms)
+    server = ThreadingHTTPServer((host, port), make_handler(batcher))
+    server.daemon_threads = True
+    server.batcher = batcher
+    return server
+
+
+def main(argv=None):
+    from model import load_model
+
+    parser = argparse.ArgumentParser(description="LDCT Denoising - yerel inference servisi")
+    parser.add_argument("--weights", required=True, help="Generator ağırlık dosyası")
+    parser.add_argument("--host", default=DEFAULT_HOST)
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    parser.add_argument("--max-batch", type=int, default=DEFAULT_MAX_BATCH,
+                        help="Dinamik batch'teki en fazla istek sayısı")
+    parser.add_argument("--max-wait-ms", type=float, default=DEFAULT_MAX_WAIT_MS,
+                        help="Batch'i doldurmak için en fazla bekleme süresi (ms)")
+    args = parser.parse_args(argv)
+
+    if not load_model(args.weights):
+        print(f"Model yüklenemedi: {args.weights}")
+        return 1
+
+    server = create_server(args.host, args.port, args.max_batch, args.max_wait_ms)
+    print(f"Inference servisi: http://{args.host}:{args.port} "
+          f"(max batch {args.max_batch}, max bekleme {args.max_wait_ms} ms)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,167 @@
+"""
+LDCT Denoising - TensorFlow Dataset Module
+dataset modülündeki veri formatları için Keras yükleyicileri ve tf.data
+pipeline'ı.
+
+- NPYDataset: dosya başına bir kesit (trainA/trainB), her örnek için np.load
+- PackedDataset: pack_dataset çıktısını memory-map ile okur
+- make_tf_dataset: dosya başına formatı paralel okuyan, önbelleklenen ve
+  prefetch edilen tf.data pipeline'ı
+
+TensorFlow bu modül içe aktarılınca yüklenir; yalnızca paketleme veya dosya
+listeleme yapan kodlar dataset modülünü kullanmalıdır.
+"""
+
+import numpy as np
+
+from dataset import (IMG_WIDTH, IMG_HEIGHT, CHANNELS, load_slice, packed_paths,
+                     read_packed_index)
+
+try:
+    import tensorflow as tf
+except ImportError:
+    tf = None
+
+
+DEFAULT_SHUFFLE_BUFFER = 1024
+
+_Sequence = tf.keras.utils.Sequence if tf is not None else object
+
+
+class NPYDataset(_Sequence):
+    """
+    Dosya başına bir kesit okuyan yükleyici (03_training.ipynb'deki sınıf).
+
+    Her örnek için iki ayrı np.load çağrısı yapar.
+    """
+
+    def __init__(self, file_list_A, file_list_B, batch_size=1, shuffle=True):
+        super().__init__()
+        self.files_A = np.array(file_list_A)
+        self.files_B = np.array(file_list_B)
+        self.batch_size = batch_size
+        self.shuffle = shuffle
+        self.indexes = np.arange(len(self.files_A))
+
+        print(f"Veri listesi hazırlandı... ({len(self.files_A)} adet dosya)")
+
+        if self.shuffle:
+            self.on_epoch_end()
+
+    def __len__(self):
+        return int(np.floor(len(self.files_A) / self.batch_size))
+
+    def __getitem__(self, index):
+        indexes = self.indexes[index * self.batch_size:(index + 1) * self.batch_size]
+        batch_A = [load_slice(self.files_A[k]) for k in indexes]
+        batch_B = [load_slice(self.files_B[k]) for k in indexes]
+        return np.array(batch_A), np.array(batch_B)
+
+    def on_epoch_end(self):
+        if self.shuffle:
+            np.random.shuffle(self.indexes)
+
+
+def _decode_npy(raw):
+    """
+    np.save ile yazılmış little-endian float32 .npy içeriğini TF içinde çözer.
+
+    .npy başlığı: 6 byte sihirli dize, 2 byte sürüm, başlık uzunluğu
+    (v1: 2 byte, v2/v3: 4 byte, little-endian) ve başlık metni.
+    """
+    major = tf.cast(tf.io.decode_raw(tf.strings.substr(raw, 6, 1), tf.uint8)[0], tf.int32)
+    length_bytes = tf.where(major == 1, 2, 4)
+    header_bytes = tf.io.decode_raw(tf.strings.substr(raw, 8, 4), tf.uint8)
+    header_bytes = tf.cast(header_bytes, tf.int32)
+    weights = tf.constant([1, 256, 65536, 16777216], dtype=tf.int32)
+    mask = tf.cast(tf.range(4) < length_bytes, tf.int32)
+    header_len = tf.reduce_sum(header_bytes * weights * mask)
+
+    offset = 8 + length_bytes + header_len
+    data = tf.strings.substr(raw, offset, tf.strings.length(raw) - offset)
+    image = tf.io.decode_raw(data, tf.float32, little_endian=True)
+    return tf.reshape(image, [IMG_HEIGHT, IMG_WIDTH, CHANNELS])
+
+
+def _load_pair(path_A, path_B):
+    return _decode_npy(tf.io.read_file(path_A)), _decode_npy(tf.io.read_file(path_B))
+
+
+def make_tf_dataset(file_list_A, file_list_B, batch_size: int = 1, shuffle: bool = True,
+                    cache=None, shuffle_buffer: int = DEFAULT_SHUFFLE_BUFFER,
+                    drop_remainder: bool = True):
+    """
+    Dosya başına .npy kesitlerinden bir tf.data pipeline'ı oluşturur.
+
+    NPYDataset'in yerine doğrudan kullanılabilir (hybrid_gan.fit'e
+    train_dataset/val_dataset olarak verilir). Dosyalar paralel okunur ve
+    çözülür, batch'ler eğitim adımıyla üst üste prefetch edilir.
+
+    Args:
+        file_list_A: Low dose .npy dosyaları
+        file_list_B: Eşleşen full dose .npy dosyaları
+        batch_size: Batch boyutu (varsayılan olarak NPYDataset gibi eksik son batch atılır)
+        shuffle: Her epoch'ta örnekleri karıştır
+        cache: None (önbellek yok), 'memory' (RAM) veya önbellek dosyası yolu;
+               ilk epoch'tan sonra dosyalar yeniden okunmaz
+        shuffle_buffer: Karıştırma tamponunun boyutu
+        drop_remainder: False ise eksik son batch da döndürülür (değerlendirme için)
+
+    Returns:
+        tf.data.Dataset: ((B, 256, 256, 1), (B, 256, 256, 1)) çiftleri
+    """
+    if tf is None:
+        raise ImportError("TensorFlow yüklü değil. 'pip install tensorflow' komutunu çalıştırın.")
+
+    autotune = tf.data.AUTOTUNE
+    ds = tf.data.Dataset.from_tensor_slices((list(file_list_A), list(file_list_B)))
+    ds = ds.map(_load_pair, num_parallel_calls=autotune, deterministic=not shuffle)
+
+    # Önbellek karıştırmadan önce: her epoch farklı sırayla önbellekten okunur
+    if cache == 'memory':
+        ds = ds.cache()
+    elif cache:
+        ds = ds.cache(cache)
+
+    if shuffle:
+        ds = ds.shuffle(min(shuffle_buffer, len(file_list_A)), reshuffle_each_iteration=True)
+    ds = ds.batch(batch_size, drop_remainder=drop_remainder)
+    return ds.prefetch(autotune)
+
+
+class PackedDataset(_Sequence):
+    """
+    Paketlenmiş split'ten memory-map ile batch okuyan yükleyici.
+
+    Her batch ardışık satırlardan oluşan bir dilimdir; np.load/kopyalama
+    yapılmaz, işletim sistemi yalnızca dokunulan sayfaları okur. Karıştırma
+    batch sırası üzerinden yapılır (kesitler paketlenirken zaten karıştırılır).
+    """
+
+    def __init__(self, packed_dir: str, split: str = 'train', batch_size: int = 1,
+                 shuffle: bool = True):
+        super().__init__()
+        path_A, path_B, _ = packed_paths(packed_dir, split)
+        self.array_A = np.load(path_A, mmap_mode='r')
+        self.array_B = np.load(path_B, mmap_mode='r')
+        self.index = read_packed_index(packed_dir, split)
+        self.batch_size = batch_size
+        self.shuffle = shuffle
+        self.batch_order = np.arange(len(self))
+
+        print(f"Paketlenmiş veri açıldı... ({len(self.array_A)} adet kesit, {split})")
+
+        if self.shuffle:
+            self.on_epoch_end()
+
+    def __len__(self):
+        return len(self.array_A) // self.batch_size
+
+    def __getitem__(self, index):
+        start = self.batch_order[index] * self.batch_size
+        end = start + self.batch_size
+        return self.array_A[start:end], self.array_B[start:end]
+
+    def on_epoch_end(self):
+        if self.shuffle:
+            np.random.shuffle(self.batch_order)
@@ -0,0 +1,119 @@
+"""
+LDCT Denoising - Tiling Module
+Doğal çözünürlüklü kesitler için kayan pencereli (sliding-window) inference.
+
+Kesit üst üste binen 256x256 parçalara (tile) bölünür, parçalar batch halinde
+generator'dan geçirilir ve kenarlara doğru azalan bir ağırlık penceresiyle
+harmanlanarak birleştirilir. Böylece parça sınırlarında dikiş izi oluşmaz.
+"""
+
+import numpy as np
+
+
+# Tiling sabitleri
+TILE_SIZE = 256
+DEFAULT_OVERLAP = 64
+DEFAULT_TILE_BATCH = 16
+MIN_WEIGHT = 1e-3  # Pencerenin en düşük ağırlığı (sıfıra bölmeyi önler)
+
+
+def tile_starts(length: int, tile_size: int = TILE_SIZE, overlap: int = DEFAULT_OVERLAP) -> list:
+    """
+    Bir eksen boyunca parça başlangıç konumlarını döndürür.
+
+    Son parça kenara hizalanır; böylece tüm eksen kapsanır.
+    """
+    if length <= tile_size:
+        return [0]
+    stride = tile_size - overlap
+    starts = list(range(0, length - tile_size, stride))
+    starts.append(length - tile_size)
+    return starts
+
+
+def _tile_shape(tile_size) -> tuple:
+    """Parça boyutunu (yükseklik, genişlik) olarak döndürür"""
+    if np.isscalar(tile_size):
+        return int(tile_size), int(tile_size)
+    tile_h, tile_w = tile_size
+    return int(tile_h), int(tile_w)
+
+
+def _blend_ramp(length: int, overlap: int) -> np.ndarray:
+    ramp = np.ones(length, dtype=np.float32)
+    if overlap > 0:
+        edge = 0.5 - 0.5 * np.cos(np.pi * (np.arange(overlap) + 0.5) / overlap)
+        ramp[:overlap] = edge
+        ramp[-overlap:] = edge[::-1]
+    return np.maximum(ramp, MIN_WEIGHT)
+
+
+def blend_window(tile_size=TILE_SIZE, overlap: int = DEFAULT_OVERLAP) -> np.ndarray:
+    """
+    Parçaları harmanlamak için 2D ağırlık penceresi.
+
+    Örtüşme bölgesinde Hann rampası, iç bölgede sabit 1 ağırlık kullanılır.
+
+    Args:
+        tile_size: Kare parça kenarı veya (yükseklik, genişlik)
+        overlap: Örtüşme genişliği (piksel)
+
+    Returns:
+        numpy array: (yükseklik, genişlik) float32 ağırlıklar
+    """
+    tile_h, tile_w = _tile_shape(tile_size)
+    return np.outer(_blend_ramp(tile_h, overlap), _blend_ramp(tile_w, overlap))
+
+
+def denoise_tiled(image: np.ndarray, predict_fn, tile_size=TILE_SIZE,
+                  overlap: int = DEFAULT_OVERLAP, batch_size: int = DEFAULT_TILE_BATCH) -> np.ndarray:
+    """
+    Normalize edilmiş doğal çözünürlüklü bir kesiti parçalar halinde işler.
+
+    Args:
+        image: (H, W) veya (1, H, W, 1) [-1, 1] aralığında kesit
+        predict_fn: (N, tile_h, tile_w, 1) -> (N, tile_h, tile_w, 1) batch inference fonksiyonu
+        tile_size: Parça boyutu (generator girdi boyutu); kare kenar veya
+                   (yükseklik, genişlik)
+        overlap: Komşu parçaların örtüşme genişliği (piksel)
+        batch_size: Generator'a bir kerede verilen parça sayısı
+
+    Returns:
+        numpy array: (H, W) [-1, 1] aralığında model çıktısı
+    """
+    tile_h, tile_w = _tile_shape(tile_size)
+    if not 0 <= overlap < min(tile_h, tile_w):
+        raise ValueError(f"Örtüşme 0 ile {min(tile_h, tile_w) - 1} arasında olmalı: {overlap}")
+
+    image = np.asarray(image, dtype=np.float32)
+    if image.ndim == 4:
+        image = image[0, ..., 0]
+    height, width = image.shape
+
+    # Parçadan küçük kesitler kenar yansıtmayla büyütülür; dolgu kesit
+    # boyutuna ulaşıyorsa (parçanın yarısından küçük kesit) yansıtma tek
+    # başına yetmez, kenar pikselleri tekrarlanır
+    pad_h = max(tile_h - height, 0)
+    pad_w = max(tile_w - width, 0)
+    if pad_h or pad_w:
+        mode = 'reflect' if pad_h < height and pad_w < width else 'edge'
+        image = np.pad(image, ((0, pad_h), (0, pad_w)), mode=mode)
+
+    rows = tile_starts(image.shape[0], tile_h, overlap)
+    cols = tile_starts(image.shape[1], tile_w, overlap)
+    positions = [(r, c) for r in rows for c in cols]
+
+    window = blend_window((tile_h, tile_w), overlap)
+    output = np.zeros(image.shape, dtype=np.float32)
+    weights = np.zeros(image.shape, dtype=np.float32)
+
+    for start in range(0, len(positions), batch_size):
+        chunk = positions[start:start + batch_size]
+        tiles = np.stack([image[r:r + tile_h, c:c + tile_w] for r, c in chunk])
+        predictions = np.asarray(predict_fn(tiles[..., np.newaxis]))[..., 0]
+        for (r, c), prediction in zip(chunk, predictions):
+            output[r:r + tile_h, c:c + tile_w] += prediction * window
+            weights[r:r + tile_h, c:c + tile_w] += window
+
+    output /= weights
+    return output[:height, :width]
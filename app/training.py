@@ -0,0 +1,1029 @@
+"""
+LDCT Denoising - Training Module
+Pix2Pix + WGAN-GP eğitim modeli (01_model_architecture.ipynb ve
+03_training.ipynb'den taşındı).
+
+Notebook'taki train_step generator'ı her adımda iki kez (D ve G güncellemesi
+için ayrı ayrı) çalıştırır. Birleşik adım (fused=True) generator'ı bir kez
+çalıştırır: ileri geçiş G'nin gradient tape'inde kaydedilir, D güncellemesi
+bu tape'in kaydı durdurularak aynı sahte görüntüyle yapılır ve G kaybı
+güncellenmiş D ile aynı tape içinde hesaplanır. D güncellemesi G ağırlıklarını
+değiştirmediği için G'nin gradyanı aynı kayba göredir; farklar yalnızca
+stokastik/yan etkili katmanlardadır: Dropout maskesi iki güncellemede ortaktır
+ve BatchNorm hareketli ortalamaları adım başına bir kez güncellenir.
+Discriminator BatchNorm içerdiği için D(fake)/D(real) çağrıları birleştirilmez
+(batch istatistikleri değişirdi).
+
+Bellek için iki seçenek vardır:
+- Mixed precision ('mixed_float16' / 'mixed_bfloat16'): ağırlıklar float32,
+  aktivasyonlar 16-bit tutulur; float16'da her iki optimizer da dinamik loss
+  scaling ile sarılır. Kayıplar float32'de hesaplanır. Gradient penalty'nin
+  D geçişi, D'nin katmanlarını (dolayısıyla ağırlıklarını) paylaşan float32
+  bir kopyayla yapılır: iç girdi gradyanı loss scaling'siz olduğundan
+  float16'da taşabilir veya sıfıra inebilirdi.
+- Gradient accumulation: veri yükleyicinin batch'i (efektif batch)
+  accumulation_steps micro-batch'e bölünür. Önce tüm micro-batch'lerin D
+  gradyanları toplanıp D güncellenir, ardından güncellenmiş D ile G
+  gradyanları toplanır; böylece WGAN-GP adım sırası korunur. Aynı anda
+  yalnızca bir micro-batch'in aktivasyonları bellektedir. BatchNorm
+  istatistikleri micro-batch üzerinden hesaplanır.
+
+Dağıtık eğitim (make_strategy): modeller, optimizer'lar ve metrikler
+strateji scope'unda oluşturulur; train_step her replikada kendi batch
+parçasıyla çalışır. Optimizer gradyanları replikalar arasında topladığı
+için gradyanı alınan kayıplar replika sayısına bölünür; böylece Wasserstein
+kaybı ve gradient penalty global batch üzerinden ortalanmış olur. Kayıplar
+replika ortalaması alınan Mean metrikleriyle epoch boyunca izlenir.
+BatchNorm istatistikleri replika başınadır. Tek makinede denemek için CPU
+mantıksal cihazlara bölünebilir (--cpu-devices); multi-worker kümesi
+TF_CONFIG ortam değişkeninden okunur.
+
+Checkpoint ve önizlemeler (GANMonitor) checkpoints modülüyle arka planda
+yazılır; son --keep-last checkpoint ve en iyi doğrulama PSNR'lı generator
+saklanır, --resume ile optimizer durumu dahil kaldığı epoch'tan devam edilir.
+
+Profiling (--profile-dir): adımlar PhasedTrainStep ile veri bekleme, G ileri
+geçişi, D güncellemesi, gradient penalty ve G güncellemesi aşamalarına
+bölünerek ölçülür (profiling modülü); özet her epoch sonunda JSON olarak
+yazılır, --profile-steps aralığı için TensorBoard izi alınır.
+
+Kullanım:
+    python app/training.py <processed_data_npy> --epochs 50 [--batch-size 4] [--jit] [--unfused]
+                           [--precision mixed_float16] [--accumulation-steps 8]
+                           [--strategy mirrored --cpu-devices 2]
+                           [--keep-last 3] [--resume]
+                           [--profile-dir profile --profile-steps 5:8]
+"""
+
+import argparse
+import itertools
+import os
+import sys
+import time
+from contextlib import contextmanager
+
+# Uygulama dizinini path'e ekle
+app_dir = os.path.dirname(os.path.abspath(__file__))
+if app_dir not in sys.path:
+    sys.path.insert(0, app_dir)
+
+import numpy as np
+
+from model import build_generator, downsample, IMG_WIDTH, IMG_HEIGHT, CHANNELS
+from checkpoints import (BackgroundWriter, CheckpointManager, DEFAULT_KEEP_LAST,
+                         latest_training_state, render_preview, restore_training_state)
+from profiling import TrainingProfiler, parse_step_range
+
+try:
+    os.environ.setdefault('TF_CPP_MIN_LOG_LEVEL', '2')
+    import tensorflow as tf
+    from tensorflow import keras
+    from tensorflow.keras import layers
+except ImportError:
+    tf = None
+    keras = None
+    layers = None
+
+
+# Eğitim sabitleri (03_training.ipynb)
+BATCH_SIZE = 4
+EPOCHS = 50
+LEARNING_RATE_G = 2e-4
+LEARNING_RATE_D = 2e-4
+ADAM_BETA_1 = 0.5
+ADAM_BETA_2 = 0.9
+LAMBDA_GP = 10.0
+LAMBDA_L1 = 100.0
+CHECKPOINT_EVERY = 5
+
+# Mixed precision politikaları (yalnızca float16 loss scaling gerektirir)
+PRECISION_POLICIES = ('float32', 'mixed_float16', 'mixed_bfloat16')
+
+# Dağıtım stratejileri ('default': tek cihaz)
+STRATEGIES = ('default', 'mirrored', 'multi_worker')
+
+_Model = keras.Model if keras is not None else object
+_Callback = keras.callbacks.Callback if keras is not None else object
+
+
+def build_discriminator(height=IMG_HEIGHT, width=IMG_WIDTH):
+    """
+    PatchGAN discriminator (WGAN-GP için sigmoid çıkışı yok).
+
+    Girdi low dose kesit ile hedef/üretilmiş kesitin birleşimidir.
+    """
+    initializer = tf.random_normal_initializer(0., 0.02)
+
+    inp = layers.Input(shape=[height, width, CHANNELS], name='input_image')
+    tar = layers.Input(shape=[height, width, CHANNELS], name='target_image')
+
+    x = layers.Concatenate()([inp, tar])  # (bs, 256, 256, channels*2)
+
+    down1 = downsample(64, 4, False)(x)
+    down2 = downsample(128, 4)(down1)
+    down3 = downsample(256, 4)(down2)
+
+    # Zero Padding ve Conv
+    zero_pad1 = layers.ZeroPadding2D()(down3)
+    conv = layers.Conv2D(512, 4, strides=1, kernel_initializer=initializer, use_bias=False)(zero_pad1)
+    batchnorm1 = layers.BatchNormalization()(conv)
+    leaky_relu = layers.LeakyReLU()(batchnorm1)
+
+    zero_pad2 = layers.ZeroPadding2D()(leaky_relu)
+
+    last = layers.Conv2D(1, 4, strides=1, kernel_initializer=initializer)(zero_pad2)
+
+    return keras.Model(inputs=[inp, tar], outputs=last)
+
+
+def make_optimizers(loss_scaling: bool = False) -> tuple:
+    """
+    Notebook'taki Adam ayarlarıyla (d_optimizer, g_optimizer) döndürür.
+
+    Args:
+        loss_scaling: True ise her iki optimizer dinamik LossScaleOptimizer ile sarılır
+    """
+    optimizers = (keras.optimizers.Adam(learning_rate=LEARNING_RATE_D, beta_1=ADAM_BETA_1, beta_2=ADAM_BETA_2),
+                  keras.optimizers.Adam(learning_rate=LEARNING_RATE_G, beta_1=ADAM_BETA_1, beta_2=ADAM_BETA_2))
+    if loss_scaling:
+        optimizers = tuple(keras.mixed_precision.LossScaleOptimizer(opt) for opt in optimizers)
+    return optimizers
+
+
+def _is_loss_scaled(optimizer) -> bool:
+    return isinstance(optimizer, keras.mixed_precision.LossScaleOptimizer)
+
+
+def _scale_loss(optimizer, loss):
+    """Loss scaling varsa kaybı ölçekler (Keras 3: scale_loss, Keras 2: get_scaled_loss)"""
+    if not _is_loss_scaled(optimizer):
+        return loss
+    if hasattr(optimizer, 'scale_loss'):
+        return optimizer.scale_loss(loss)
+    return optimizer.get_scaled_loss(loss)
+
+
+def _apply_scaled_gradients(optimizer, grads, variables):
+    """
+    Ölçeklenmiş gradyanları uygular.
+
+    Keras 3 LossScaleOptimizer gradyanları apply sırasında kendisi geri
+    ölçekler ve sonlu olmayan adımları atlar; Keras 2'de geri ölçekleme açıktır.
+    """
+    if _is_loss_scaled(optimizer) and hasattr(optimizer, 'get_unscaled_gradients'):
+        grads = optimizer.get_unscaled_gradients(grads)
+    optimizer.apply_gradients(zip(grads, variables))
+
+
+def configure_cpu_devices(count: int):
+    """
+    Fiziksel CPU'yu count mantıksal cihaza böler.
+
+    Çok cihazlı eğitimi tek makinede denemek içindir; TensorFlow runtime'ı
+    başlatılmadan (ilk tensör/model oluşturulmadan) çağrılmalıdır.
+    """
+    cpu = tf.config.list_physical_devices('CPU')[0]
+    tf.config.set_logical_device_configuration(
+        cpu, [tf.config.LogicalDeviceConfiguration() for _ in range(count)])
+
+
+def make_strategy(kind: str = 'default', cpu_devices: int = 0):
+    """
+    Dağıtım stratejisini oluşturur.
+
+    Args:
+        kind: STRATEGIES'ten biri. 'mirrored' tüm GPU'lara, GPU yoksa tüm
+              (mantıksal) CPU cihazlarına yansıtır; 'multi_worker' kümeyi
+              TF_CONFIG'den okur (CPU'da worker başına bir replika)
+        cpu_devices: 1'den büyükse CPU bu sayıda mantıksal cihaza bölünür
+
+    Returns:
+        tf.distribute.Strategy
+    """
+    if tf is None:
+        raise ImportError("TensorFlow yüklü değil. 'pip install tensorflow' komutunu çalıştırın.")
+    if kind not in STRATEGIES:
+        raise ValueError(f"Bilinmeyen dağıtım stratejisi: {kind}")
+
+    if cpu_devices > 1:
+        configure_cpu_devices(cpu_devices)
+
+    if kind == 'mirrored':
+        devices = [d.name for d in tf.config.list_logical_devices('GPU')]
+        devices = devices or [d.name for d in tf.config.list_logical_devices('CPU')]
+        return tf.distribute.MirroredStrategy(devices)
+    if kind == 'multi_worker':
+        return tf.distribute.MultiWorkerMirroredStrategy()
+    return tf.distribute.get_strategy()
+
+
+def is_chief(strategy) -> bool:
+    """Dosya yazan (chief) worker mı? Tek worker'lı stratejilerde her zaman True"""
+    resolver = getattr(strategy, 'cluster_resolver', None)
+    if resolver is None or not resolver.task_type:
+        return True
+    if resolver.task_type == 'chief':
+        return True
+    has_chief = 'chief' in resolver.cluster_spec().as_dict()
+    return resolver.task_type == 'worker' and resolver.task_id == 0 and not has_chief
+
+
+def _leaf_layers(model):
+    """İç içe modellerin (Sequential blokları) içindeki katmanlar"""
+    for layer in model.layers:
+        if isinstance(layer, keras.Model):
+            yield from _leaf_layers(layer)
+        else:
+            yield layer
+
+
+def _set_dtype_policy(layer, policy):
+    if hasattr(layer, '_set_dtype_policy'):  # Keras 2
+        layer._set_dtype_policy(policy)
+    else:
+        layer.dtype_policy = policy
+
+
+@contextmanager
+def float32_layers(model):
+    """Blok boyunca modelin 16-bit hesaplayan katmanlarını float32 politikasına alır"""
+    float32 = keras.mixed_precision.Policy('float32')
+    changed = [(layer, layer.dtype_policy) for layer in _leaf_layers(model)
+               if layer.compute_dtype != 'float32']
+    for layer, _ in changed:
+        _set_dtype_policy(layer, float32)
+    try:
+        yield model
+    finally:
+        for layer, policy in changed:
+            _set_dtype_policy(layer, policy)
+
+
+def float32_twin(model):
+    """
+    Modelin aynı katman nesnelerini (dolayısıyla aynı ağırlıkları) kullanan
+    float32 kopyası.
+
+    Mixed precision'da fonksiyonel graf girdileri oluşturulurken kaydedilen
+    16-bit dtype'lara çevirir; kopyanın grafı float32 girdilerle yeniden
+    kurulur. Katmanlar paylaşıldığından hesaplamanın da float32 olması için
+    kopya float32_layers(model) bloğu içinde çağrılmalıdır.
+    """
+    float32 = keras.mixed_precision.Policy('float32')
+
+    def clone(layer):
+        if not isinstance(layer, keras.Model):
+            return layer
+        inputs = [layers.Input(shape=t.shape[1:], dtype='float32') for t in layer.inputs]
+        twin = keras.models.clone_model(layer, input_tensors=inputs if len(inputs) > 1 else inputs[0],
+                                        clone_function=clone)
+        _set_dtype_policy(twin, float32)
+        return twin
+
+    with float32_layers(model):
+        return clone(model)
+
+
+def mean_absolute_error(y_true, y_pred):
+    """Batch üzerinden ortalama mutlak hata"""
+    return tf.reduce_mean(tf.abs(y_true - y_pred))
+
+
+class WGAN_GP_Pix2Pix(_Model):
+    """Pix2Pix generator + WGAN-GP discriminator eğitim modeli"""
+
+    def __init__(self, generator, discriminator, lambda_gp=LAMBDA_GP, lambda_l1=LAMBDA_L1):
+        super(WGAN_GP_Pix2Pix, self).__init__()
+        self.generator = generator
+        self.discriminator = discriminator
+        self.lambda_gp = lambda_gp  # Gradient Penalty ağırlığı
+        self.lambda_l1 = lambda_l1  # L1 (Pix2Pix) ağırlığı
+        self.fused = True
+        self.accumulation_steps = 1
+        # Gradient penalty'nin D geçişi için ağırlık paylaşan float32 kopya
+        # (D zaten float32 ise kendisi)
+        if discriminator.compute_dtype == 'float32':
+            self.gp_discriminator = discriminator
+        else:
+            self.gp_discriminator = float32_twin(discriminator)
+
+        # Epoch ortalamaları (dağıtık eğitimde replikalar arası ortalanır)
+        self.d_loss_tracker = keras.metrics.Mean(name="d_loss")
+        self.g_loss_tracker = keras.metrics.Mean(name="g_loss")
+        self.g_l1_tracker = keras.metrics.Mean(name="g_l1")
+        self.psnr_tracker = keras.metrics.Mean(name="psnr")
+
+    @property
+    def metrics(self):
+        # Keras bu metrikleri her epoch ve evaluate başında sıfırlar
+        return [self.d_loss_tracker, self.g_loss_tracker, self.g_l1_tracker, self.psnr_tracker]
+
+    def _track(self, values: dict) -> dict:
+        """Adım değerlerini metriklere ekler ve güncel epoch ortalamalarını döndürür"""
+        trackers = {metric.name: metric for metric in self.metrics}
+        for name, value in values.items():
+            trackers[name].update_state(value)
+        return {name: trackers[name].result() for name in values}
+
+    def compile(self, d_optimizer, g_optimizer, fused: bool = True, jit_compile: bool = False,
+                accumulation_steps: int = 1):
+        """
+        Args:
+            d_optimizer: Discriminator optimizer'ı (LossScaleOptimizer olabilir)
+            g_optimizer: Generator optimizer'ı (LossScaleOptimizer olabilir)
+            fused: True ise generator ileri geçişi D ve G güncellemelerinde
+                   paylaşılır; False ise notebook'taki adım birebir çalışır
+            jit_compile: True ise eğitim adımı XLA ile derlenir
+            accumulation_steps: Efektif batch'in bölündüğü micro-batch sayısı;
+                                batch boyutu bu değere tam bölünmeli
+        """
+        if accumulation_steps < 1:
+            raise ValueError(f"accumulation_steps en az 1 olmalı: {accumulation_steps}")
+        super(WGAN_GP_Pix2Pix, self).compile(jit_compile=jit_compile)
+        # Optimizer durumları burada (strateji scope'unda) oluşturulur; ilk
+        # adımda replika bağlamında tembel oluşturma MirroredStrategy'de çalışmaz
+        d_optimizer.build(self.discriminator.trainable_variables)
+        g_optimizer.build(self.generator.trainable_variables)
+        self.d_optimizer = d_optimizer
+        self.g_optimizer = g_optimizer
+        self.fused = fused
+        self.accumulation_steps = accumulation_steps
+        self.d_loss_fn = self.wasserstein_loss
+        self.g_loss_fn = self.wasserstein_loss
+        # Keras Loss nesneleri dağıtık bağlamda kendiliğinden replika sayısına
+        # böldüğü için L1 ortalaması doğrudan alınır (ölçekleme _gradient_loss'ta)
+        self.l1_loss_fn = mean_absolute_error
+
+    def wasserstein_loss(self, y_true, y_pred):
+        return tf.reduce_mean(y_true * y_pred)
+
+    def _generate(self, input_image, training=True):
+        """Generator çıktısı (mixed precision'da float32'ye çevrilir)"""
+        return tf.cast(self.generator(input_image, training=training), tf.float32)
+
+    def _critic(self, input_image, image):
+        """Discriminator skoru (mixed precision'da float32'ye çevrilir)"""
+        return tf.cast(self.discriminator([input_image, image], training=True), tf.float32)
+
+    def gradient_penalty(self, batch_size, real_images, fake_images, input_images):
+        """ GP Hesaplama: Real ve Fake arası interpolasyon (D geçişi dahil float32) """
+        real_images = tf.cast(real_images, tf.float32)
+        fake_images = tf.cast(fake_images, tf.float32)
+        input_images = tf.cast(input_images, tf.float32)
+        alpha = tf.random.normal([batch_size, 1, 1, 1], 0.0, 1.0)
+        diff = fake_images - real_images
+        interpolated = real_images + alpha * diff
+
+        with tf.GradientTape() as gp_tape:
+            gp_tape.watch(interpolated)
+            # Discriminator'a hem input(LD) hem interpolasyon verilir
+            with float32_layers(self.discriminator):
+                pred = self.gp_discriminator([input_images, interpolated], training=True)
+
+        grads = gp_tape.gradient(pred, [interpolated])[0]
+        norm = tf.sqrt(tf.reduce_sum(tf.square(grads), axis=[1, 2, 3]))
+        gp = tf.reduce_mean((norm - 1.0) ** 2)
+        return gp
+
+    def _gradient_loss(self, optimizer, loss, loss_weight=1.0):
+        """
+        Gradyanı alınacak kayıp.
+
+        Optimizer gradyanları replikalar arasında topladığı için kayıp replika
+        sayısına bölünür; gerekirse loss scaling uygulanır.
+        """
+        replicas = tf.distribute.get_strategy().num_replicas_in_sync
+        return _scale_loss(optimizer, loss * (loss_weight / replicas))
+
+    def call(self, inputs, training=False):
+        if isinstance(inputs, (list, tuple)):
+            inputs = inputs[0]
+        return self.generator(inputs, training=training)
+
+    def discriminator_gradients(self, input_image, target_image, fake_image, loss_weight=1.0):
+        """
+        Discriminator kaybını ve (loss scaling uygulanmış) gradyanlarını hesaplar.
+
+        Args:
+            loss_weight: Kayba uygulanan çarpan (gradient accumulation'da 1/adım)
+
+        Returns:
+            tuple: (d_loss, gradyanlar)
+        """
+        batch_size = tf.shape(input_image)[0]
+        with tf.GradientTape() as tape:
+            fake_pred = self._critic(input_image, fake_image)
+            real_pred = self._critic(input_image, target_image)
+
+            # Wasserstein Loss: D(fake) - D(real)
+            d_cost = tf.reduce_mean(fake_pred) - tf.reduce_mean(real_pred)
+
+            # Gradient Penalty
+            gp = self.gradient_penalty(batch_size, target_image, fake_image, input_image)
+
+            # Toplam D Loss
+            d_loss = d_cost + (gp * self.lambda_gp)
+            scaled_loss = self._gradient_loss(self.d_optimizer, d_loss, loss_weight)
+
+        return d_loss, tape.gradient(scaled_loss, self.discriminator.trainable_variables)
+
+    def critic_gradients(self, input_image, target_image, fake_image):
+        """
+        Gradient penalty'siz Wasserstein kaybını ve gradyanlarını hesaplar.
+
+        discriminator_gradients'ın ilk yarısıdır; aşamalı adımda (PhasedTrainStep)
+        GP'den ayrı zamanlanır. İki kısmın gradyanları toplamı aynı sonucu verir.
+
+        Returns:
+            tuple: (d_cost, gradyanlar)
+        """
+        with tf.GradientTape() as tape:
+            fake_pred = self._critic(input_image, fake_image)
+            real_pred = self._critic(input_image, target_image)
+            d_cost = tf.reduce_mean(fake_pred) - tf.reduce_mean(real_pred)
+            scaled_loss = self._gradient_loss(self.d_optimizer, d_cost)
+
+        return d_cost, tape.gradient(scaled_loss, self.discriminator.trainable_variables)
+
+    def penalty_gradients(self, input_image, target_image, fake_image):
+        """
+        Gradient penalty'yi ve lambda_gp ile ağırlıklı gradyanlarını hesaplar.
+
+        Returns:
+            tuple: (gp, gradyanlar)
+        """
+        batch_size = tf.shape(input_image)[0]
+        with tf.GradientTape() as tape:
+            gp = self.gradient_penalty(batch_size, target_image, fake_image, input_image)
+            scaled_loss = self._gradient_loss(self.d_optimizer, gp * self.lambda_gp)
+
+        # GP girdi gradyanına bağlı olduğundan son katmanın bias'ı gibi
+        # değişkenlere bağlı değildir; bunların gradyanı None yerine sıfırdır
+        variables = self.discriminator.trainable_variables
+        grads = tape.gradient(scaled_loss, variables)
+        return gp, [tf.zeros(v.shape, v.dtype) if g is None else g for g, v in zip(grads, variables)]
+
+    def discriminator_step(self, input_image, target_image, fake_image):
+        """
+        Verilen sahte görüntüyle bir discriminator güncellemesi yapar.
+
+        Returns:
+            d_loss: Wasserstein kaybı + lambda_gp * GP
+        """
+        d_loss, d_grad = self.discriminator_gradients(input_image, target_image, fake_image)
+        _apply_scaled_gradients(self.d_optimizer, d_grad, self.discriminator.trainable_variables)
+        return d_loss
+
+    def generator_loss(self, input_image, target_image, fake_image):
+        """
+        Güncel discriminator ile generator kaybını hesaplar.
+
+        Returns:
+            tuple: (g_loss, g_l1_loss)
+        """
+        fake_pred = self._critic(input_image, fake_image)
+
+        # G Loss (Wasserstein Kısmı)
+        g_wgan_loss = -tf.reduce_mean(fake_pred)
+
+        # G Loss (L1 Kısmı): Orijinal Pix2Pix yapısı (Görüntü benzerliği)
+        g_l1_loss = self.l1_loss_fn(target_image, fake_image) * self.lambda_l1
+
+        return g_wgan_loss + g_l1_loss, g_l1_loss
+
+    def generator_gradients(self, input_image, target_image, loss_weight=1.0):
+        """
+        Generator ileri geçişiyle birlikte G kaybını ve gradyanlarını hesaplar.
+
+        Args:
+            loss_weight: Kayba uygulanan çarpan (gradient accumulation'da 1/adım)
+
+        Returns:
+            tuple: (g_loss, g_l1_loss, gradyanlar)
+        """
+        with tf.GradientTape() as tape:
+            fake_image = self._generate(input_image)
+            g_loss, g_l1_loss = self.generator_loss(input_image, target_image, fake_image)
+            scaled_loss = self._gradient_loss(self.g_optimizer, g_loss, loss_weight)
+
+        return g_loss, g_l1_loss, tape.gradient(scaled_loss, self.generator.trainable_variables)
+
+    def train_step(self, data):
+        # Data Loader'dan gelen veri: (input_image, target_image)
+        input_image, target_image = data
+        if self.accumulation_steps > 1:
+            return self._track(self._accumulated_train_step(input_image, target_image))
+        if self.fused:
+            return self._track(self._fused_train_step(input_image, target_image))
+
+        # --- DISCRIMINATOR EĞİTİMİ ---
+        fake_image = self._generate(input_image)
+        d_loss = self.discriminator_step(input_image, target_image, fake_image)
+
+        # --- GENERATOR EĞİTİMİ ---
+        g_loss, g_l1_loss, g_grad = self.generator_gradients(input_image, target_image)
+        _apply_scaled_gradients(self.g_optimizer, g_grad, self.generator.trainable_variables)
+
+        return self._track({"d_loss": d_loss, "g_loss": g_loss, "g_l1": g_l1_loss})
+
+    def _fused_train_step(self, input_image, target_image):
+        """Generator ileri geçişini D ve G güncellemelerinde paylaşan adım"""
+        with tf.GradientTape() as g_tape:
+            fake_image = self._generate(input_image)
+
+            # D güncellemesi G'nin tape'ine kaydedilmez
+            with g_tape.stop_recording():
+                d_loss = self.discriminator_step(input_image, target_image,
+                                                 tf.stop_gradient(fake_image))
+
+            g_loss, g_l1_loss = self.generator_loss(input_image, target_image, fake_image)
+            scaled_loss = self._gradient_loss(self.g_optimizer, g_loss)
+
+        g_grad = g_tape.gradient(scaled_loss, self.generator.trainable_variables)
+        _apply_scaled_gradients(self.g_optimizer, g_grad, self.generator.trainable_variables)
+
+        return {"d_loss": d_loss, "g_loss": g_loss, "g_l1": g_l1_loss}
+
+    def _accumulated_train_step(self, input_image, target_image):
+        """
+        Efektif batch'i micro-batch'lere bölerek iki aşamada günceller.
+
+        Micro-batch döngüleri parallel_iterations=1 ile sıralı çalışır; böylece
+        aynı anda tek micro-batch'in aktivasyonları tutulur. G ileri geçişi
+        aşamalar arasında paylaşılamaz (aktivasyonların saklanması gerekirdi);
+        her micro-batch için generator iki kez çalışır.
+        """
+        steps = self.accumulation_steps
+        micro = tf.shape(input_image)[0] // steps
+        weight = 1.0 / steps
+
+        def micro_batch(i):
+            return (input_image[i * micro:(i + 1) * micro],
+                    target_image[i * micro:(i + 1) * micro])
+
+        def accumulate(grad_fn, variables, num_losses):
+            """grad_fn(i) -> (kayıplar, gradyanlar) çıktılarını adımlar boyunca toplar"""
+            def body(i, acc, losses):
+                step_losses, grads = grad_fn(i)
+                return (i + 1,
+                        [a + g for a, g in zip(acc, grads)],
+                        [l + sl * weight for l, sl in zip(losses, step_losses)])
+
+            _, acc, losses = tf.while_loop(
+                lambda i, acc, losses: i < steps, body,
+                (tf.constant(0), [tf.zeros_like(v) for v in variables],
+                 [tf.constant(0.0)] * num_losses),
+                parallel_iterations=1)
+            return acc, losses
+
+        # --- DISCRIMINATOR: tüm micro-batch'lerin gradyanları toplanır ---
+        def d_grads(i):
+            inp, tar = micro_batch(i)
+            d_loss, grads = self.discriminator_gradients(inp, tar, self._generate(inp), weight)
+            return [d_loss], grads
+
+        d_vars = self.discriminator.trainable_variables
+        d_acc, (d_loss,) = accumulate(d_grads, d_vars, 1)
+        _apply_scaled_gradients(self.d_optimizer, d_acc, d_vars)
+
+        # --- GENERATOR: güncellenmiş D ile ---
+        g_vars = self.generator.trainable_variables
+
+        def g_grads(i):
+            inp, tar = micro_batch(i)
+            g_loss, g_l1_loss, grads = self.generator_gradients(inp, tar, weight)
+            return [g_loss, g_l1_loss], grads
+
+        g_acc, (g_loss, g_l1_loss) = accumulate(g_grads, g_vars, 2)
+        _apply_scaled_gradients(self.g_optimizer, g_acc, g_vars)
+
+        return {"d_loss": d_loss, "g_loss": g_loss, "g_l1": g_l1_loss}
+
+    def test_step(self, data):
+        """Doğrulama: L1 ve PSNR (notebook'lardaki gibi max_val=2.0)"""
+        input_image, target_image = data
+        fake_image = self._generate(input_image, training=False)
+        g_l1_loss = self.l1_loss_fn(target_image, fake_image) * self.lambda_l1
+        psnr = tf.reduce_mean(tf.image.psnr(target_image, fake_image, max_val=2.0))
+        return self._track({"g_l1": g_l1_loss, "psnr": psnr})
+
+
+def build_training_model(fused: bool = True, jit_compile: bool = False,
+                         precision: str = 'float32', accumulation_steps: int = 1,
+                         strategy=None) -> WGAN_GP_Pix2Pix:
+    """
+    Notebook ayarlarıyla derlenmiş eğitim modelini oluşturur.
+
+    Args:
+        fused: Generator ileri geçişini D ve G güncellemelerinde paylaş
+        jit_compile: Eğitim adımını XLA ile derle
+        precision: PRECISION_POLICIES'ten biri; politika yalnızca modeller
+                   oluşturulurken geçerlidir (global politika geri yüklenir)
+        accumulation_steps: Efektif batch başına micro-batch sayısı
+        strategy: Modellerin oluşturulacağı dağıtım stratejisi (make_strategy);
+                  None ise varsayılan tek cihaz stratejisi
+    """
+    if tf is None:
+        raise ImportError("TensorFlow yüklü değil. 'pip install tensorflow' komutunu çalıştırın.")
+    if precision not in PRECISION_POLICIES:
+        raise ValueError(f"Bilinmeyen hassasiyet politikası: {precision}")
+
+    strategy = strategy or tf.distribute.get_strategy()
+    with strategy.scope():
+        previous_policy = keras.mixed_precision.global_policy()
+        keras.mixed_precision.set_global_policy(precision)
+        try:
+            gan = WGAN_GP_Pix2Pix(generator=build_generator(), discriminator=build_discriminator())
+        finally:
+            keras.mixed_precision.set_global_policy(previous_policy)
+
+        d_optimizer, g_optimizer = make_optimizers(loss_scaling=(precision == 'mixed_float16'))
+        gan.compile(d_optimizer=d_optimizer, g_optimizer=g_optimizer, fused=fused,
+                    jit_compile=jit_compile, accumulation_steps=accumulation_steps)
+    return gan
+
+
+class PhasedTrainStep:
+    """
+    Eğitim adımını ayrı çalıştırılan ve zamanlanan aşamalara böler (profiling).
+
+    Aşamalar sırayla: 'generate' (D için sahte görüntü), 'd_update' (Wasserstein
+    gradyanları ve D güncellemesi), 'gradient_penalty' (GP'nin kendi iç tape'i
+    ve gradyanları) ve 'g_update' (G ileri/geri geçişi ve güncellemesi). Her
+    aşama ayrı bir tf.function'dır ve sonucu beklenir; böylece duvar saati
+    süresi o aşamaya aittir (GPU'da çekirdekler asenkron çalıştığı için
+    gereklidir). D güncellemesi iki kısmın gradyan toplamıyla yapılır, yani
+    matematiksel olarak normal adımla aynıdır.
+
+    Aşamalar arası füzyon yapılamadığından adım notebook'taki (unfused) adıma
+    karşılık gelir: generator iki kez çalışır ve aşama senkronizasyonu ek yük
+    getirir. Toplam adım süresi fused adımdan uzundur; amaç oranları görmektir.
+    """
+
+    def __init__(self, gan, strategy=None):
+        """
+        Args:
+            gan: build_training_model'den gelen model (accumulation_steps=1)
+            strategy: Modelin oluşturulduğu dağıtım stratejisi
+        """
+        if gan.accumulation_steps > 1:
+            raise ValueError("Aşamalı adım gradient accumulation ile kullanılamaz")
+        self.gan = gan
+        self.strategy = strategy or tf.distribute.get_strategy()
+        strategy = self.strategy
+        d_vars = gan.discriminator.trainable_variables
+        g_vars = gan.generator.trainable_variables
+
+        def apply_discriminator(d_cost, gp, d_grads, gp_grads):
+            grads = [a + b for a, b in zip(d_grads, gp_grads)]
+            _apply_scaled_gradients(gan.d_optimizer, grads, d_vars)
+            return d_cost + gp * gan.lambda_gp
+
+        def update_generator(input_image, target_image, d_loss):
+            g_loss, g_l1_loss, grads = gan.generator_gradients(input_image, target_image)
+            _apply_scaled_gradients(gan.g_optimizer, grads, g_vars)
+            return gan._track({"d_loss": d_loss, "g_loss": g_loss, "g_l1": g_l1_loss})
+
+        generate_fn = self._replica_fn(gan._generate)
+        critic_fn = self._replica_fn(gan.critic_gradients)
+        penalty_fn = self._replica_fn(gan.penalty_gradients)
+        apply_d_fn = self._replica_fn(apply_discriminator)
+        update_g_fn = self._replica_fn(update_generator)
+
+        # Her aşama ayrı bir tf.function (tek bir sarmalayıcı aşama başına
+        # yeniden trace ediliyormuş gibi uyarı verirdi)
+        @tf.function
+        def generate(input_image):
+            return strategy.run(generate_fn, args=(input_image,))
+
+        @tf.function
+        def critic_gradients(input_image, target_image, fake_image):
+            return strategy.run(critic_fn, args=(input_image, target_image, fake_image))
+
+        @tf.function
+        def penalty_gradients(input_image, target_image, fake_image):
+            return strategy.run(penalty_fn, args=(input_image, target_image, fake_image))
+
+        @tf.function
+        def apply_d(d_cost, gp, d_grads, gp_grads):
+            return strategy.run(apply_d_fn, args=(d_cost, gp, d_grads, gp_grads))
+
+        @tf.function
+        def update_g(input_image, target_image, d_loss):
+            return strategy.run(update_g_fn, args=(input_image, target_image, d_loss))
+
+        self._generate = generate
+        self._critic_gradients = critic_gradients
+        self._penalty_gradients = penalty_gradients
+        self._apply_discriminator = apply_d
+        self._update_generator = update_g
+
+    def _replica_fn(self, fn):
+        """Replika başına çalışan fonksiyon (jit_compile ise XLA ile derlenir)"""
+        return tf.function(fn, jit_compile=True) if self.gan.jit_compile else fn
+
+    def _wait(self, value):
+        """Aşama çıktısı hesaplanana kadar bekler"""
+        for tensor in self.strategy.experimental_local_results(tf.nest.flatten(value)[0]):
+            tf.reshape(tensor, [-1])[:1].numpy()
+        return value
+
+    def __call__(self, batch, profiler) -> dict:
+        """
+        Bir eğitim adımı; aşama süreleri profiler.phase ile kaydedilir.
+
+        Returns:
+            dict: Replikalar arası ortalanmış loglar (train_step ile aynı)
+        """
+        input_image, target_image = batch
+        with profiler.phase('generate'):
+            fake_image = self._wait(self._generate(input_image))
+        with profiler.phase('d_update'):
+            d_cost, d_grads = self._wait(self._critic_gradients(input_image, target_image, fake_image))
+        with profiler.phase('gradient_penalty'):
+            gp, gp_grads = self._wait(self._penalty_gradients(input_image, target_image, fake_image))
+        with profiler.phase('d_update'):
+            d_loss = self._wait(self._apply_discriminator(d_cost, gp, d_grads, gp_grads))
+        with profiler.phase('g_update'):
+            logs = self._wait(self._update_generator(input_image, target_image, d_loss))
+        return {name: self.strategy.reduce('MEAN', value, axis=None) for name, value in logs.items()}
+
+
+def fit_distributed(gan, strategy, train_dataset, epochs: int, validation_data=None,
+                    callbacks=None, steps_per_epoch: int = None, initial_epoch: int = 0,
+                    profiler=None) -> dict:
+    """
+    Modeli strateji üzerinde özel bir döngüyle eğitir.
+
+    Keras 3'te fit(), MultiWorkerMirroredStrategy altında ilk batch'i sembolik
+    build için indirgerken hata verdiğinden multi-worker eğitimde fit() yerine
+    kullanılır. Her adım fit()'tekiyle aynı train_step/test_step'tir; loglar
+    replikalar arası ortalanır.
+
+    Args:
+        gan: Aynı strateji ile build_training_model'den gelen model
+        strategy: Dağıtım stratejisi
+        train_dataset: Global batch'lerden oluşan tf.data.Dataset
+        epochs: Epoch sayısı
+        validation_data: Doğrulama tf.data.Dataset'i (isteğe bağlı)
+        callbacks: Keras callback listesi (epoch/batch sonu olayları çağrılır)
+        steps_per_epoch: Epoch başına en fazla adım (None: dataset bitene kadar)
+        initial_epoch: Devam edilen çalışmada başlanacak epoch
+        profiler: profiling.TrainingProfiler; verilirse adımlar PhasedTrainStep
+                  ile aşama aşama çalıştırılır, veri bekleme süresi ölçülür ve
+                  her epoch sonunda özet yazılır
+
+    Returns:
+        dict: Epoch başına log listeleri (History.history biçiminde)
+    """
+    callback_list = keras.callbacks.CallbackList(callbacks, model=gan, epochs=epochs)
+
+    def distributed(step_fn):
+        if gan.jit_compile:
+            step_fn = tf.function(step_fn, jit_compile=True)
+
+        @tf.function
+        def run(batch):
+            logs = strategy.run(step_fn, args=(batch,))
+            return {name: strategy.reduce('MEAN', value, axis=None) for name, value in logs.items()}
+        return run
+
+    train_fn = distributed(gan.train_step)
+    phased_step = PhasedTrainStep(gan, strategy) if profiler is not None else None
+    test_fn = distributed(gan.test_step)
+    train_dist = strategy.experimental_distribute_dataset(train_dataset)
+    val_dist = (strategy.experimental_distribute_dataset(validation_data)
+                if validation_data is not None else None)
+
+    history = {}
+    logs = {}
+    callback_list.on_train_begin()
+    for epoch in range(initial_epoch, epochs):
+        gan.reset_metrics()
+        callback_list.on_epoch_begin(epoch)
+        batches = profiler.timed(train_dist) if profiler is not None else train_dist
+        for step, batch in enumerate(itertools.islice(batches, steps_per_epoch)):
+            callback_list.on_train_batch_begin(step)
+            logs = phased_step(batch, profiler) if phased_step is not None else train_fn(batch)
+            callback_list.on_train_batch_end(step, logs)
+            if profiler is not None:
+                profiler.end_step()
+        logs = {name: float(value) for name, value in logs.items()}
+        if profiler is not None:
+            profiler.end_epoch(epoch + 1)
+
+        if val_dist is not None:
+            gan.reset_metrics()
+            val_logs = {}
+            for batch in val_dist:
+                val_logs = test_fn(batch)
+            logs.update({f"val_{name}": float(value) for name, value in val_logs.items()})
+
+        callback_list.on_epoch_end(epoch, logs)
+        print(f"Epoch {epoch+1}/{epochs} - " + ", ".join(f"{k}: {v:.4f}" for k, v in logs.items()))
+        for name, value in logs.items():
+            history.setdefault(name, []).append(value)
+
+    callback_list.on_train_end(logs)
+    if profiler is not None:
+        profiler.close()
+    return history
+
+
+class GANMonitor(_Callback):
+    """
+    Epoch sonunda önizleme görselleri, checkpoint ve en iyi model kaydı.
+
+    Eğitim thread'inde yalnızca önizleme tahmini ve ağırlık snapshot'ı alınır;
+    PNG çizimi ve dosya yazma arka plandaki BackgroundWriter'da yapılır. Her
+    checkpoint_every epoch'ta (ve son epoch'ta) generator ağırlıkları ile devam
+    durumu, doğrulama PSNR'ı her iyileştiğinde G_best yazılır.
+    Multi-worker eğitimde yalnızca chief worker (chief=True) dosya yazar.
+    """
+
+    def __init__(self, val_dataset, results_dir: str, checkpoint_dir: str, num_img: int = 3,
+                 chief: bool = True, checkpoint_every: int = CHECKPOINT_EVERY,
+                 keep_last: int = DEFAULT_KEEP_LAST):
+        super().__init__()
+        self.val_dataset = val_dataset
+        self.results_dir = results_dir
+        self.checkpoint_dir = checkpoint_dir
+        self.num_img = num_img
+        self.chief = chief
+        self.checkpoint_every = checkpoint_every
+        self.keep_last = keep_last
+        self.writer = None
+        self.manager = None
+        if chief:
+            os.makedirs(results_dir, exist_ok=True)
+
+    def on_train_begin(self, logs=None):
+        if not self.chief:
+            return
+        self.writer = BackgroundWriter()
+        self.manager = CheckpointManager(self.model, self.checkpoint_dir,
+                                         keep_last=self.keep_last, writer=self.writer)
+
+    def on_epoch_end(self, epoch, logs=None):
+        if not self.chief:
+            return
+
+        start = time.perf_counter()
+        print(f"\nEpoch {epoch+1} bitti. Görseller işleniyor...")
+
+        # --- A. GÖRSEL KAYIT (HER EPOCH) ---
+        try:
+            self._submit_previews(epoch)
+        except Exception as e:
+            print(f"Önizleme hatası: {e}")
+
+        # --- B. MODEL KAYIT (PERİYODİK + EN İYİ PSNR) ---
+        logs = logs or {}
+        last_epoch = epoch + 1 == self.params.get('epochs')
+        self.manager.save(epoch + 1, logs.get('val_psnr'),
+                          checkpoint=(epoch + 1) % self.checkpoint_every == 0 or last_epoch)
+        print(f"Kayıtlar arka plana aktarıldı ({(time.perf_counter() - start) * 1000:.0f} ms)")
+
+    def _submit_previews(self, epoch: int):
+        # Rastgele veri çek
+        idx = np.random.randint(0, len(self.val_dataset))
+        inp, tar = self.val_dataset[idx]
+        prediction = np.asarray(self.model.generator(inp, training=False))
+
+        title = ['Input (LD)', 'Generated (AI)', 'Target (HD)']
+        for i in range(min(self.num_img, inp.shape[0])):
+            path = os.path.join(self.results_dir, f"epoch_{epoch+1}_{i}.png")
+            self.writer.submit(render_preview, path, [inp[i], prediction[i], tar[i]], title)
+
+    def on_train_end(self, logs=None):
+        # Bekleyen yazmalar bitmeden süreç kapanmasın
+        if self.manager is not None:
+            self.manager.close()
+            self.manager = None
+
+
+def _positive_int(text: str) -> int:
+    """argparse tipi: 1 veya daha büyük tam sayı"""
+    value = int(text)
+    if value < 1:
+        raise argparse.ArgumentTypeError(f"en az 1 olmalı: {text}")
+    return value
+
+
+def main(argv=None):
+    from dataset import list_paired_files, split_paired_files
+    from tf_dataset import NPYDataset, make_tf_dataset
+
+    parser = argparse.ArgumentParser(description="LDCT Denoising - Pix2Pix + WGAN-GP eğitimi")
+    parser.add_argument("dataset_path", help="trainA/trainB klasörlerini içeren klasör")
+    parser.add_argument("--epochs", type=int, default=EPOCHS)
+    parser.add_argument("--batch-size", type=int, default=BATCH_SIZE,
+                        help="Replika başına batch boyutu")
+    parser.add_argument("--results-dir", default="results", help="Önizleme görsellerinin klasörü")
+    parser.add_argument("--checkpoint-dir", default="model_checkpoints",
+                        help="Generator ağırlıklarının ve devam durumunun kaydedileceği klasör")
+    parser.add_argument("--checkpoint-every", type=int, default=CHECKPOINT_EVERY,
+                        help="Kaç epoch'ta bir checkpoint alınacağı")
+    parser.add_argument("--keep-last", type=_positive_int, default=DEFAULT_KEEP_LAST,
+                        help="Saklanacak son generator checkpoint sayısı")
+    parser.add_argument("--resume", action="store_true",
+                        help="checkpoint klasöründeki son durumdan (ağırlıklar + optimizer) devam et")
+    parser.add_argument("--jit", action="store_true", help="Eğitim adımını XLA ile derle")
+    parser.add_argument("--unfused", action="store_true",
+                        help="Notebook'taki adımı birebir kullan (generator iki kez çalışır)")
+    parser.add_argument("--precision", choices=PRECISION_POLICIES, default='float32',
+                        help="Aktivasyon hassasiyeti (mixed_float16'da loss scaling açılır)")
+    parser.add_argument("--accumulation-steps", type=int, default=1,
+                        help="Efektif batch'in bölüneceği micro-batch sayısı")
+    parser.add_argument("--strategy", choices=STRATEGIES, default='default',
+                        help="Dağıtım stratejisi (multi_worker kümesi TF_CONFIG'den okunur)")
+    parser.add_argument("--cpu-devices", type=int, default=0,
+                        help="CPU'yu bu sayıda mantıksal cihaza böl (tek makinede mirrored deneme)")
+    parser.add_argument("--profile-dir", default=None,
+                        help="Aşama süreleri profilini (epoch başına JSON) bu klasöre yaz")
+    parser.add_argument("--profile-steps", default=None, metavar="BAŞLANGIÇ:BİTİŞ",
+                        help="Bu adım aralığı için TensorBoard profiler izi al (--profile-dir gerekir)")
+    args = parser.parse_args(argv)
+
+    if args.batch_size % args.accumulation_steps:
+        parser.error("--batch-size, --accumulation-steps'e tam bölünmeli")
+    if args.profile_dir is None and args.profile_steps is not None:
+        parser.error("--profile-steps için --profile-dir gerekli")
+    if args.profile_dir is not None and args.accumulation_steps > 1:
+        parser.error("Profiling gradient accumulation ile kullanılamaz")
+    trace_steps = None
+    if args.profile_steps is not None:
+        try:
+            trace_steps = parse_step_range(args.profile_steps)
+        except ValueError as e:
+            parser.error(str(e))
+
+    # Mantıksal cihazlar runtime başlamadan ayarlanmalı
+    strategy = make_strategy(args.strategy, args.cpu_devices)
+    replicas = strategy.num_replicas_in_sync
+    global_batch_size = args.batch_size * replicas
+
+    files_A, files_B = list_paired_files(args.dataset_path)
+    train_A, val_A, train_B, val_B = split_paired_files(files_A, files_B)
+    print(f"Eğitim Seti: {len(train_A)} adet")
+    print(f"Test/Doğrulama Seti: {len(val_A)} adet")
+
+    # Önizlemeler her durumda NPYDataset'ten alınır (indeksle erişim).
+    # Özel döngü (multi-worker, profiling) tf.data pipeline'ı kullanır.
+    custom_loop = args.strategy == 'multi_worker' or args.profile_dir is not None
+    val_dataset = NPYDataset(val_A, val_B, batch_size=global_batch_size, shuffle=False)
+    if custom_loop:
+        train_dataset = make_tf_dataset(train_A, train_B, batch_size=global_batch_size)
+    else:
+        train_dataset = NPYDataset(train_A, train_B, batch_size=global_batch_size, shuffle=True)
+
+    gan = build_training_model(fused=not args.unfused, jit_compile=args.jit,
+                               precision=args.precision,
+                               accumulation_steps=args.accumulation_steps,
+                               strategy=strategy)
+    print(f"Replika: {replicas}, global batch: {global_batch_size} "
+          f"(replika başına {args.accumulation_steps} x {args.batch_size // args.accumulation_steps}), "
+          f"hassasiyet: {args.precision}")
+
+    initial_epoch = 0
+    if args.resume:
+        found = latest_training_state(args.checkpoint_dir)
+        if found is None:
+            print(f"Devam durumu bulunamadı ({args.checkpoint_dir}), baştan başlanıyor")
+        else:
+            initial_epoch = restore_training_state(gan, found[0])
+            print(f"Epoch {initial_epoch} sonundaki durumdan devam ediliyor: {found[0]}")
+
+    callbacks = [GANMonitor(val_dataset, args.results_dir, args.checkpoint_dir,
+                            chief=is_chief(strategy), checkpoint_every=args.checkpoint_every,
+                            keep_last=args.keep_last)]
+
+    profiler = None
+    if args.profile_dir is not None:
+        profile_dir = args.profile_dir
+        if not is_chief(strategy):
+            # Her worker kendi adım sürelerini ayrı klasöre yazar
+            profile_dir = os.path.join(profile_dir, f"worker_{strategy.cluster_resolver.task_id}")
+        profiler = TrainingProfiler(profile_dir, trace_steps=trace_steps,
+                                    batch_size=global_batch_size)
+        print(f"Profiling açık: aşama özetleri {profiler.summary_path}")
+
+    print("Eğitim başlıyor...")
+    if custom_loop:
+        fit_distributed(gan, strategy, train_dataset, args.epochs,
+                        validation_data=make_tf_dataset(val_A, val_B, batch_size=global_batch_size,
+                                                        shuffle=False),
+                        callbacks=callbacks, initial_epoch=initial_epoch, profiler=profiler)
+    else:
+        gan.fit(
+            train_dataset,
+            validation_data=val_dataset,
+            epochs=args.epochs,
+            initial_epoch=initial_epoch,
+            callbacks=callbacks
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,73 @@
+"""
+LDCT Denoising - Veri Yükleyici Benchmark'ı
+Dosya başına .npy (NPYDataset) ile paketlenmiş memmap (PackedDataset)
+yükleyicilerinin epoch süresini ve I/O beklemesini karşılaştırır.
+
+I/O beklemesi, duvar saati süresinden process CPU süresi çıkarılarak tahmin
+edilir. Ölçümün anlamlı olması için veri işletim sistemi önbelleğinde
+olmamalıdır (ör. yeni bağlanmış bir Drive ya da soğuk disk).
+
+Kullanım:
+    python benchmarks/bench_dataset.py <processed_data_npy> <packed_klasör> [--pack]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+# Uygulama dizinini path'e ekle
+app_dir = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "app")
+if app_dir not in sys.path:
+    sys.path.insert(0, app_dir)
+
+from dataset import list_paired_files, pack_dataset, split_paired_files
+from tf_dataset import NPYDataset, PackedDataset
+
+
+def run_epoch(loader) -> dict:
+    """Yükleyicinin bir epoch'unu okur ve süre dağılımını döndürür"""
+    wall_start = time.perf_counter()
+    cpu_start = time.process_time()
+    for i in range(len(loader)):
+        batch_A, batch_B = loader[i]
+        # Verinin gerçekten okunmasını sağla (memmap sayfaları dahil)
+        float(batch_A.sum()) + float(batch_B.sum())
+    loader.on_epoch_end()
+    wall = time.perf_counter() - wall_start
+    cpu = time.process_time() - cpu_start
+    return {'wall': wall, 'cpu': cpu, 'io_wait': max(wall - cpu, 0.0), 'batches': len(loader)}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Veri yükleyici benchmark'ı")
+    parser.add_argument("dataset_path", help="trainA/trainB klasörlerini içeren klasör")
+    parser.add_argument("packed_dir", help="Paketlenmiş veri klasörü")
+    parser.add_argument("--pack", action="store_true", help="Önce paketlenmiş veriyi oluştur")
+    parser.add_argument("--batch-size", type=int, default=4)
+    parser.add_argument("--epochs", type=int, default=2)
+    args = parser.parse_args()
+
+    if args.pack:
+        start = time.perf_counter()
+        pack_dataset(args.dataset_path, args.packed_dir)
+        print(f"Paketleme süresi: {time.perf_counter() - start:.1f} s\n")
+
+    files_A, files_B = list_paired_files(args.dataset_path)
+    train_A, _, train_B, _ = split_paired_files(files_A, files_B)
+
+    loaders = {
+        'npy': NPYDataset(train_A, train_B, batch_size=args.batch_size, shuffle=True),
+        'packed': PackedDataset(args.packed_dir, 'train', batch_size=args.batch_size, shuffle=True),
+    }
+
+    print(f"\n{'yükleyici':>10s} {'epoch':>6s} {'süre':>8s} {'cpu':>8s} {'I/O bekleme':>12s} {'batch/s':>8s}")
+    for name, loader in loaders.items():
+        for epoch in range(args.epochs):
+            r = run_epoch(loader)
+            print(f"{name:>10s} {epoch + 1:6d} {r['wall']:7.2f}s {r['cpu']:7.2f}s "
+                  f"{r['io_wait']:11.2f}s {r['batches'] / r['wall']:8.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,148 @@
+"""
+LDCT Denoising - Dağıtık Eğitim Benchmark'ı
+WGAN-GP eğitim adımını tek makinede dağıtık olarak çalıştırır ve replika
+sayısına göre throughput'u raporlar:
+
+- mirrored: CPU, --replicas'taki her değer için o sayıda mantıksal cihaza
+  bölünür (GPU varsa tüm GPU'lar kullanılır)
+- multi_worker: --workers sayıda process, localhost portlarıyla kurulan
+  TF_CONFIG kümesiyle MultiWorkerMirroredStrategy altında çalışır
+
+Batch boyutu replika başınadır; global batch replika sayısıyla büyür. Her
+yapılandırma ayrı process'te çalışır (mantıksal cihazlar process başına bir
+kez ayarlanabilir). Tek çekirdekli makinede hızlanma beklenmez; amaç dağıtık
+adımın doğruluğunu ve ek yükünü yerelde görmektir.
+
+Kullanım:
+    python benchmarks/bench_distributed_training.py [--replicas 1,2] [--workers 2]
+                                                    [--batch-size 1] [--steps 3]
+"""
+
+import argparse
+import json
+import os
+import socket
+import subprocess
+import sys
+
+# Uygulama dizini (alt process'lerde path'e eklenir)
+app_dir = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "app")
+
+_PROBE = """
+import json, sys, time
+sys.path.insert(0, {app_dir!r})
+import numpy as np
+import tensorflow as tf
+from training import build_training_model, fit_distributed, is_chief, make_strategy
+
+strategy = make_strategy({kind!r}, cpu_devices={cpu_devices})
+global_batch = {batch_size} * strategy.num_replicas_in_sync
+
+rng = np.random.default_rng(0)
+target = rng.uniform(-1, 1, (global_batch, 256, 256, 1)).astype(np.float32)
+noisy = np.clip(target + rng.normal(0, 0.1, target.shape), -1, 1).astype(np.float32)
+dataset = tf.data.Dataset.from_tensors((noisy, target)).repeat()
+options = tf.data.Options()
+options.experimental_distribute.auto_shard_policy = tf.data.experimental.AutoShardPolicy.DATA
+dataset = dataset.with_options(options)
+
+gan = build_training_model(strategy=strategy)
+
+def run(steps):
+    # Keras 3 fit() multi-worker'da çalışmadığı için özel döngü kullanılır
+    if {kind!r} == 'multi_worker':
+        return fit_distributed(gan, strategy, dataset, 1, steps_per_epoch=steps)
+    return gan.fit(dataset, epochs=1, steps_per_epoch=steps, verbose=0).history
+
+run({warmup})
+start = time.perf_counter()
+history = run({steps})
+elapsed = time.perf_counter() - start
+
+if is_chief(strategy):
+    print(json.dumps({{
+        'replicas': strategy.num_replicas_in_sync,
+        'global_batch': global_batch,
+        'steps_per_s': {steps} / elapsed,
+        'images_per_s': {steps} * global_batch / elapsed,
+        'd_loss': float(history['d_loss'][-1]),
+        'g_l1': float(history['g_l1'][-1]),
+    }}))
+"""
+
+
+def _probe_code(kind: str, cpu_devices: int, batch_size: int, steps: int, warmup: int) -> str:
+    return _PROBE.format(app_dir=app_dir, kind=kind, cpu_devices=cpu_devices,
+                         batch_size=batch_size, steps=steps, warmup=warmup)
+
+
+def _parse(stdout: str) -> dict:
+    return json.loads(stdout.strip().splitlines()[-1])
+
+
+def _free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def run_mirrored(replicas: int, batch_size: int, steps: int, warmup: int) -> dict:
+    """replicas mantıksal CPU cihazında MirroredStrategy ile ölçer"""
+    code = _probe_code('mirrored', replicas, batch_size, steps, warmup)
+    env = dict(os.environ, TF_CPP_MIN_LOG_LEVEL="2")
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, env=env)
+    if result.returncode != 0:
+        raise RuntimeError((result.stderr.strip().splitlines() or ["?"])[-1])
+    return _parse(result.stdout)
+
+
+def run_multi_worker(workers: int, batch_size: int, steps: int, warmup: int) -> dict:
+    """workers process'lik yerel kümede MultiWorkerMirroredStrategy ile ölçer"""
+    cluster = {'worker': [f"127.0.0.1:{_free_port()}" for _ in range(workers)]}
+    code = _probe_code('multi_worker', 0, batch_size, steps, warmup)
+
+    processes = []
+    for index in range(workers):
+        tf_config = {'cluster': cluster, 'task': {'type': 'worker', 'index': index}}
+        env = dict(os.environ, TF_CPP_MIN_LOG_LEVEL="2", TF_CONFIG=json.dumps(tf_config))
+        processes.append(subprocess.Popen([sys.executable, "-c", code], env=env, text=True,
+                                          stdout=subprocess.PIPE, stderr=subprocess.PIPE))
+
+    outputs = [p.communicate() for p in processes]
+    for process, (_, stderr) in zip(processes, outputs):
+        if process.returncode != 0:
+            raise RuntimeError((stderr.strip().splitlines() or ["?"])[-1])
+    # Yalnızca chief (worker 0) sonuç yazar
+    return _parse(outputs[0][0])
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Dağıtık WGAN-GP eğitimi benchmark'ı")
+    parser.add_argument("--replicas", default="1,2",
+                        help="Virgülle ayrılmış mirrored replika (mantıksal CPU) sayıları")
+    parser.add_argument("--workers", type=int, default=2,
+                        help="Multi-worker process sayısı (0: atla)")
+    parser.add_argument("--batch-size", type=int, default=1, help="Replika başına batch boyutu")
+    parser.add_argument("--steps", type=int, default=3, help="Ölçülen adım sayısı")
+    parser.add_argument("--warmup", type=int, default=1, help="Isınma adımı sayısı")
+    args = parser.parse_args()
+
+    runs = [(f"mirrored x{n}", run_mirrored, int(n)) for n in args.replicas.split(",")]
+    if args.workers:
+        runs.append((f"multi_worker x{args.workers}", run_multi_worker, args.workers))
+
+    print(f"Replika başına batch {args.batch_size}, {args.steps} adım")
+    print(f"{'yapılandırma':<18} {'replika':>7} {'global':>6} {'adım/s':>8} "
+          f"{'görüntü/s':>10} {'d_loss':>10} {'g_l1':>8}")
+    for name, run, count in runs:
+        try:
+            r = run(count, args.batch_size, args.steps, args.warmup)
+        except RuntimeError as e:
+            print(f"{name:<18} hata: {e}")
+            continue
+        print(f"{name:<18} {r['replicas']:>7} {r['global_batch']:>6} {r['steps_per_s']:>8.3f} "
+              f"{r['images_per_s']:>10.2f} {r['d_loss']:>10.2f} {r['g_l1']:>8.2f}")
+
+
+if __name__ == "__main__":
+    main()
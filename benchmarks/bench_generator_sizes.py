@@ -0,0 +1,87 @@
+"""
+LDCT Denoising - Generator Girdi Boyutu Benchmark'ı
+Tamamen konvolüsyonel generator'ın 256², 512² ve 1024² girdilerde CPU
+gecikmesini ve tepe bellek kullanımını ölçer.
+
+Her boyut ayrı bir process'te çalıştırılır; böylece tepe bellek (max RSS)
+önceki ölçümlerden etkilenmez.
+
+Kullanım:
+    python benchmarks/bench_generator_sizes.py [--weights G_epoch_50.h5] [--sizes 256,512,1024]
+"""
+
+import argparse
+import json
+import os
+import resource
+import subprocess
+import sys
+import time
+
+# Uygulama dizinini path'e ekle
+app_dir = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "app")
+if app_dir not in sys.path:
+    sys.path.insert(0, app_dir)
+
+
+def measure(size: int, weights: str, runs: int) -> dict:
+    """Tek bir girdi boyutu için gecikme ve bellek ölçer (alt process'te çalışır)"""
+    import numpy as np
+    from model import LDCTModel, build_generator
+
+    baseline_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    model = LDCTModel(input_size=(size, size))
+    if weights:
+        model.load_weights(weights, warmup=False)
+    else:
+        # Ağırlık verilmezse rastgele başlatılmış generator
+        model.generator = build_generator(height=size, width=size)
+        model._build_inference_fn(warmup=False)
+        model.is_loaded = True
+
+    sample = np.random.uniform(-1, 1, (1, size, size, 1)).astype(np.float32)
+    model.predict(sample)  # Tracing
+
+    timings = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        model.predict(sample)
+        timings.append((time.perf_counter() - start) * 1000)
+
+    # Linux'ta ru_maxrss KB cinsindendir
+    peak_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return {
+        'size': size,
+        'latency_ms': float(np.median(timings)),
+        'ms_per_megapixel': float(np.median(timings)) / (size * size / 1e6),
+        'peak_rss_mb': peak_rss / 1024,
+        'inference_rss_mb': (peak_rss - baseline_rss) / 1024,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Generator girdi boyutu benchmark'ı")
+    parser.add_argument("--weights", default=None, help="Generator ağırlık dosyası (opsiyonel)")
+    parser.add_argument("--sizes", default="256,512,1024", help="Virgülle ayrılmış kenar boyutları")
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--child", type=int, default=None, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child is not None:
+        print(json.dumps(measure(args.child, args.weights, args.runs)))
+        return
+
+    print(f"{'boyut':>10s} {'gecikme':>10s} {'ms/MP':>8s} {'tepe RSS':>10s} {'model+inference':>17s}")
+    for size in [int(s) for s in args.sizes.split(",")]:
+        cmd = [sys.executable, os.path.abspath(__file__), "--child", str(size),
+               "--runs", str(args.runs)]
+        if args.weights:
+            cmd += ["--weights", args.weights]
+        output = subprocess.run(cmd, capture_output=True, text=True, check=True).stdout
+        r = json.loads(output.strip().splitlines()[-1])
+        print(f"{size:>5d}x{size:<4d} {r['latency_ms']:8.1f}ms {r['ms_per_megapixel']:8.1f} "
+              f"{r['peak_rss_mb']:8.0f}MB {r['inference_rss_mb']:15.0f}MB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+"""
+LDCT Denoising - Girdi Pipeline'ı Benchmark'ı
+tf.data yükleyicisinin (make_tf_dataset) adım/s değerini NPYDataset
+(keras.utils.Sequence) ile karşılaştırır.
+
+--step-ms ile her adımda eğitim hesaplamasını taklit eden bir bekleme
+eklenebilir; prefetch'in I/O'yu hesaplamayla ne kadar örttüğü böylece görülür.
+
+Kullanım:
+    python benchmarks/bench_input_pipeline.py <processed_data_npy> [--step-ms 50]
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+# Uygulama dizinini path'e ekle
+app_dir = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "app")
+if app_dir not in sys.path:
+    sys.path.insert(0, app_dir)
+
+from dataset import list_paired_files, split_paired_files
+from tf_dataset import NPYDataset, make_tf_dataset
+
+
+def consume(batches, step_seconds: float) -> tuple:
+    """Batch'leri tüketir; (adım sayısı, süre) döndürür"""
+    steps = 0
+    start = time.perf_counter()
+    for batch_A, batch_B in batches:
+        if step_seconds:
+            time.sleep(step_seconds)
+        steps += 1
+    return steps, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Girdi pipeline'ı benchmark'ı")
+    parser.add_argument("dataset_path", help="trainA/trainB klasörlerini içeren klasör")
+    parser.add_argument("--batch-size", type=int, default=4)
+    parser.add_argument("--epochs", type=int, default=2)
+    parser.add_argument("--step-ms", type=float, default=0.0,
+                        help="Adım başına taklit edilen eğitim süresi (ms)")
+    args = parser.parse_args()
+
+    files_A, files_B = list_paired_files(args.dataset_path)
+    train_A, _, train_B, _ = split_paired_files(files_A, files_B)
+    step_seconds = args.step_ms / 1000
+
+    sequence = NPYDataset(train_A, train_B, batch_size=args.batch_size, shuffle=True)
+
+    def sequence_epoch():
+        for i in range(len(sequence)):
+            yield sequence[i]
+        sequence.on_epoch_end()
+
+    with tempfile.TemporaryDirectory() as cache_dir:
+        loaders = {
+            'sequence': lambda: sequence_epoch(),
+            'tf.data': make_tf_dataset(train_A, train_B, batch_size=args.batch_size),
+            'tf.data+mem': make_tf_dataset(train_A, train_B, batch_size=args.batch_size,
+                                           cache='memory'),
+            'tf.data+disk': make_tf_dataset(train_A, train_B, batch_size=args.batch_size,
+                                            cache=os.path.join(cache_dir, 'train_cache')),
+        }
+
+        print(f"\n{'yükleyici':>13s} {'epoch':>6s} {'adım':>6s} {'süre':>8s} {'adım/s':>8s}")
+        for name, loader in loaders.items():
+            for epoch in range(args.epochs):
+                batches = loader() if callable(loader) else loader
+                steps, seconds = consume(batches, step_seconds)
+                print(f"{name:>13s} {epoch + 1:6d} {steps:6d} {seconds:7.2f}s {steps / seconds:8.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+"""
+LDCT Denoising - Paralel Ön İşleme Benchmark'ı
+Worker sayısına göre kesit/s ölçer.
+
+Kullanım:
+    python benchmarks/bench_parallel_preprocessing.py <dicom_klasörü> [--workers 1,2,4,8]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+# Uygulama dizinini path'e ekle
+app_dir = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "app")
+if app_dir not in sys.path:
+    sys.path.insert(0, app_dir)
+
+from parallel_preprocessing import preprocess_parallel
+from preprocessing import find_dicom_files, preprocess_dicom
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Paralel DICOM ön işleme benchmark'ı")
+    parser.add_argument("input_dir", help="DICOM dosyalarını içeren klasör")
+    parser.add_argument("--workers", default=None,
+                        help="Virgülle ayrılmış worker sayıları (varsayılan: 1,2,4,...,çekirdek)")
+    parser.add_argument("--limit", type=int, default=None, help="En fazla işlenecek dosya")
+    args = parser.parse_args()
+
+    files = find_dicom_files(args.input_dir)[:args.limit]
+    if not files:
+        parser.error(f"DICOM dosyası bulunamadı: {args.input_dir}")
+
+    if args.workers:
+        worker_counts = [int(w) for w in args.workers.split(",")]
+    else:
+        worker_counts = []
+        w = 1
+        while w < os.cpu_count():
+            worker_counts.append(w)
+            w *= 2
+        worker_counts.append(os.cpu_count())
+
+    print(f"{len(files)} dosya, {os.cpu_count()} çekirdek\n")
+
+    # Referans: tek process, preprocess_dicom döngüsü
+    start = time.perf_counter()
+    for f in files:
+        preprocess_dicom(f)
+    serial_rate = len(files) / (time.perf_counter() - start)
+    print(f"{'seri':>8s} {serial_rate:8.1f} kesit/s")
+
+    print(f"\n{'worker':>8s} {'kesit/s':>8s} {'hızlanma':>9s} {'verim':>7s}")
+    for workers in worker_counts:
+        start = time.perf_counter()
+        _, failures = preprocess_parallel(files, num_workers=workers)
+        rate = len(files) / (time.perf_counter() - start)
+        speedup = rate / serial_rate
+        print(f"{workers:8d} {rate:8.1f} {speedup:8.2f}x {speedup / workers:6.0%}"
+              + (f"  ({len(failures)} hata)" if failures else ""))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,131 @@
+"""
+LDCT Denoising - Inference Servisi Yük Testi
+Çalışan bir app/server.py örneğine eşzamanlı istekler gönderir ve p50/p99
+gecikme, throughput ile sunucu tarafı kuyruk/batch/hesaplama sürelerini
+raporlar.
+
+İstek gövdesi olarak verilen klasördeki DICOM dosyaları ya da (verilmezse)
+rastgele normalize edilmiş 256x256 .npy kesitleri kullanılır.
+
+Kullanım:
+    python app/server.py --weights G_epoch_50.h5 &
+    python benchmarks/bench_server.py [--url http://127.0.0.1:8765] [--dicom-dir DIR]
+                                      [--requests 200] [--concurrency 1,4,16]
+"""
+
+import argparse
+import io
+import os
+import sys
+import threading
+import time
+import urllib.request
+
+import numpy as np
+
+# Uygulama dizinini path'e ekle
+app_dir = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "app")
+if app_dir not in sys.path:
+    sys.path.insert(0, app_dir)
+
+from preprocessing import find_dicom_files
+
+
+def load_payloads(dicom_dir: str, count: int) -> list:
+    """(gövde, içerik türü) listesi hazırlar"""
+    if dicom_dir:
+        files = find_dicom_files(dicom_dir)[:count]
+        if not files:
+            raise SystemExit(f"DICOM dosyası bulunamadı: {dicom_dir}")
+        payloads = []
+        for path in files:
+            with open(path, 'rb') as f:
+                payloads.append((f.read(), "application/dicom"))
+        return payloads
+
+    rng = np.random.default_rng(0)
+    payloads = []
+    for _ in range(min(count, 16)):
+        buffer = io.BytesIO()
+        np.save(buffer, rng.uniform(-1, 1, (256, 256)).astype(np.float32))
+        payloads.append((buffer.getvalue(), "application/x-npy"))
+    return payloads
+
+
+def send(url: str, body: bytes, content_type: str) -> dict:
+    """Tek istek gönderir; istemci gecikmesini ve sunucu sürelerini döndürür"""
+    request = urllib.request.Request(url + "/denoise", data=body, method="POST",
+                                     headers={"Content-Type": content_type})
+    start = time.perf_counter()
+    with urllib.request.urlopen(request) as response:
+        response.read()
+        headers = response.headers
+    return {
+        'latency_ms': (time.perf_counter() - start) * 1000,
+        'queue_ms': float(headers['X-Queue-Ms']),
+        'batch_size': int(headers['X-Batch-Size']),
+        'compute_ms': float(headers['X-Compute-Ms']),
+    }
+
+
+def run_load(url: str, payloads: list, total: int, concurrency: int) -> dict:
+    """total isteği concurrency istemci thread'iyle gönderir"""
+    results = []
+    lock = threading.Lock()
+    counter = iter(range(total))
+
+    def client():
+        while True:
+            with lock:
+                i = next(counter, None)
+            if i is None:
+                return
+            body, content_type = payloads[i % len(payloads)]
+            result = send(url, body, content_type)
+            with lock:
+                results.append(result)
+
+    threads = [threading.Thread(target=client) for _ in range(concurrency)]
+    start = time.perf_counter()
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    wall = time.perf_counter() - start
+
+    latency = np.array([r['latency_ms'] for r in results])
+    return {
+        'concurrency': concurrency,
+        'requests': len(results),
+        'throughput': len(results) / wall,
+        'p50_ms': float(np.percentile(latency, 50)),
+        'p99_ms': float(np.percentile(latency, 99)),
+        'queue_ms': float(np.mean([r['queue_ms'] for r in results])),
+        'compute_ms': float(np.mean([r['compute_ms'] for r in results])),
+        'batch_size': float(np.mean([r['batch_size'] for r in results])),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Inference servisi yük testi")
+    parser.add_argument("--url", default="http://127.0.0.1:8765")
+    parser.add_argument("--dicom-dir", default=None, help="İstek gövdesi olarak kullanılacak DICOM'lar")
+    parser.add_argument("--requests", type=int, default=200, help="Eşzamanlılık başına istek sayısı")
+    parser.add_argument("--concurrency", default="1,4,16",
+                        help="Virgülle ayrılmış eşzamanlı istemci sayıları")
+    args = parser.parse_args()
+
+    payloads = load_payloads(args.dicom_dir, args.requests)
+    send(args.url, *payloads[0])  # Isınma
+
+    print(f"{'istemci':>8} {'istek':>6} {'istek/s':>8} {'p50 ms':>8} {'p99 ms':>8} "
+          f"{'kuyruk ms':>10} {'hesap ms':>9} {'ort. batch':>10}")
+    for concurrency in (int(c) for c in args.concurrency.split(",")):
+        r = run_load(args.url, payloads, args.requests, concurrency)
+        print(f"{r['concurrency']:>8} {r['requests']:>6} {r['throughput']:>8.2f} "
+              f"{r['p50_ms']:>8.1f} {r['p99_ms']:>8.1f} {r['queue_ms']:>10.1f} "
+              f"{r['compute_ms']:>9.1f} {r['batch_size']:>10.2f}")
+
+
+if __name__ == "__main__":
+    main()
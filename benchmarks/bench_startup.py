@@ -0,0 +1,109 @@
+"""
+LDCT Denoising - Başlangıç Süresi Benchmark'ı
+Uygulama modüllerinin import süresini temiz process'lerde ölçer ve
+`python -X importtime` çıktısından sürenin hangi paketlere gittiğini
+raporlar. TensorFlow'un yalnızca model oluşturulurken yüklendiğini
+(import zincirinde bulunmadığını) da doğrular.
+
+Masaüstü uygulamasının pencereyi çizme süresi, uygulama çalıştırıldığında
+main.py tarafından "İlk çizim" satırıyla ayrıca yazdırılır.
+
+Kullanım:
+    python benchmarks/bench_startup.py [--modules main,cli,model] [--runs 5] [--top 10]
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+
+# Uygulama dizini (alt process'lerde path'e eklenir)
+app_dir = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "app")
+
+DEFAULT_MODULES = "main,cli,server,model,preprocessing"
+HEAVY_PACKAGES = ("tensorflow", "keras", "PyQt5", "pydicom", "PIL", "numpy")
+
+_PROBE = """
+import sys, time
+sys.path.insert(0, {app_dir!r})
+start = time.perf_counter()
+import {module}
+elapsed = time.perf_counter() - start
+loaded = [p for p in {heavy!r} if p in sys.modules]
+print(f"{{elapsed * 1000:.1f}}|{{','.join(loaded)}}")
+"""
+
+
+def probe(module: str) -> tuple:
+    """
+    Modülü temiz bir process'te import eder.
+
+    Returns:
+        tuple: (import süresi ms, yüklenen ağır paketler, -X importtime satırları)
+    """
+    code = _PROBE.format(app_dir=app_dir, module=module, heavy=HEAVY_PACKAGES)
+    result = subprocess.run([sys.executable, "-X", "importtime", "-c", code],
+                            capture_output=True, text=True)
+    if result.returncode != 0:
+        last_line = (result.stderr.strip().splitlines() or ["?"])[-1]
+        raise RuntimeError(last_line)
+    elapsed, loaded = result.stdout.strip().splitlines()[-1].split("|")
+    return float(elapsed), [p for p in loaded.split(",") if p], result.stderr.splitlines()
+
+
+def package_breakdown(lines: list, top: int) -> list:
+    """
+    -X importtime çıktısındaki öz (self) süreleri kök paket bazında toplar.
+
+    Öz süreler birbirinden ayrık olduğu için toplam çift sayım içermez.
+
+    Returns:
+        list: (paket, ms) listesi, büyükten küçüğe
+    """
+    totals = {}
+    for line in lines:
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        self_us, _, name = line[len("import time:"):].split("|")
+        package = name.strip().split(".")[0]
+        totals[package] = totals.get(package, 0.0) + int(self_us) / 1000
+    return sorted(totals.items(), key=lambda item: item[1], reverse=True)[:top]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Import/başlangıç süresi benchmark'ı")
+    parser.add_argument("--modules", default=DEFAULT_MODULES,
+                        help="Virgülle ayrılmış app modülleri")
+    parser.add_argument("--runs", type=int, default=5, help="Modül başına ölçüm sayısı")
+    parser.add_argument("--top", type=int, default=8, help="Gösterilecek paket sayısı")
+    args = parser.parse_args()
+
+    for module in args.modules.split(","):
+        try:
+            runs = [probe(module) for _ in range(args.runs)]
+        except RuntimeError as e:
+            print(f"\n{module}: import edilemedi ({e})")
+            continue
+
+        times = sorted(r[0] for r in runs)
+        median_ms = times[len(times) // 2]
+        loaded = runs[-1][1]
+        print(f"\n{module}: {median_ms:.0f} ms (medyan, {args.runs} ölçüm) "
+              f"- yüklenen: {', '.join(loaded) or '-'}")
+        if "tensorflow" in loaded:
+            print("  ⚠️ TensorFlow import zincirinde")
+        for package, ms in package_breakdown(runs[-1][2], args.top):
+            print(f"  {package:<28} {ms:>8.1f} ms")
+
+    # Karşılaştırma için TensorFlow'un kendi import maliyeti
+    print("\nReferans:")
+    for module in ("tensorflow",):
+        try:
+            elapsed, _, _ = probe(module)
+            print(f"  {module:<28} {elapsed:>8.1f} ms (model ilk yüklendiğinde ödenir)")
+        except RuntimeError as e:
+            print(f"  {module}: import edilemedi ({e})")
+
+
+if __name__ == "__main__":
+    main()
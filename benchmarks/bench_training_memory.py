@@ -0,0 +1,106 @@
+"""
+LDCT Denoising - Eğitim Belleği / Throughput Benchmark'ı
+Hassasiyet politikası (float32, mixed_bfloat16, mixed_float16) ve gradient
+accumulation kombinasyonlarında adım başına tepe bellek kullanımını ve
+saniyedeki görüntü sayısını karşılaştırır.
+
+Her yapılandırma ayrı bir process'te çalışır; tepe bellek process'in
+ru_maxrss değeridir (CPU), GPU varsa TensorFlow'un cihaz bellek tepe değeri
+de raporlanır. Efektif batch tüm yapılandırmalarda aynıdır; accumulation
+adımı micro-batch boyutunu küçültür.
+
+Not: CPU'da float16 konvolüsyon çekirdekleri çok yavaştır; bu yüzden
+mixed_float16 varsayılan listede yoktur (GPU'da --configs ile eklenebilir).
+CPU'da bfloat16 destekleyen işlemcilerde mixed_bfloat16 tercih edilmelidir.
+
+Kullanım:
+    python benchmarks/bench_training_memory.py [--batch-size 8] [--steps 3]
+                                               [--configs float32:1,float32:4,mixed_bfloat16:1]
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+
+# Uygulama dizini (alt process'lerde path'e eklenir)
+app_dir = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "app")
+
+DEFAULT_CONFIGS = "float32:1,float32:4,mixed_bfloat16:1,mixed_bfloat16:4"
+
+_PROBE = """
+import json, resource, sys, time
+sys.path.insert(0, {app_dir!r})
+import numpy as np
+import tensorflow as tf
+from training import build_training_model
+
+rng = np.random.default_rng(0)
+target = rng.uniform(-1, 1, ({batch_size}, 256, 256, 1)).astype(np.float32)
+noisy = np.clip(target + rng.normal(0, 0.1, target.shape), -1, 1).astype(np.float32)
+dataset = tf.data.Dataset.from_tensors((noisy, target)).repeat()
+
+gan = build_training_model(precision={precision!r}, accumulation_steps={accumulation_steps})
+gan.fit(dataset, epochs=1, steps_per_epoch={warmup}, verbose=0)
+
+start = time.perf_counter()
+gan.fit(dataset, epochs=1, steps_per_epoch={steps}, verbose=0)
+elapsed = time.perf_counter() - start
+
+gpus = tf.config.list_logical_devices('GPU')
+gpu_peak_mb = tf.config.experimental.get_memory_info(gpus[0].name)['peak'] / 2**20 if gpus else None
+print(json.dumps({{
+    'steps_per_s': {steps} / elapsed,
+    'images_per_s': {steps} * {batch_size} / elapsed,
+    'rss_peak_mb': resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+    'gpu_peak_mb': gpu_peak_mb,
+}}))
+"""
+
+
+def run_config(precision: str, accumulation_steps: int, batch_size: int,
+               steps: int, warmup: int) -> dict:
+    """Tek bir yapılandırmayı temiz bir process'te ölçer"""
+    code = _PROBE.format(app_dir=app_dir, batch_size=batch_size, precision=precision,
+                         accumulation_steps=accumulation_steps, steps=steps, warmup=warmup)
+    env = dict(os.environ, TF_CPP_MIN_LOG_LEVEL="2")
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, env=env)
+    if result.returncode != 0:
+        last_line = (result.stderr.strip().splitlines() or ["?"])[-1]
+        raise RuntimeError(last_line)
+    stats = json.loads(result.stdout.strip().splitlines()[-1])
+    stats.update(precision=precision, accumulation_steps=accumulation_steps)
+    return stats
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Eğitim belleği / throughput benchmark'ı")
+    parser.add_argument("--batch-size", type=int, default=8, help="Efektif batch boyutu")
+    parser.add_argument("--steps", type=int, default=3, help="Ölçülen adım sayısı")
+    parser.add_argument("--warmup", type=int, default=1, help="Isınma adımı sayısı")
+    parser.add_argument("--configs", default=DEFAULT_CONFIGS,
+                        help="Virgülle ayrılmış politika:accumulation çiftleri")
+    args = parser.parse_args()
+
+    print(f"Efektif batch {args.batch_size}, {args.steps} adım")
+    print(f"{'politika':<16} {'accum':>5} {'micro':>5} {'RSS MB':>8} {'GPU MB':>8} "
+          f"{'adım/s':>8} {'görüntü/s':>10}")
+    for config in args.configs.split(","):
+        precision, accumulation_steps = config.split(":")
+        accumulation_steps = int(accumulation_steps)
+        if args.batch_size % accumulation_steps:
+            print(f"{precision:<16} {accumulation_steps:>5}  atlandı (batch tam bölünmüyor)")
+            continue
+        try:
+            r = run_config(precision, accumulation_steps, args.batch_size, args.steps, args.warmup)
+        except RuntimeError as e:
+            print(f"{precision:<16} {accumulation_steps:>5}  hata: {e}")
+            continue
+        gpu = f"{r['gpu_peak_mb']:.0f}" if r['gpu_peak_mb'] is not None else "-"
+        print(f"{precision:<16} {accumulation_steps:>5} {args.batch_size // accumulation_steps:>5} "
+              f"{r['rss_peak_mb']:>8.0f} {gpu:>8} {r['steps_per_s']:>8.3f} {r['images_per_s']:>10.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+"""
+LDCT Denoising - Eğitim Adımı Benchmark'ı
+WGAN-GP eğitim adımının notebook'taki (unfused) ve generator ileri geçişini
+paylaşan (fused) sürümlerini, XLA'lı ve XLA'sız olarak sentetik veriyle
+karşılaştırır ve saniyedeki adım sayısını raporlar.
+
+Ölçüm Keras fit() üzerinden yapılır; ilk epoch (trace/derleme) ısınma olarak
+ayrıca ölçülür.
+
+Kullanım:
+    python benchmarks/bench_training_step.py [--batch-size 1] [--steps 5] [--warmup 2]
+                                             [--configs unfused,fused,fused+jit]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+# Uygulama dizinini path'e ekle
+app_dir = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "app")
+if app_dir not in sys.path:
+    sys.path.insert(0, app_dir)
+
+import numpy as np
+
+
+def synthetic_dataset(batch_size: int, size: int = 256):
+    """Sonsuz tekrarlanan sentetik (low dose, full dose) batch'leri"""
+    import tensorflow as tf
+
+    rng = np.random.default_rng(0)
+    target = rng.uniform(-1, 1, (batch_size, size, size, 1)).astype(np.float32)
+    noisy = np.clip(target + rng.normal(0, 0.1, target.shape), -1, 1).astype(np.float32)
+    return tf.data.Dataset.from_tensors((noisy, target)).repeat()
+
+
+def run_config(name: str, batch_size: int, steps: int, warmup: int) -> dict:
+    """Tek bir yapılandırmayı ölçer"""
+    from training import build_training_model
+
+    fused = name.startswith("fused")
+    jit = name.endswith("+jit")
+    gan = build_training_model(fused=fused, jit_compile=jit)
+    dataset = synthetic_dataset(batch_size)
+
+    start = time.perf_counter()
+    gan.fit(dataset, epochs=1, steps_per_epoch=warmup, verbose=0)
+    warmup_s = time.perf_counter() - start
+
+    start = time.perf_counter()
+    gan.fit(dataset, epochs=1, steps_per_epoch=steps, verbose=0)
+    elapsed = time.perf_counter() - start
+    return {'config': name, 'warmup_s': warmup_s, 'steps_per_s': steps / elapsed,
+            'images_per_s': steps * batch_size / elapsed}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="WGAN-GP eğitim adımı benchmark'ı (CPU)")
+    parser.add_argument("--batch-size", type=int, default=1)
+    parser.add_argument("--steps", type=int, default=5, help="Ölçülen adım sayısı")
+    parser.add_argument("--warmup", type=int, default=2, help="Isınma adımı sayısı")
+    parser.add_argument("--configs", default="unfused,fused,unfused+jit,fused+jit")
+    parser.add_argument("--cpu", action="store_true", help="GPU'ları gizle")
+    args = parser.parse_args()
+
+    if args.cpu:
+        os.environ["CUDA_VISIBLE_DEVICES"] = "-1"
+
+    results = [run_config(name, args.batch_size, args.steps, args.warmup)
+               for name in args.configs.split(",")]
+
+    baseline = results[0]['steps_per_s']
+    print(f"\nBatch boyutu {args.batch_size}, {args.steps} adım")
+    print(f"{'yapılandırma':<14} {'ısınma s':>9} {'adım/s':>8} {'görüntü/s':>10} {'hız':>6}")
+    for r in results:
+        print(f"{r['config']:<14} {r['warmup_s']:>9.1f} {r['steps_per_s']:>8.3f} "
+              f"{r['images_per_s']:>10.2f} {r['steps_per_s'] / baseline:>5.2f}x")
+
+
+if __name__ == "__main__":
+    main()
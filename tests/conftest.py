@@ -0,0 +1,7 @@
+import os
+import sys
+
+# Uygulama modülleri düz (flat) import edilir
+app_dir = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "app")
+if app_dir not in sys.path:
+    sys.path.insert(0, app_dir)
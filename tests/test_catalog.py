@@ -0,0 +1,56 @@
+import os
+
+import pytest
+
+pydicom = pytest.importorskip("pydicom")
+from pydicom.dataset import Dataset, FileMetaDataset
+from pydicom.uid import ExplicitVRLittleEndian, generate_uid
+
+import catalog
+
+
+def write_series(folder, series_uid, positions, patient="P1"):
+    os.makedirs(folder, exist_ok=True)
+    for i, z in enumerate(positions):
+        meta = FileMetaDataset()
+        meta.MediaStorageSOPClassUID = "1.2.840.10008.5.1.4.1.1.2"
+        meta.MediaStorageSOPInstanceUID = generate_uid()
+        meta.TransferSyntaxUID = ExplicitVRLittleEndian
+        ds = Dataset()
+        ds.file_meta = meta
+        ds.PatientID = patient
+        ds.SeriesInstanceUID = series_uid
+        ds.SOPInstanceUID = meta.MediaStorageSOPInstanceUID
+        ds.ImagePositionPatient = [0, 0, z]
+        ds.save_as(os.path.join(folder, f"{i:03d}.dcm"), enforce_file_format=True)
+
+
+@pytest.fixture
+def two_full_dose_series(tmp_path):
+    root = tmp_path / "data"
+    write_series(root / "P1" / "low dose", "1.1", [0.0, 1.0, 2.0])
+    # Aynı hasta için iki full dose seri: 1 mm ve 0.5 mm kesit aralığı
+    write_series(root / "P1" / "full dose 1mm", "2.1", [0.0, 1.0, 2.0])
+    write_series(root / "P1" / "full dose 0.5mm", "2.2", [0.0, 0.5, 1.0, 1.5, 2.0])
+    with catalog.DicomCatalog(str(tmp_path / "catalog.db")) as db:
+        db.scan(str(root))
+        yield db
+
+
+def test_multiple_series_are_not_mixed(two_full_dose_series):
+    db = two_full_dose_series
+    assert db.series_uids("P1", "full") == ["2.1", "2.2"]
+    with pytest.raises(ValueError):
+        db.series("P1", "full")
+    with pytest.raises(ValueError):
+        db.pair_slices("P1")
+
+    assert [z for z, _ in db.series("P1", "full", "2.2")] == [0.0, 0.5, 1.0, 1.5, 2.0]
+    pairs = db.pair_slices("P1", full_series="2.1")
+    assert [z for z, _, _ in pairs] == [0.0, 1.0, 2.0]
+    assert all("full dose 1mm" in full for _, _, full in pairs)
+
+
+def test_single_series_needs_no_uid(two_full_dose_series):
+    db = two_full_dose_series
+    assert len(db.series("P1", "low")) == 3
@@ -0,0 +1,45 @@
+import numpy as np
+import pytest
+
+import tiling
+
+
+def identity(tiles):
+    return tiles
+
+
+@pytest.mark.parametrize("shape", [(40, 100), (1, 1), (300, 20)])
+def test_slice_smaller_than_tile(shape):
+    rng = np.random.default_rng(0)
+    image = rng.uniform(-1, 1, shape).astype(np.float32)
+    seen = []
+
+    def predict(tiles):
+        seen.append(tiles.shape[1:])
+        return tiles
+
+    output = tiling.denoise_tiled(image, predict, tile_size=256, overlap=64)
+    assert output.shape == shape
+    np.testing.assert_allclose(output, image, atol=1e-6)
+    assert set(seen) == {(256, 256, 1)}
+
+
+def test_non_square_tile():
+    rng = np.random.default_rng(0)
+    image = rng.uniform(-1, 1, (150, 300)).astype(np.float32)
+    seen = []
+
+    def predict(tiles):
+        seen.append(tiles.shape[1:])
+        return tiles * 0.5
+
+    output = tiling.denoise_tiled(image, predict, tile_size=(64, 128), overlap=16, batch_size=4)
+    assert output.shape == image.shape
+    np.testing.assert_allclose(output, image * 0.5, atol=1e-6)
+    assert set(seen) == {(64, 128, 1)}
+    assert tiling.blend_window((64, 128), 16).shape == (64, 128)
+
+
+def test_overlap_must_fit_smaller_tile_side():
+    with pytest.raises(ValueError):
+        tiling.denoise_tiled(np.zeros((10, 10)), identity, tile_size=(32, 128), overlap=32)